@@ -0,0 +1,32 @@
+# [Purpose] Optional Cython build of the analyzer and BM25 retrieval hot paths
+# [Source] Cython "pure Python mode" - compiles unmodified .py modules
+# [Why] Removes interpreter dispatch from the per-row compliance/summary loops and
+#       the per-posting BM25 scoring loop
+#
+# [Usage]
+#   pip install cython
+#   python setup_cython.py build_ext --inplace
+#
+# [Note] The compiled src/services/{analyzer,rag}.*.so sit next to their .py files and
+#        take import precedence automatically; delete them to fall back to pure Python.
+
+# [Library] Cython.Build.cythonize - .py -> C -> extension module
+from Cython.Build import cythonize
+
+# [Library] setuptools - Extension build driver
+from setuptools import setup
+
+setup(
+    name="kserc-ara-extensions",
+    ext_modules=cythonize(
+        ["src/services/analyzer.py"],
+        language_level=3,
+        # [Why] cdivision is left off: Python ZeroDivisionError semantics are kept
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+    + cythonize(
+        ["src/services/rag.py"],
+        language_level=3,
+        # [Why] Default bounds/wraparound checks: the index uses negative indexing
+    ),
+)
@@ -2,92 +2,630 @@
 # [Source] Best practices for Python application configuration
 # [Why] Centralized configuration makes the application more maintainable and secure
 
+# [Library] logging - Standard logging levels
+# [Why] LOG_LEVEL is resolved to its numeric level once, here
+import logging
+
+# [Library] mmap - Memory-mapped file access
+# [Why] .env is parsed straight from the page cache in a single regex pass
+import mmap
+
 # [Library] os - Operating system interface for environment variables
 # [Why] Used to read environment variables for configuration
 import os
 
-# [Library] dotenv - Load environment variables from .env file
-# [Source] https://github.com/theskumar/python-dotenv
-# [Why] Allows developers to use .env files for local development without hardcoding secrets
-from dotenv import load_dotenv
+# [Library] re - Regular expressions
+# [Why] One compiled pattern extracts every KEY=VALUE line from the .env buffer
+import re
+
+# [Library] dataclasses - Declarative, immutable settings container
+# [Why] frozen + slots gives fixed-offset attribute reads and blocks runtime mutation
+from dataclasses import dataclass, field
+
+# [Library] functools - lru_cache memoizes the settings
+#           factory; cached_property backs lazy groups
+# [Why] get_settings() builds the instance once;
+#       rarely used groups resolve on first access
+from functools import cached_property, lru_cache
+
+# [Library] pathlib - Path utilities
+# [Why] Locate the .env file relative to this module
+from pathlib import Path
+
+# [Library] sys.intern - Stores one canonical copy of a string
+# [Why] Repeated config strings share storage with
+#       equal literals elsewhere in the process
+from sys import intern
+
+# [Library] types.MappingProxyType - Read-only view over a dict
+# [Why] Shared pre-built request headers cannot be mutated by a caller
+from types import MappingProxyType
+
+# [Library] typing - Final constants (PEP 591) and helper type hints
+# [Why] Lets type checkers and readers treat derived settings as immutable
+from typing import TYPE_CHECKING, Any, Dict, Final, Mapping, Optional
+
+# [Optional] httpx / google-cloud-storage - Only needed for derived client objects
+# [Why] Imported lazily so loading config never pulls in the HTTP or GCS stacks
+if TYPE_CHECKING:
+    import httpx
+    from google.cloud import storage
+
+# [Comment] Single module-level reference to the process environment mapping
+# [Why] os.environ is populated at interpreter startup; binding it once turns every
+#       lookup below into one dict .get on a local name (no os.getenv wrapper frame)
+_env = os.environ
+
+# [Comment] Sentinel recording that .env has already been parsed in this process tree
+# [Why] Stored in the environment so re-imports,
+#       module reloads and forked workers inherit it
+_DOTENV_SENTINEL = "_KSERC_DOTENV_LOADED"
+
+# [Comment] One match per non-blank, non-comment line: `KEY=value` / `export KEY=value`
+#           fills groups 1-2, anything else lands in group 3 so it can be reported
+_DOTENV_LINE = re.compile(
+    rb"^[ \t]*(?:(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)"
+    rb"|([^#\s].*?))[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+# [Comment] Backslash escapes honoured inside double-quoted
+#           values (python-dotenv's common set)
+_DOTENV_ESCAPE = re.compile(r"\\(.)")
+_DOTENV_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\", "'": "'"}
+
+# [Library] logging.getLogger - Plain stdlib logger
+# [Why] src.utils.logger imports this module, so it cannot be used here; warnings reach
+#       stderr through logging's last-resort handler before logging is configured
+_log = logging.getLogger(__name__)
+
+
+# [User Defined] Locate the nearest .env file
+# [Why] Same lookup as python-dotenv's find_dotenv():
+#       walk up from this module's directory
+def _find_dotenv() -> Optional[Path]:
+    for directory in Path(__file__).resolve().parents:
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _parse_dotenv_value(raw: str) -> Optional[str]:
+    """
+    [Purpose] Decode the right-hand side of one .env line
+    [Why] Supports the subset documented in .env.example: unquoted values with an
+          optional ` # comment`, single-quoted values kept verbatim and double-quoted
+          values with backslash escapes, each optionally followed by a comment
+
+    [Returns]
+    - The value, or None when the line uses unsupported syntax (e.g. a multiline value)
+    """
+    if not raw or raw[0] not in "'\"":
+        # [Comment] Unquoted value - drop trailing ` # comment`
+        return raw.split(" #", 1)[0].rstrip()
+    quote = raw[0]
+    if quote == "'":
+        end = raw.find("'", 1)
+    else:
+        # [Comment] Closing quote is the first one not preceded by a backslash escape
+        end = 1
+        while end < len(raw) and raw[end] != '"':
+            end += 2 if raw[end] == "\\" else 1
+        if end >= len(raw):
+            end = -1
+    if end < 0:
+        return None
+    rest = raw[end + 1 :].strip()
+    if rest and not rest.startswith("#"):
+        return None
+    value = raw[1:end]
+    if quote == '"':
+        value = _DOTENV_ESCAPE.sub(
+            lambda m: _DOTENV_ESCAPES.get(m.group(1), m.group(0)), value
+        )
+    return value
+
+
+def _parse_dotenv(data: bytes, source: str = ".env") -> Dict[str, str]:
+    """
+    [Purpose] Parse .env content into a dict, warning about every line it skips
+    [Why] The loader is a deliberately small subset of python-dotenv; anything outside
+          it is reported instead of being dropped or mangled silently
+
+    [Note] ${VAR} references are not interpolated; such values are kept literally
+    """
+
+    # [Comment] Line numbers are only computed for lines that are reported
+    def line_no(match: "re.Match[bytes]") -> int:
+        return data[: match.start()].count(b"\n") + 1
+
+    values: Dict[str, str] = {}
+    for match in _DOTENV_LINE.finditer(data):
+        if match.group(3) is not None:
+            _log.warning(
+                "%s:%d: ignoring line that is not KEY=value", source, line_no(match)
+            )
+            continue
+        key = match.group(1).decode()
+        value = _parse_dotenv_value(match.group(2).decode("utf-8", errors="replace"))
+        if value is None:
+            _log.warning(
+                "%s:%d: ignoring %s - unterminated quote or text after the closing "
+                "quote (multiline values are not supported)",
+                source,
+                line_no(match),
+                key,
+            )
+            continue
+        if "${" in value and not match.group(2).startswith(b"'"):
+            _log.warning(
+                "%s:%d: %s contains ${...}, which is not interpolated",
+                source,
+                line_no(match),
+                key,
+            )
+        values[key] = value
+    return values
+
 
-# [Library Function] load_dotenv() - Loads variables from .env file into environment
+# [User Defined] Minimal .env loader over a memory-mapped buffer
+# [Source] Replaces python-dotenv's load_dotenv(), which tokenizes line by line
+# [Why] One mmap, one regex scan, no per-line parser
+#       objects; existing variables win (override=False)
+def _load_dotenv(path: Optional[Path]) -> None:
+    if path is None:
+        return
+    with open(path, "rb") as f:
+        # [Comment] mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            values = _parse_dotenv(buf, str(path))
+    for key, value in values.items():
+        _env.setdefault(key, value)
+
+
+# [User Defined] Load .env into the environment, but only once
 # [Why] Automatically loads configuration from .env file if it exists
-load_dotenv()
+if not _env.get(_DOTENV_SENTINEL):
+    _load_dotenv(_find_dotenv())
+    _env[_DOTENV_SENTINEL] = "1"
+
+# [Comment] Byte-level view of the environment (POSIX only; None on Windows)
+# [Why] Values that are parsed to int/bool straight away skip the str decode step
+_envb = getattr(os, "environb", None)
+
+# [Comment] Values accepted as "true" for boolean
+#           environment flags (str and bytes forms)
+# [Note] Compared after .strip().lower(), so any
+#        casing and surrounding spaces are accepted
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_TRUTHY_B = frozenset(v.encode() for v in _TRUTHY)
+
+
+# [User Defined] Integer environment reader with a pre-parsed default
+# [Why] The common case (variable unset) returns the
+#       int default without running int() on a string
+def _env_int(key: str, default: int) -> int:
+    # [Comment] int() accepts bytes directly, so the POSIX path never decodes the value
+    value = _envb.get(key.encode()) if _envb is not None else _env.get(key)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        # [Comment] Name the offending variable instead
+        #           of a bare int() traceback at import
+        shown = value.decode(errors="replace") if isinstance(value, bytes) else value
+        raise ValueError(f"{key} must be an integer, got {shown!r}") from None
+
+
+# [User Defined] String environment reader
+# [Why] Non-secret strings are interned so equal values share one object
+def _env_str(key: str, default: str) -> str:
+    return intern(_env.get(key, default))
+
+
+# [User Defined] Log level reader returning the numeric logging level
+# [Why] Consumers call logger.setLevel(int) / compare
+#       ints instead of resolving names repeatedly
+def _env_log_level(key: str, default: int) -> int:
+    name = _env.get(key)
+    if name is None:
+        return default
+    # [Library] logging.getLevelName() - Maps a known level
+    #           name to its int; unknown names yield a str
+    level = logging.getLevelName(name.upper())
+    return level if isinstance(level, int) else default
+
+
+# [User Defined] Boolean environment reader using frozenset membership
+# [Why] One hash lookup instead of a string comparison chain
+def _env_bool(key: str, default: bool) -> bool:
+    if _envb is not None:
+        raw = _envb.get(key.encode())
+        return default if raw is None else raw.strip().lower() in _TRUTHY_B
+    value = _env.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+# [User Defined] Dataclass field whose value is read
+#                from the environment at construction
+# [Why] Each key is read once per Settings instance;
+#       get_settings.cache_clear() re-reads them
+def _env_field(reader, key: str, default):
+    return field(default_factory=lambda: reader(key, default))
+
+
+# [Comment] Derived constants at module scope
+# [Why] Pure literals that never depend on the environment; hot paths can
+#       `from src.config import MAX_UPLOAD_SIZE` and read a global instead of settings.*
+MAX_UPLOAD_SIZE: Final[int] = 52_428_800  # [Comment] 50 MB in bytes (50 * 1024 * 1024)
+UPLOAD_CHUNK_SIZE: Final[int] = (
+    1_048_576  # [Comment] 1 MB read size when streaming uploads
+)
+PDF_DPI: Final[int] = 300  # [Comment] Resolution for image extraction from PDFs
+TABLE_DETECTION_TOLERANCE: Final[int] = (
+    3  # [Comment] Pixel tolerance for table detection
+)
+
+
+# [User Defined] Base class for lazily resolved settings groups
+# [Why] Settings itself is frozen; groups must be read-only too so no caller can
+#       overwrite a shared value (e.g. settings.llm.url = ...) under other requests
+class _LazyGroup:
+    def __setattr__(self, name: str, value) -> None:
+        # [Comment] cached_property stores into __dict__
+        #           directly, so first-access caching still works
+        raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+
+
+# [User Defined] Lazily resolved Hugging Face Inference API settings
+# [Why] Only the AI summary / verdict paths need these;
+#       workers that never call the LLM skip the reads
+class _LLMConfig(_LazyGroup):
+    @cached_property
+    def token(self) -> str:
+        # [Comment] Secret - deliberately not interned
+        return _env.get("HF_API_TOKEN", "")
+
+    @cached_property
+    def model(self) -> str:
+        return intern(_env.get("HF_API_MODEL", "deepseek-ai/DeepSeek-R1:fastest"))
+
+    @cached_property
+    def url(self) -> str:
+        return intern(
+            _env.get("HF_API_URL", "https://router.huggingface.co/v1/chat/completions")
+        )
+
+    @cached_property
+    def parsed_url(self) -> "httpx.URL":
+        # [Library] httpx.URL - Parsed once; httpx reuses the parsed
+        #           form instead of re-parsing a string per call
+        import httpx
+
+        return httpx.URL(self.url)
 
-# [User Defined] Configuration class using class attributes
+    @cached_property
+    def headers(self) -> Mapping[str, str]:
+        # [Comment] Request headers built once per process
+        #           and shared read-only by every LLM call
+        return MappingProxyType(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            }
+        )
+
+
+# [User Defined] Lazily resolved RAG settings (seed
+#                directory, Cloudflare Worker + R2 remote)
+# [Why] Read on first use by the RAG endpoints instead of at import
+class _RAGConfig(_LazyGroup):
+    @cached_property
+    def remote_base_url(self) -> str:
+        return intern(_env.get("RAG_REMOTE_BASE_URL", ""))
+
+    @cached_property
+    def remote_token(self) -> str:
+        # [Comment] Secret - deliberately not interned
+        return _env.get("RAG_REMOTE_TOKEN", "")
+
+    @cached_property
+    def seed_dir(self) -> str:
+        # [Comment] Defaults to <repo>/Material instead
+        #           of a developer-specific absolute path
+        return intern(
+            _env.get("RAG_SEED_DIR")
+            or str(Path(__file__).resolve().parent.parent / "Material")
+        )
+
+
+# [User Defined] Lazily resolved Google Cloud Storage settings
+# [Why] Only the verdict upload path consults the bucket configuration
+class _GCSConfig(_LazyGroup):
+    @cached_property
+    def bucket_name(self) -> str:
+        return intern(_env.get("GCS_BUCKET_NAME", ""))
+
+    @cached_property
+    def public_base_url(self) -> str:
+        return intern(_env.get("GCS_PUBLIC_BASE_URL", ""))
+
+    @cached_property
+    def public_prefix(self) -> str:
+        # [Comment] "<base>/" computed once so each
+        #           verdict URL is a single concatenation
+        base = (
+            self.public_base_url.rstrip("/")
+            or f"https://storage.googleapis.com/{self.bucket_name}"
+        )
+        return f"{base}/"
+
+    @cached_property
+    def client(self) -> "storage.Client":
+        # [Library] storage.Client() - Resolves credentials and
+        #           owns the HTTP session / connection pool
+        # [Why] Built once and reused by every upload instead of per call
+        from google.cloud import storage
+
+        return storage.Client()
+
+    @cached_property
+    def bucket(self) -> "storage.Bucket":
+        # [Comment] Bucket handle bound to the shared client;
+        #           building it does not hit the network
+        return self.client.bucket(self.bucket_name)
+
+
+# [Comment] True only while get_settings() is building
+#           the instance; see Settings.__new__
+_constructing_settings = False
+
+
+# [User Defined] Configuration container as a frozen, slotted dataclass
 # [Source] Common Python pattern for configuration management
-# [Why] Provides a single source of truth for all application settings
+# [Why] Provides a single source of truth for all application settings;
+#       slots turn every settings.* read into a
+# slot descriptor load instead of a dict probe
+@dataclass(frozen=True, slots=True)
 class Settings:
+    def __new__(cls, *args, **kwargs):
+        """
+        [Purpose] Refuse construction outside get_settings()
+        [Why] A stray Settings() call would build a second instance that silently
+              diverges from the shared one (e.g. after get_settings.cache_clear())
+        """
+        if not _constructing_settings:
+            raise RuntimeError(
+                "Settings must not be constructed directly; use get_settings()"
+            )
+        # [Comment] object.__new__ is used directly; zero-arg
+        #           super() is unreliable in slotted dataclasses
+        return object.__new__(cls)
+
     # [Comment] Application metadata
-    APP_NAME: str = "KSERC Autonomous Regulatory Agent (ARA)"
-    APP_VERSION: str = "1.0.0"
-    APP_DESCRIPTION: str = "Backend for automating Truing Up of Accounts scrutiny"
-    
+    # [Library] typing.Final - Every setting field is annotated Final
+    # [Why] Declares the values as constants for type checkers
+    #       and readers; the instance is frozen at runtime
+    # [Library] intern() - Applied to every non-secret string setting
+    # [Why] Tokens are deliberately left un-interned so
+    #       secrets never enter the interned-string table
+    APP_NAME: Final[str] = intern("KSERC Autonomous Regulatory Agent (ARA)")
+    APP_VERSION: Final[str] = intern("1.0.0")
+    APP_DESCRIPTION: Final[str] = intern(
+        "Backend for automating Truing Up of Accounts scrutiny"
+    )
+
     # [Comment] Server configuration
-    # [Library] os.getenv() - Retrieves environment variable value
-    # [Why] Uses environment variable if set, otherwise uses default value
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
-    
+    # [Library] _env_field() - Reads the environment variable when the instance is built
+    # [Why] Environment values are resolved inside
+    #       get_settings(), not at class definition
+    HOST: Final[str] = _env_field(_env_str, "HOST", "0.0.0.0")
+    PORT: Final[int] = _env_field(_env_int, "PORT", 8000)
+    # [Note] 0 = one worker per CPU core; forced to
+    #        1 when DEBUG_MODE enables auto-reload
+    WORKERS: Final[int] = _env_field(_env_int, "WORKERS", 0)
+
     # [Comment] API configuration
     # [Why] Allows enabling/disabling automatic API documentation in production
-    DEBUG_MODE: bool = os.getenv("DEBUG_MODE", "True").lower() == "true"
-    
+    DEBUG_MODE: Final[bool] = _env_field(_env_bool, "DEBUG_MODE", True)
+
     # [Comment] File upload limits
     # [Why] Prevents server overload from extremely large PDF files
-    MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50 MB in bytes
-    
+    MAX_UPLOAD_SIZE: Final[int] = MAX_UPLOAD_SIZE
+
     # [Comment] Logging configuration
     # [Why] Determines the verbosity of application logs
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    
+    # [Note] Stored as the numeric logging level (e.g.
+    #        logging.INFO == 20); see LOG_LEVEL_NAME
+    LOG_LEVEL: Final[int] = _env_field(_env_log_level, "LOG_LEVEL", logging.INFO)
+
     # [Comment] KSERC-specific configuration
     # [Why] Default values for KSERC regulatory analysis
-    DEFAULT_FINANCIAL_YEAR: str = "2023-24"
-    REGULATORY_AUTHORITY: str = "Kerala State Electricity Regulatory Commission (KSERC)"
-    
+    DEFAULT_FINANCIAL_YEAR: Final[str] = intern("2023-24")
+    REGULATORY_AUTHORITY: Final[str] = intern(
+        "Kerala State Electricity Regulatory Commission (KSERC)"
+    )
+
     # [Comment] PDF Processing configuration
     # [Why] Settings specific to PDF extraction
-    PDF_DPI: int = 300  # [Comment] Resolution for image extraction from PDFs
-    TABLE_DETECTION_TOLERANCE: int = 3  # [Comment] Pixel tolerance for table detection
+    PDF_DPI: Final[int] = PDF_DPI
+    TABLE_DETECTION_TOLERANCE: Final[int] = TABLE_DETECTION_TOLERANCE
+    # [Note] Leading pages scanned for licensee name / financial year; later pages are
+    #        only read for metadata when the header does not contain it
+    METADATA_PAGES: Final[int] = _env_field(_env_int, "METADATA_PAGES", 3)
 
     # [Comment] Free LLM API configuration (Hugging Face Inference API)
     # [Why] Optional AI summary generation using a free-tier API
-    HF_API_TOKEN: str = os.getenv("HF_API_TOKEN", "")
-    HF_API_MODEL: str = os.getenv("HF_API_MODEL", "deepseek-ai/DeepSeek-R1:fastest")
-    HF_API_URL: str = os.getenv(
-        "HF_API_URL",
-        "https://router.huggingface.co/v1/chat/completions"
+    # [Note] Token, model and URL live in the lazy `llm` group below
+    LLM_TIMEOUT_SECONDS: Final[int] = _env_field(_env_int, "LLM_TIMEOUT_SECONDS", 30)
+    # [Note] Connection pool limits for the shared
+    #        AI summary client (per worker process)
+    LLM_MAX_CONNECTIONS: Final[int] = _env_field(_env_int, "LLM_MAX_CONNECTIONS", 100)
+    LLM_MAX_KEEPALIVE_CONNECTIONS: Final[int] = _env_field(
+        _env_int, "LLM_MAX_KEEPALIVE_CONNECTIONS", 20
+    )
+    # [Note] Send static instructions as a separate system block marked cache_control
+    #        (only for models/providers that support prompt caching)
+    LLM_PROMPT_CACHE: Final[bool] = _env_field(_env_bool, "LLM_PROMPT_CACHE", False)
+    # [Note] AI summary retry budget: read timeout
+    #        per attempt and retries after the first
+    #        attempt (on timeouts, 429 and 5xx) before falling back to the local summary
+    LLM_PER_ATTEMPT_TIMEOUT: Final[int] = _env_field(
+        _env_int, "LLM_PER_ATTEMPT_TIMEOUT", 15
     )
-    LLM_TIMEOUT_SECONDS: int = int(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+    LLM_MAX_RETRIES: Final[int] = _env_field(_env_int, "LLM_MAX_RETRIES", 2)
 
     # [Comment] RAG configuration
     # [Why] Local indexing of KSERC regulatory documents
-    RAG_STORAGE_DIR: str = os.getenv("RAG_STORAGE_DIR", "data/rag")
-    RAG_INDEX_FILE: str = os.getenv("RAG_INDEX_FILE", "data/rag/index.json")
-    RAG_SEED_DIR: str = os.getenv(
-        "RAG_SEED_DIR",
-        "/home/prak05/GITHUB/KSERC/Material"
+    RAG_STORAGE_DIR: Final[str] = _env_field(_env_str, "RAG_STORAGE_DIR", "data/rag")
+    RAG_INDEX_FILE: Final[str] = _env_field(
+        _env_str, "RAG_INDEX_FILE", "data/rag/index.json"
     )
-    # [Comment] Remote RAG index (Cloudflare Worker + R2)
-    # [Why] Offload indexing away from local machine
-    RAG_REMOTE_BASE_URL: str = os.getenv("RAG_REMOTE_BASE_URL", "")
-    RAG_REMOTE_TOKEN: str = os.getenv("RAG_REMOTE_TOKEN", "")
+    # [Note] Text extractor for indexed PDFs:
+    #        "pdfplumber" or "pymupdf" (optional package)
+    RAG_PDF_BACKEND: Final[str] = _env_field(_env_str, "RAG_PDF_BACKEND", "pdfplumber")
 
     # [Comment] Verdict output directory
     # [Why] Store generated PDF verdicts
-    VERDICT_DIR: str = os.getenv("VERDICT_DIR", "data/verdicts")
-
-    # [Comment] GCS bucket for verdict PDFs
-    # [Why] Persist verdicts across Cloud Run restarts
-    GCS_BUCKET_NAME: str = os.getenv("GCS_BUCKET_NAME", "")
-    GCS_PUBLIC_BASE_URL: str = os.getenv(
-        "GCS_PUBLIC_BASE_URL",
-        ""
+    VERDICT_DIR: Final[str] = _env_field(_env_str, "VERDICT_DIR", "data/verdicts")
+    # [Note] When set (e.g. "/internal/verdicts/"), downloads are handed to the reverse
+    #        proxy via X-Accel-Redirect instead of being streamed by the app
+    VERDICT_ACCEL_REDIRECT_PREFIX: Final[str] = _env_field(
+        _env_str, "VERDICT_ACCEL_REDIRECT_PREFIX", ""
     )
 
-# [User Defined] Create a singleton instance of settings
-# [Source] Singleton pattern for application-wide configuration
-# [Why] Ensures only one instance of settings exists, accessible everywhere
-settings = Settings()
+    # [Comment] Verdict response cache
+    # [Why] Identical ARR/truing-up pairs against the
+    #       same RAG index skip retrieval and LLM calls
+    # [Note] 0 disables the cache
+    VERDICT_CACHE_TTL_SECONDS: Final[int] = _env_field(
+        _env_int, "VERDICT_CACHE_TTL_SECONDS", 3600
+    )
+
+    # [Comment] Lazily resolved settings groups (HF API, remote RAG, GCS)
+    # [Why] Values are read from the environment on first attribute access and cached
+    llm: _LLMConfig = field(default_factory=_LLMConfig, repr=False)
+    rag: _RAGConfig = field(default_factory=_RAGConfig, repr=False)
+    gcs: _GCSConfig = field(default_factory=_GCSConfig, repr=False)
+
+    # [Comment] Cached read-only snapshot backing as_dict()
+    _asdict: Optional[Mapping[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # [Comment] Textual log level (e.g. "INFO") for
+    #           display and uvicorn's log_level option
+    @property
+    def LOG_LEVEL_NAME(self) -> str:
+        return logging.getLevelName(self.LOG_LEVEL)
+
+    # [Comment] Backward-compatible flat accessors over the lazy groups
+    # [Why] Existing call sites keep using settings.HF_API_TOKEN etc.
+    @property
+    def HF_API_TOKEN(self) -> str:
+        return self.llm.token
+
+    @property
+    def HF_API_MODEL(self) -> str:
+        return self.llm.model
+
+    @property
+    def HF_API_URL(self) -> str:
+        return self.llm.url
+
+    @property
+    def RAG_REMOTE_BASE_URL(self) -> str:
+        return self.rag.remote_base_url
+
+    @property
+    def RAG_REMOTE_TOKEN(self) -> str:
+        return self.rag.remote_token
+
+    @property
+    def RAG_SEED_DIR(self) -> str:
+        return self.rag.seed_dir
+
+    @property
+    def GCS_BUCKET_NAME(self) -> str:
+        return self.gcs.bucket_name
+
+    @property
+    def GCS_PUBLIC_BASE_URL(self) -> str:
+        return self.gcs.public_base_url
+
+    def as_dict(self) -> Mapping[str, Any]:
+        """
+        [Purpose] Returns every public setting as a read-only mapping
+        [Why] Logging sinks / debug endpoints can json.dumps() one cached dict
+              instead of walking attributes on every call
+
+        [Notes]
+        - Built on first call (so lazy groups stay lazy until needed) and cached
+        - Secrets are redacted when the snapshot is built
+        """
+        snapshot = self._asdict
+        if snapshot is None:
+            data: dict = {}
+            for name in _SETTINGS_KEYS:
+                value = getattr(self, name)
+                if name in _SECRET_KEYS:
+                    value = "***" if value else ""
+                data[name] = value
+            snapshot = MappingProxyType(data)
+            # [Comment] Frozen dataclass - cache via object.__setattr__
+            object.__setattr__(self, "_asdict", snapshot)
+        return snapshot
+
+
+# [Comment] Public setting names (fields and flat accessors) exported by as_dict()
+_SETTINGS_KEYS: Final = tuple(name for name in dir(Settings) if name.isupper())
+
+# [Comment] Settings that must never appear in serialized output
+_SECRET_KEYS: Final = frozenset({"HF_API_TOKEN", "RAG_REMOTE_TOKEN"})
+
+
+# [User Defined] Cached settings accessor
+# [Source] functools.lru_cache factory pattern (FastAPI settings docs)
+# [Why] The single place a Settings instance is built; lru_cache is the singleton guard
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    [Purpose] Returns the application-wide Settings instance
+    [Why] Construction (and every environment read) happens once; later calls are a
+          cache hit
+
+    [Testing]
+    Change os.environ, then call get_settings.cache_clear(); the next
+    get_settings() call builds a fresh instance from the new environment
+    without reloading this module.
+    """
+    global _constructing_settings
+    _constructing_settings = True
+    try:
+        return Settings()
+    finally:
+        _constructing_settings = False
+
+
+# [User Defined] Module-level settings instance
+# [Why] Kept for backward compatibility with existing
+#       `from src.config import settings` imports
+# [Note] This name is bound once at import; code that must
+#        observe cache_clear() should call get_settings()
+settings = get_settings()
+
+# [Comment] Coerced environment-backed values as module-level Final constants
+# [Why] Hot paths can `from src.config import PORT` and read a global; the values are
+#       taken from the shared instance, so the environment is still read only once
+PORT: Final[int] = settings.PORT
+DEBUG_MODE: Final[bool] = settings.DEBUG_MODE
+LLM_TIMEOUT_SECONDS: Final[int] = settings.LLM_TIMEOUT_SECONDS
@@ -2,87 +2,136 @@
 # [Source] Main application orchestrator combining all services
 # [Why] Central location for API endpoint definitions and application setup
 
+# [Library] asyncio - Concurrency primitives
+# [Why] Parse the ARR and Truing-Up PDFs of a verdict request concurrently;
+#       cancel LLM calls whose client has disconnected
+import asyncio
+
+# [Library] logging - Level constants
+# [Why] Guard log-only computations with logger.isEnabledFor()
+import logging
+
+# [Library] os - CPU count and file metadata
+# [Why] Default worker count; detect RAG index files rewritten by another worker
+import os
+
+# [Library] re - Clean LLM output
+# [Why] Strip code fences
+import re
+
+# [Library] sys - Platform detection
+# [Why] uvloop is unavailable on Windows, so the
+#       event loop choice depends on the platform
+import sys
+
+# [Library] contextlib.asynccontextmanager - Build the lifespan handler
+# [Why] Replaces the deprecated @app.on_event startup/shutdown hooks
+from contextlib import asynccontextmanager
+
+# [Library] datetime - Current time
+# [Why] Health check timestamp
+from datetime import datetime
+
+# [Library] pathlib - Path handling
+# [Why] Manage data directories safely
+from pathlib import Path
+
+# [Library] typing - Type hints for better code quality
+# [Why] Enables IDE support and type checking
+from typing import Any, Dict, Tuple
+
+# [Library] orjson - Parse LLM output
+# [Why] Parse structured verdict if JSON-like; much faster than stdlib json
+import orjson
+
+# [Library] Uvicorn - ASGI server for FastAPI
+# [Source] https://www.uvicorn.org/
+# [Why] Production-ready server for running async Python web apps
+import uvicorn
+
 # [Library] FastAPI - Modern, high-performance web framework
 # [Source] https://fastapi.tiangolo.com/
 # [Why] Chosen for speed, automatic API documentation, and async support
-from fastapi import FastAPI, UploadFile, File, HTTPException, status
+from fastapi import (
+    BackgroundTasks,
+    FastAPI,
+    File,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 
-# [Library] FastAPI Response classes for HTTP responses
-# [Why] Provides type-safe response models
-from fastapi.responses import JSONResponse, FileResponse
+# [Library] run_in_threadpool - Run blocking callables on Starlette's worker thread pool
+# [Source] https://fastapi.tiangolo.com/async/
+# [Why] PDF parsing, compliance math, PDF generation and
+#       sync HTTP calls must not block the event loop
+from fastapi.concurrency import run_in_threadpool
 
 # [Library] FastAPI middleware for CORS (Cross-Origin Resource Sharing)
 # [Source] https://fastapi.tiangolo.com/tutorial/cors/
 # [Why] Allows frontend (dashboard) to call backend from different origin
 from fastapi.middleware.cors import CORSMiddleware
 
-# [Library] Uvicorn - ASGI server for FastAPI
-# [Source] https://www.uvicorn.org/
-# [Why] Production-ready server for running async Python web apps
-import uvicorn
-
-# [Library] typing - Type hints for better code quality
-# [Why] Enables IDE support and type checking
-from typing import Dict, Any
+# [Library] FastAPI Response classes for HTTP responses
+# [Why] Provides type-safe response models
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse
 
 # [User Defined] Import configuration settings
 # [Source] src/config.py
-# [Why] Centralized configuration management
-from src.config import settings
+# [Why] Centralized configuration management; MAX_UPLOAD_SIZE
+#       is a module constant read on every upload
+from src.config import MAX_UPLOAD_SIZE, UPLOAD_CHUNK_SIZE, settings
 
 # [User Defined] Import Pydantic models for request/response validation
 # [Source] src/models/schemas.py
 # [Why] Ensures type safety for API inputs and outputs
 from src.models.schemas import (
-    TruingUpResponse,
     ErrorResponse,
     HealthCheckResponse,
+    RagIndexResponse,
     SummaryRequest,
     SummaryResponse,
-    RagIndexResponse,
-    VerdictResponse
+    TruingUpResponse,
+    VerdictResponse,
 )
 
-# [User Defined] Import PDF processing service
-# [Source] src/services/pdf_ingestion.py
-# [Why] Core functionality for processing regulatory orders
-from src.services.pdf_ingestion import process_regulatory_order
-
 # [User Defined] Import analysis service
 # [Source] src/services/analyzer.py
 # [Why] Provides compliance checking and gap analysis
-from src.services.analyzer import (
-    perform_compliance_checks,
-    generate_analysis_summary
-)
+from src.services.analyzer import generate_analysis_summary, perform_compliance_checks
+from src.services.llm_orchestrator import aclose_client as aclose_agent_client
+from src.services.llm_orchestrator import run_four_agent_pipeline
 
 # [User Defined] Import LLM summary service
 # [Source] src/services/llm_summary.py
 # [Why] Provides optional AI executive summary using free-tier API
+from src.services.llm_summary import aclose_client as aclose_summary_client
 from src.services.llm_summary import generate_summary
+from src.services.llm_summary import warm_client as warm_summary_client
+
+# [User Defined] Import PDF processing service
+# [Source] src/services/pdf_ingestion.py
+# [Why] Core functionality for processing regulatory orders
+from src.services.pdf_ingestion import process_regulatory_order
 
 # [User Defined] RAG and Verdict services
-# [Source] src/services/rag.py, src/services/llm_orchestrator.py, src/services/verdict.py
-from src.services.rag import save_index, load_index, RagIndex
+# [Source] src/services/rag.py, src/services/llm_orchestrator.py,
+#          src/services/verdict.py
+from src.services.rag import RagIndex, load_index, save_index, update_index
 from src.services.rag_remote import (
+    create_remote_client,
+    fetch_remote_index,
     remote_index_seed,
     remote_upload_files,
-    fetch_remote_index
 )
-from src.services.llm_orchestrator import run_four_agent_pipeline
 from src.services.verdict import build_verdict_pdf, upload_verdict_to_gcs
 
-# [Library] pathlib - Path handling
-# [Why] Manage data directories safely
-from pathlib import Path
-
-# [Library] json - Parse LLM output
-# [Why] Parse structured verdict if JSON-like
-import json
-
-# [Library] re - Clean LLM output
-# [Why] Strip code fences
-import re
+# [User Defined] Import incremental content hasher
+# [Source] src/utils/cache.py
+# [Why] Uploads are hashed while streaming so the parse cache key costs no extra pass
+from src.utils.cache import LRUCache, content_hasher
 
 # [User Defined] Import logger
 # [Source] src/utils/logger.py
@@ -92,8 +141,19 @@ from src.utils.logger import get_logger
 # [User Defined] Create logger instance for this module
 logger = get_logger(__name__)
 
-# [Comment] Global RAG index cache
-rag_index: RagIndex | None = None
+# [Comment] Verdict cache keyed by (ARR hash, truing-up hash, RAG index fingerprint)
+# [Why] Repeat submissions skip retrieval and the
+#       4 LLM calls; a new index changes the key
+verdict_cache = LRUCache(maxsize=32, ttl=settings.VERDICT_CACHE_TTL_SECONDS)
+
+
+def _set_rag_index(index: RagIndex | None) -> None:
+    """
+    [Purpose] Publish a fully built RAG index to request handlers
+    [Why] A single attribute assignment is atomic, so readers see either the old
+          or the new index, never a partially built one
+    """
+    app.state.rag_index = index
 
 
 def _load_rag_index_if_exists() -> None:
@@ -101,29 +161,244 @@ def _load_rag_index_if_exists() -> None:
     [Purpose] Load RAG index from disk if available
     [Why] Reuse across requests
     """
-    global rag_index
     if not settings.RAG_REMOTE_BASE_URL:
-        logger.warning("Local RAG indexing is disabled. Set RAG_REMOTE_BASE_URL to enable remote indexing.")
+        logger.warning(
+            "Local RAG indexing is disabled. "
+            "Set RAG_REMOTE_BASE_URL to enable remote indexing."
+        )
         return
-    index_path = Path(settings.RAG_INDEX_FILE)
+    index_path = app.state.rag_index_path
     if index_path.exists():
-        rag_index = load_index(index_path)
+        app.state.rag_index_mtime_ns = index_path.stat().st_mtime_ns
+        _set_rag_index(load_index(index_path))
         logger.info("Loaded cached RAG index from disk")
     else:
-        logger.info("Local cache missing; remote RAG base set. Use /rag/refresh to load.")
+        logger.info(
+            "Local cache missing; remote RAG base set. Use /rag/refresh to load."
+        )
 
 
 async def _refresh_rag_index_from_remote() -> None:
     """
     [Purpose] Refresh RAG index from remote service
     [Why] Keeps local cache in sync with Cloudflare index
+
+    [Note] Writers serialize on app.state.rag_index_lock; readers never take it
+    """
+    async with app.state.rag_index_lock:
+        remote_payload = await fetch_remote_index(app.state.rag_http)
+        chunks = remote_payload.get("chunks", [])
+        # [Comment] Skip the rebuild and disk write when the remote index is unchanged,
+        #           and only tokenize the new chunks when documents were appended
+        # [Why] Refreshes after uploads otherwise re-tokenize the whole corpus
+        # [Comment] Built off the event loop, then the reference is swapped in one step
+        new_index = await run_in_threadpool(update_index, app.state.rag_index, chunks)
+        if new_index is None:
+            logger.info("Remote RAG index unchanged; keeping loaded index")
+            return
+        _set_rag_index(new_index)
+        await run_in_threadpool(save_index, chunks, app.state.rag_index_path, new_index)
+        app.state.rag_index_mtime_ns = app.state.rag_index_path.stat().st_mtime_ns
+        logger.info("Loaded RAG index from remote service")
+
+
+async def _reload_rag_index_if_stale() -> None:
+    """
+    [Purpose] Reload the RAG index when another worker has rewritten the index file
+    [Why] With several uvicorn workers, /rag/* only refreshes the worker that served it;
+          the shared index file is the hand-off, and a stat() per verdict is cheap
     """
-    global rag_index
-    remote_payload = await fetch_remote_index()
-    chunks = remote_payload.get("chunks", [])
-    rag_index = RagIndex(chunks)
-    save_index(chunks, Path(settings.RAG_INDEX_FILE))
-    logger.info("Loaded RAG index from remote service")
+    index_path = app.state.rag_index_path
+    try:
+        mtime_ns = index_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    if mtime_ns == app.state.rag_index_mtime_ns:
+        return
+    async with app.state.rag_index_lock:
+        if mtime_ns == app.state.rag_index_mtime_ns:
+            return
+        _set_rag_index(await run_in_threadpool(load_index, index_path))
+        app.state.rag_index_mtime_ns = mtime_ns
+        logger.info("Reloaded RAG index updated by another worker")
+
+
+_TOO_LARGE_DETAIL = (
+    f"File size exceeds maximum allowed size of {MAX_UPLOAD_SIZE / (1024*1024)} MB"
+)
+
+
+def _validate_pdf_upload(
+    file: UploadFile, detail: str = "File must be a PDF. Please upload a PDF file."
+) -> None:
+    """
+    [Purpose] Reject non-PDF and declared-oversize uploads before reading any body bytes
+    [Why] Bad requests fail fast without consuming upload bandwidth, memory or parse
+          time
+
+    [HTTP Status Codes]
+    - 400: Extension is not .pdf (case-insensitive)
+    - 413: Declared size already exceeds MAX_UPLOAD_SIZE
+    """
+    filename = file.filename or ""
+    if not filename.lower().endswith(".pdf"):
+        logger.warning("Invalid file format: %s", filename)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    if file.size is not None and file.size > MAX_UPLOAD_SIZE:
+        logger.warning("File too large: %s", filename)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=_TOO_LARGE_DETAIL,
+        )
+
+
+async def _stream_upload(file: UploadFile) -> Tuple[str, int]:
+    """
+    [Purpose] Read an upload in fixed-size chunks, hashing and sizing it on the way
+    [Why] Never holds the whole PDF in memory; oversized uploads are rejected as soon
+          as they cross MAX_UPLOAD_SIZE, and the digest doubles as the parse cache key
+
+    [Returns]
+    - Tuple of (content hash, size in bytes); file is rewound for the parser
+    """
+    hasher = content_hasher()
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > MAX_UPLOAD_SIZE:
+            logger.warning("File too large: %s", file.filename)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=_TOO_LARGE_DETAIL,
+            )
+        hasher.update(chunk)
+    await file.seek(0)
+    return hasher.hexdigest(), size
+
+
+def _warm_gcs_client() -> None:
+    """
+    [Purpose] Build the shared GCS client ahead of the first verdict upload
+    [Why] Credential discovery takes noticeable time on a cold start
+    """
+    if not settings.GCS_BUCKET_NAME:
+        return
+    try:
+        # [Comment] Resolves the shared client and its bucket handle in one go
+        settings.gcs.bucket
+    except Exception as e:
+        logger.warning("GCS client warm-up failed: %s", e)
+
+
+def _upload_verdict_in_background(file_name: str, pdf_bytes: bytes) -> None:
+    """
+    [Purpose] Copy a verdict PDF to GCS after the response has been sent
+    [Why] The client gets its verdict without waiting on the GCS PUT; the local
+          file keeps serving downloads until (and unless) the upload succeeds
+    """
+    try:
+        public_url = upload_verdict_to_gcs(file_name, pdf_bytes)
+        logger.info("Uploaded verdict to %s", public_url)
+    except Exception as e:
+        logger.error(
+            "Background verdict upload failed for %s: %s", file_name, e, exc_info=True
+        )
+
+
+def _build_info_payload() -> Dict[str, Any]:
+    """
+    [Purpose] API metadata served by /info
+    [Why] Depends only on settings, so it is built and serialized once at startup
+    """
+    return {
+        "api_name": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "description": settings.APP_DESCRIPTION,
+        "regulatory_authority": settings.REGULATORY_AUTHORITY,
+        "endpoints": {
+            "health": "/",
+            "info": "/info",
+            "analyze_order": "/analyze-order/",
+            "compliance_check": "/compliance-check/",
+            "ai_summary": "/ai-summary/",
+            "rag_index": "/rag/index-seed",
+            "rag_upload": "/rag/upload",
+            "verdict": "/verdict/",
+        },
+        "documentation": {
+            "swagger_ui": "/docs" if settings.DEBUG_MODE else "Disabled in production",
+            "redoc": "/redoc" if settings.DEBUG_MODE else "Disabled in production",
+        },
+        "capabilities": [
+            "PDF ingestion and parsing",
+            "Financial table extraction",
+            "Truing Up analysis",
+            "Compliance checks",
+            "Deviation analysis",
+        ],
+    }
+
+
+# [Library] asynccontextmanager - FastAPI lifespan handler
+# [Source] FastAPI lifespan events documentation
+# [Why] Startup runs before the first request, shutdown after the last one
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    [Purpose] Application startup and shutdown
+    [Why] Resolves data paths once, creates directories once, and loads the RAG
+          index and GCS client in parallel before serving traffic
+    """
+    logger.info("=" * 60)
+
+    # [Comment] Resolve data paths once; request handlers read them from app.state
+    app.state.rag_index_path = Path(settings.RAG_INDEX_FILE)
+    app.state.verdict_dir = Path(settings.VERDICT_DIR)
+    app.state.storage_dir = Path(settings.RAG_STORAGE_DIR)
+    app.state.verdict_dir.mkdir(parents=True, exist_ok=True)
+    app.state.storage_dir.mkdir(parents=True, exist_ok=True)
+
+    # [Comment] Precomputed /info body and validated /health template
+    app.state.info_bytes = orjson.dumps(_build_info_payload())
+    app.state.health_template = HealthCheckResponse(
+        status="active",
+        system=f"ARA Backend v{settings.APP_VERSION}",
+        version=settings.APP_VERSION,
+    )
+
+    # [Comment] Shared RAG index; replaced wholesale by writers under the lock
+    app.state.rag_index = None
+    app.state.rag_index_mtime_ns = None
+    app.state.rag_index_lock = asyncio.Lock()
+
+    # [Comment] Pooled HTTP/2 client for the remote RAG
+    #           Worker, only when one is configured
+    app.state.rag_http = (
+        create_remote_client() if settings.RAG_REMOTE_BASE_URL else None
+    )
+
+    # [Comment] Disk index load and GCS credential setup are independent blocking calls;
+    #           the LLM connection warm-up overlaps with both
+    await asyncio.gather(
+        run_in_threadpool(_load_rag_index_if_exists),
+        run_in_threadpool(_warm_gcs_client),
+        warm_summary_client(),
+    )
+
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("Server: %s:%s", settings.HOST, settings.PORT)
+    logger.info("Debug Mode: %s", settings.DEBUG_MODE)
+    logger.info("Log Level: %s", settings.LOG_LEVEL_NAME)
+    logger.info("=" * 60)
+
+    yield
+
+    logger.info("Shutting down KSERC ARA Backend")
+    if app.state.rag_http is not None:
+        await app.state.rag_http.aclose()
+    await aclose_summary_client()
+    await aclose_agent_client()
+
 
 # [Library] FastAPI() - Initialize FastAPI application instance
 # [Why] This 'app' object is the core of the web server
@@ -133,54 +408,31 @@ app = FastAPI(
     description=settings.APP_DESCRIPTION,  # [Comment] Description for API docs
     version=settings.APP_VERSION,  # [Comment] Version for tracking
     docs_url="/docs" if settings.DEBUG_MODE else None,  # [Comment] Swagger UI endpoint
-    redoc_url="/redoc" if settings.DEBUG_MODE else None  # [Comment] ReDoc endpoint
+    redoc_url="/redoc" if settings.DEBUG_MODE else None,  # [Comment] ReDoc endpoint
+    # [Comment] orjson serializes reports/verdicts far faster than stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,  # [Comment] Startup/shutdown handler defined above
 )
 
 # [Library] Add CORS middleware to allow cross-origin requests
 # [Source] FastAPI CORS middleware
 # [Why] Enables frontend applications to call this API from different domains
 # [Security Note] In production, restrict origins to specific domains
+# [Note] Starlette pre-builds the CORS header values once at construction time,
+#        so concrete lists mainly shrink preflight responses and checks
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # [Comment] Allow all origins (restrict in production)
     allow_credentials=True,  # [Comment] Allow cookies
-    allow_methods=["*"],  # [Comment] Allow all HTTP methods
-    allow_headers=["*"],  # [Comment] Allow all headers
+    allow_methods=["GET", "POST"],  # [Comment] Only methods the API exposes
+    allow_headers=[
+        "Content-Type",
+        "Authorization",
+    ],  # [Comment] Matches the frontend and Worker CORS policy
+    max_age=86400,  # [Comment] Browsers cache preflight results for a day
 )
 
 
-# [Library] @app.on_event("startup") - FastAPI lifecycle event
-# [Source] FastAPI events documentation
-# [Why] Code to run when application starts up
-@app.on_event("startup")
-async def startup_event():
-    """
-    [Purpose] Initialization code executed when application starts
-    [Source] FastAPI lifecycle events
-    [Why] Setup tasks like database connections, logging configuration
-    """
-    logger.info("=" * 60)
-    _load_rag_index_if_exists()
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Server: {settings.HOST}:{settings.PORT}")
-    logger.info(f"Debug Mode: {settings.DEBUG_MODE}")
-    logger.info(f"Log Level: {settings.LOG_LEVEL}")
-    logger.info("=" * 60)
-
-
-# [Library] @app.on_event("shutdown") - FastAPI lifecycle event
-# [Source] FastAPI events documentation
-# [Why] Cleanup code when application shuts down
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    [Purpose] Cleanup code executed when application shuts down
-    [Source] FastAPI lifecycle events
-    [Why] Graceful cleanup of resources (database connections, file handles)
-    """
-    logger.info("Shutting down KSERC ARA Backend")
-
-
 # [User Defined] Root endpoint for health checks
 # [Source] Standard REST API convention
 # [Why] Allows monitoring systems and load balancers to check if service is alive
@@ -189,28 +441,28 @@ async def shutdown_event():
     response_model=HealthCheckResponse,
     tags=["Health"],
     summary="Health Check",
-    description="Check if the API service is running and healthy"
+    description="Check if the API service is running and healthy",
 )
-async def health_check():
+async def health_check() -> HealthCheckResponse:
     """
     [Purpose] Returns basic health status of the API
     [Source] Standard practice for microservices
     [Why] Load balancers and monitoring tools use this to check service health
-    
+
     [Returns]
     - HealthCheckResponse: Status, system name, timestamp, version
-    
+
     [HTTP Status]
     - 200 OK: Service is healthy
     """
     logger.debug("Health check requested")
-    
-    # [Comment] Return health status with current timestamp
-    return HealthCheckResponse(
-        status="active",
-        system=f"ARA Backend v{settings.APP_VERSION}",
-        version=settings.APP_VERSION
-    )
+
+    # [Comment] Only the timestamp changes between
+    #           calls; the rest is the startup template
+    # [Why] Load balancers poll this endpoint constantly
+    #       - model_copy() skips re-validating
+    #       the constant fields, and returning the model keeps the payload on its schema
+    return app.state.health_template.model_copy(update={"timestamp": datetime.now()})
 
 
 # [User Defined] Endpoint to get API information
@@ -220,50 +472,26 @@ async def health_check():
     "/info",
     tags=["Health"],
     summary="API Information",
-    description="Get detailed information about the API"
+    description="Get detailed information about the API",
 )
-async def api_info() -> Dict[str, Any]:
+async def api_info() -> Response:
     """
     [Purpose] Returns API metadata and configuration
     [Source] User defined endpoint
     [Why] Helps API consumers understand capabilities
-    
+
     [Returns]
-    - Dict: API information including version, endpoints, configuration
+    - JSON: API information including version, endpoints, configuration
+      (serialized once at startup by _build_info_payload)
     """
     logger.debug("API info requested")
-    
-    return {
-        "api_name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "description": settings.APP_DESCRIPTION,
-        "regulatory_authority": settings.REGULATORY_AUTHORITY,
-        "endpoints": {
-            "health": "/",
-            "info": "/info",
-            "analyze_order": "/analyze-order/",
-            "compliance_check": "/compliance-check/",
-            "ai_summary": "/ai-summary/",
-            "rag_index": "/rag/index-seed",
-            "rag_upload": "/rag/upload",
-            "verdict": "/verdict/"
-        },
-        "documentation": {
-            "swagger_ui": "/docs" if settings.DEBUG_MODE else "Disabled in production",
-            "redoc": "/redoc" if settings.DEBUG_MODE else "Disabled in production"
-        },
-        "capabilities": [
-            "PDF ingestion and parsing",
-            "Financial table extraction",
-            "Truing Up analysis",
-            "Compliance checks",
-            "Deviation analysis"
-        ]
-    }
+
+    return Response(content=app.state.info_bytes, media_type="application/json")
 
 
 # [User Defined] Main endpoint to upload and analyze regulatory orders
-# [Source] Core API functionality based on 'ARA_Autonomous_Regulatory_Compliance.pdf' workflow
+# [Source] Core API functionality based on
+#          'ARA_Autonomous_Regulatory_Compliance.pdf' workflow
 # [Why] Primary use case - upload PDF and get analysis results
 @app.post(
     "/analyze-order/",
@@ -273,27 +501,38 @@ async def api_info() -> Dict[str, Any]:
     description="Upload a KSERC regulatory order PDF and get truing up analysis",
     status_code=status.HTTP_200_OK,
     responses={
-        400: {"model": ErrorResponse, "description": "Bad Request - Invalid file format"},
-        500: {"model": ErrorResponse, "description": "Internal Server Error - Processing failed"}
-    }
+        400: {
+            "model": ErrorResponse,
+            "description": "Bad Request - Invalid file format",
+        },
+        413: {
+            "model": ErrorResponse,
+            "description": "Payload Too Large - File exceeds upload limit",
+        },
+        500: {
+            "model": ErrorResponse,
+            "description": "Internal Server Error - Processing failed",
+        },
+    },
 )
 async def analyze_order(file: UploadFile = File(...)):
     """
     [Purpose] Analyzes uploaded KSERC regulatory order PDF
     [Source] User defined endpoint integrating PDF ingestion service
     [Why] Main API function for regulatory order analysis
-    
+
     [Parameters]
     - file: UploadFile - PDF file of regulatory order
-    
+
     [Returns]
     - TruingUpResponse: Complete analysis with financial data and deviations
-    
+
     [HTTP Status Codes]
     - 200: Success - Analysis completed
     - 400: Bad Request - File is not a PDF
+    - 413: Payload Too Large - File exceeds MAX_UPLOAD_SIZE
     - 500: Server Error - Processing failed
-    
+
     [Process Flow]
     1. Validate file is PDF
     2. Check file size
@@ -301,63 +540,53 @@ async def analyze_order(file: UploadFile = File(...)):
     4. Process PDF (extract tables, metadata)
     5. Return structured response
     """
-    logger.info(f"Received file upload: {file.filename}")
-    
-    # [Comment] Step 1: Validate file extension
-    # [Library] str.endswith() - Check if string ends with suffix
-    # [Why] Only PDF files should be processed
-    if not file.filename.endswith(".pdf"):
-        logger.warning(f"Invalid file format: {file.filename}")
-        
-        # [Library] HTTPException - FastAPI exception for HTTP errors
-        # [Why] Returns proper HTTP error response to client
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File must be a PDF. Please upload a PDF file."
-        )
-    
-    # [Comment] Step 2: Read file content
-    # [Why] Need file bytes for processing
+    logger.info("Received file upload: %s", file.filename)
+
+    # [Comment] Step 1: Validate file extension and declared size
+    # [Why] Only PDF files should be processed; reject before reading the body
+    _validate_pdf_upload(file)
+
+    # [Comment] Step 2: Stream file content
+    # [Why] Hash and size-check in chunks instead of buffering the whole PDF
     try:
-        # [Library] await file.read() - Async read of uploaded file
-        # [Why] FastAPI UploadFile is async for performance
-        logger.debug("Reading file content")
-        file_content = await file.read()
-        
-        # [Comment] Step 3: Check file size
-        # [Why] Prevent server overload from extremely large files
-        file_size_mb = len(file_content) / (1024 * 1024)
-        logger.info(f"File size: {file_size_mb:.2f} MB")
-        
-        if len(file_content) > settings.MAX_UPLOAD_SIZE:
-            logger.warning(f"File too large: {file_size_mb:.2f} MB")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / (1024*1024)} MB"
-            )
-        
+        logger.debug("Streaming file content")
+        content_key, file_size = await _stream_upload(file)
+
+        # [Comment] Step 3: Log file size
+        # [Why] Oversized files were already rejected while
+        #       streaming; skip the math when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("File size: %.2f MB", file_size / (1024 * 1024))
+
         # [Comment] Step 4: Process the regulatory order PDF
         # [User Defined] Call PDF ingestion service
         # [Source] src/services/pdf_ingestion.py
         # [Why] Separates business logic from API layer
         logger.info("Processing regulatory order")
-        result = process_regulatory_order(file_content)
-        
-        logger.info(f"Analysis complete for {result.licensee_name} - {result.financial_year}")
+        # [Library] run_in_threadpool - PDF parsing is CPU
+        #           bound; other requests keep being served
+        # [Why] The spooled upload file is handed over directly; no in-memory copy
+        result = await run_in_threadpool(
+            process_regulatory_order, file.file, content_key
+        )
+
+        logger.info(
+            "Analysis complete for %s - %s", result.licensee_name, result.financial_year
+        )
         return result
-        
+
     except HTTPException:
         # [Comment] Re-raise HTTP exceptions (already formatted)
         raise
-    
+
     except Exception as e:
         # [Comment] Catch all other exceptions and return 500 error
         # [Why] Prevents server crash and provides error details to client
-        logger.error(f"Error processing file: {str(e)}", exc_info=True)
-        
+        logger.error("Error processing file: %s", e, exc_info=True)
+
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process PDF: {str(e)}"
+            detail=f"Failed to process PDF: {str(e)}",
         )
 
 
@@ -369,70 +598,121 @@ async def analyze_order(file: UploadFile = File(...)):
     tags=["Analysis"],
     summary="Perform Compliance Check",
     description="Upload a regulatory order and get detailed compliance analysis",
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
 )
 async def compliance_check(file: UploadFile = File(...)) -> Dict[str, Any]:
     """
     [Purpose] Performs comprehensive compliance checks on regulatory order
     [Source] User defined endpoint integrating analyzer service
     [Why] Provides detailed compliance report beyond basic analysis
-    
+
     [Parameters]
     - file: UploadFile - PDF file of regulatory order
-    
+
     [Returns]
     - Dict: Detailed compliance report with checks, warnings, and summary
-    
+
     [Process Flow]
     1. Process PDF to get truing up analysis
     2. Perform compliance checks on results
     3. Generate analysis summary
     4. Return comprehensive report
     """
-    logger.info(f"Compliance check requested for: {file.filename}")
-    
-    # [Comment] Validate file type
-    if not file.filename.endswith(".pdf"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File must be a PDF"
-        )
-    
+    logger.info("Compliance check requested for: %s", file.filename)
+
+    # [Comment] Validate file type and declared size
+    _validate_pdf_upload(file, "File must be a PDF")
+
     try:
         # [Comment] Step 1: Process the PDF
-        file_content = await file.read()
+        content_key, _ = await _stream_upload(file)
         logger.debug("Processing PDF for compliance check")
-        analysis_result = process_regulatory_order(file_content)
-        
+        analysis_result = await run_in_threadpool(
+            process_regulatory_order, file.file, content_key
+        )
+
         # [Comment] Step 2: Perform compliance checks
         # [User Defined] Call analyzer service
         # [Source] src/services/analyzer.py
         # [Why] Specialized service for regulatory compliance
         logger.info("Performing compliance checks")
-        compliance_report = perform_compliance_checks(analysis_result)
-        
+        compliance_report = await run_in_threadpool(
+            perform_compliance_checks, analysis_result
+        )
+
         # [Comment] Step 3: Generate analysis summary
         logger.debug("Generating analysis summary")
-        summary = generate_analysis_summary(analysis_result, compliance_report)
-        
+        summary = await run_in_threadpool(
+            generate_analysis_summary, analysis_result, compliance_report
+        )
+
         # [Comment] Step 4: Combine results into comprehensive report
         comprehensive_report = {
-            "basic_analysis": analysis_result.model_dump(),  # [Library] Pydantic model_dump()
-            "compliance_report": compliance_report,
-            "executive_summary": summary
+            # [Library] Pydantic model_dump()
+            "basic_analysis": analysis_result.model_dump(),
+            "compliance_report": compliance_report.to_dict(),
+            "executive_summary": summary,
         }
-        
+
         logger.info("Compliance check completed successfully")
         return comprehensive_report
-        
+
+    except HTTPException:
+        raise
+
     except Exception as e:
-        logger.error(f"Error during compliance check: {str(e)}", exc_info=True)
+        logger.error("Error during compliance check: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Compliance check failed: {str(e)}"
+            detail=f"Compliance check failed: {str(e)}",
         )
 
 
+# [Comment] nginx's non-standard "client closed request" status
+# [Why] Logged for calls abandoned by the client; the client never sees the response
+_CLIENT_CLOSED_REQUEST = 499
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """
+    [Purpose] Return once the ASGI server reports that the client went away
+    [Why] After the body is read, receive() only yields http.disconnect
+    """
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _unless_disconnected(request: Request, coro: Any) -> Any:
+    """
+    [Purpose] Await coro, cancelling it as soon as the client disconnects
+    [Why] An abandoned LLM call otherwise holds its pooled connection until the LLM
+          timeout expires; cancelling it frees the connection straight away
+
+    [Exceptions]
+    - HTTPException(499) if the client disconnected first
+    """
+    if await request.is_disconnected():
+        coro.close()
+        raise HTTPException(
+            status_code=_CLIENT_CLOSED_REQUEST, detail="Client closed request"
+        )
+    work = asyncio.ensure_future(coro)
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait((work, disconnect), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect.cancel()
+        abandoned = not work.done()
+        if abandoned:
+            work.cancel()
+    if abandoned:
+        logger.info("Client disconnected; cancelled pending LLM call")
+        raise HTTPException(
+            status_code=_CLIENT_CLOSED_REQUEST, detail="Client closed request"
+        )
+    return work.result()
+
+
 # [User Defined] Endpoint to generate AI summary for analysis results
 # [Source] Free-tier Hugging Face Inference API integration
 # [Why] Provides executive summary without paid APIs
@@ -442,25 +722,32 @@ async def compliance_check(file: UploadFile = File(...)) -> Dict[str, Any]:
     tags=["Analysis"],
     summary="Generate AI Summary",
     description="Generate an executive summary using a free-tier LLM API",
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
 )
-async def ai_summary(payload: SummaryRequest) -> SummaryResponse:
+async def ai_summary(payload: SummaryRequest, request: Request) -> SummaryResponse:
     """
     [Purpose] Generates AI summary for analysis results
     [Why] Delivers readable executive summary for dashboard use
     """
     try:
         logger.info("AI summary requested")
-        result = generate_summary(
-            analysis=payload.analysis.model_dump(),
-            compliance_report=payload.compliance_report
+        # [Comment] generate_summary awaits the pooled AsyncClient - no thread pool hop;
+        #           it is skipped or cancelled if the client disconnects
+        result = await _unless_disconnected(
+            request,
+            generate_summary(
+                analysis=payload.analysis.model_dump(),
+                compliance_report=payload.compliance_report,
+            ),
         )
         return SummaryResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error generating AI summary: {str(e)}", exc_info=True)
+        logger.error("Error generating AI summary: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"AI summary failed: {str(e)}"
+            detail=f"AI summary failed: {str(e)}",
         )
 
 
@@ -471,21 +758,20 @@ async def ai_summary(payload: SummaryRequest) -> SummaryResponse:
     response_model=RagIndexResponse,
     tags=["RAG"],
     summary="Index RAG Seed Documents",
-    description="Index documents from configured RAG_SEED_DIR"
+    description="Index documents from configured RAG_SEED_DIR",
 )
 async def rag_index_seed() -> RagIndexResponse:
-    global rag_index
     if not settings.RAG_REMOTE_BASE_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Local RAG indexing is disabled. Configure RAG_REMOTE_BASE_URL."
+            detail="Local RAG indexing is disabled. Configure RAG_REMOTE_BASE_URL.",
         )
-    remote_result = await remote_index_seed()
+    remote_result = await remote_index_seed(app.state.rag_http)
     await _refresh_rag_index_from_remote()
     return RagIndexResponse(
         status=remote_result.get("status", "indexed"),
         indexed_chunks=remote_result.get("indexed_chunks", 0),
-        sources=remote_result.get("sources", [])
+        sources=remote_result.get("sources", []),
     )
 
 
@@ -496,34 +782,33 @@ async def rag_index_seed() -> RagIndexResponse:
     response_model=RagIndexResponse,
     tags=["RAG"],
     summary="Upload RAG Documents",
-    description="Upload new RAG files and rebuild index"
+    description="Upload new RAG files and rebuild index",
 )
 async def rag_upload(files: list[UploadFile] = File(...)) -> RagIndexResponse:
-    global rag_index
     if not settings.RAG_REMOTE_BASE_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Local RAG indexing is disabled. Configure RAG_REMOTE_BASE_URL."
-        )
-    upload_files = []
-    for f in files:
-        if not f.filename:
-            continue
-        content = await f.read()
-        upload_files.append(
-            ("files", (f.filename, content, f.content_type or "application/octet-stream"))
+            detail="Local RAG indexing is disabled. Configure RAG_REMOTE_BASE_URL.",
         )
+    named_files = [f for f in files if f.filename]
+    # [Comment] Read all uploads concurrently; spooled-to-disk
+    #           files are read on the thread pool
+    # [Why] Wall time is the slowest file instead of the sum over files
+    contents = await asyncio.gather(*(f.read() for f in named_files))
+    upload_files = [
+        ("files", (f.filename, content, f.content_type or "application/octet-stream"))
+        for f, content in zip(named_files, contents)
+    ]
     if not upload_files:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No files uploaded"
+            status_code=status.HTTP_400_BAD_REQUEST, detail="No files uploaded"
         )
-    remote_result = await remote_upload_files(upload_files)
+    remote_result = await remote_upload_files(app.state.rag_http, upload_files)
     await _refresh_rag_index_from_remote()
     return RagIndexResponse(
         status=remote_result.get("status", "uploaded_and_indexed"),
         indexed_chunks=remote_result.get("indexed_chunks", 0),
-        sources=remote_result.get("sources", [])
+        sources=remote_result.get("sources", []),
     )
 
 
@@ -532,38 +817,46 @@ async def rag_upload(files: list[UploadFile] = File(...)) -> RagIndexResponse:
     response_model=RagIndexResponse,
     tags=["RAG"],
     summary="Refresh RAG Index",
-    description="Pull the latest index from the remote RAG service"
+    description="Pull the latest index from the remote RAG service",
 )
 async def rag_refresh() -> RagIndexResponse:
     if not settings.RAG_REMOTE_BASE_URL:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="RAG_REMOTE_BASE_URL not configured"
+            detail="RAG_REMOTE_BASE_URL not configured",
         )
     await _refresh_rag_index_from_remote()
-    sources = sorted({c["source"] for c in (rag_index.chunks if rag_index else [])})
+    rag_index = app.state.rag_index
     return RagIndexResponse(
         status="refreshed",
         indexed_chunks=len(rag_index.chunks) if rag_index else 0,
-        sources=sources
+        sources=rag_index.sorted_sources if rag_index else [],
     )
 
 
+# [Comment] Markdown code-fence pattern around LLM JSON, compiled once
+# [Why] Avoids re's per-call pattern cache lookup on every verdict
+_FENCE_RE = re.compile(r"^```(?:json)?|```$", re.MULTILINE)
+
+
 def _parse_verdict_json(raw_text: str) -> Dict[str, Any]:
     """
     [Purpose] Parse JSON-like verdict from LLM output
     [Why] Normalize output for API and PDF
     """
-    cleaned = re.sub(r"^```(json)?|```$", "", raw_text.strip(), flags=re.MULTILINE).strip()
+    cleaned = _FENCE_RE.sub("", raw_text.strip()).strip()
     try:
-        return json.loads(cleaned)
-    except Exception:
-        return {
-            "approved_items": [],
-            "disallowed_items": [],
-            "conditions": [],
-            "final_summary": cleaned
-        }
+        parsed = orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+    return {
+        "approved_items": [],
+        "disallowed_items": [],
+        "conditions": [],
+        "final_summary": cleaned,
+    }
 
 
 # [User Defined] Main verdict endpoint
@@ -574,52 +867,87 @@ def _parse_verdict_json(raw_text: str) -> Dict[str, Any]:
     tags=["Analysis"],
     summary="Generate KSERC Verdict",
     description="Upload ARR and Truing-Up PDFs to generate final verdict PDF",
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
 )
 async def generate_verdict(
+    background_tasks: BackgroundTasks,
     arr_pdf: UploadFile = File(...),
-    truing_pdf: UploadFile = File(...)
+    truing_pdf: UploadFile = File(...),
 ) -> VerdictResponse:
-    global rag_index
-    if rag_index is None and settings.RAG_REMOTE_BASE_URL:
+    # [Comment] Validate uploads first; cheaper than loading the index
+    _validate_pdf_upload(arr_pdf, "Both files must be PDFs")
+    _validate_pdf_upload(truing_pdf, "Both files must be PDFs")
+
+    if settings.RAG_REMOTE_BASE_URL:
+        await _reload_rag_index_if_stale()
+    if app.state.rag_index is None and settings.RAG_REMOTE_BASE_URL:
         await _refresh_rag_index_from_remote()
+    # [Comment] Take one local reference; a concurrent
+    #           refresh swaps app.state, not this object
+    rag_index = app.state.rag_index
     if rag_index is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="RAG index not loaded. Call /rag/index-seed or /rag/upload first."
-        )
-
-    if not arr_pdf.filename.endswith(".pdf") or not truing_pdf.filename.endswith(".pdf"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Both files must be PDFs"
+            detail="RAG index not loaded. Call /rag/index-seed or /rag/upload first.",
         )
 
     try:
-        arr_content = await arr_pdf.read()
-        truing_content = await truing_pdf.read()
-
-        arr_result = process_regulatory_order(arr_content)
-        truing_result = process_regulatory_order(truing_content)
-        compliance_report = perform_compliance_checks(truing_result)
-
-        # Build RAG query
-        query = (
-            f"{truing_result.licensee_name} {truing_result.financial_year} "
-            f"truing up ARR compliance regulation 73 tariff 2021 "
-            f"deviation {truing_result.net_surplus_deficit}"
-        )
-        rag_snippets = rag_index.search(query, top_k=6)
-
-        # Run 4-agent pipeline
-        agent_outputs = run_four_agent_pipeline(
-            arr_analysis=arr_result.model_dump(),
-            truing_analysis=truing_result.model_dump(),
-            compliance_report=compliance_report,
-            rag_snippets=rag_snippets
+        arr_key, _ = await _stream_upload(arr_pdf)
+        truing_key, _ = await _stream_upload(truing_pdf)
+
+        # [Comment] Exact-match verdict cache; the index
+        #           fingerprint invalidates entries on re-index
+        cache_key = (arr_key, truing_key, rag_index.fingerprint)
+        cached = (
+            verdict_cache.get(cache_key)
+            if settings.VERDICT_CACHE_TTL_SECONDS > 0
+            else None
         )
+        if cached is not None:
+            logger.info(
+                "Verdict cache hit; skipping parsing, retrieval and agent pipeline"
+            )
+            rag_snippets, agent_outputs, verdict_parsed = cached
+        else:
+            # [Comment] Parse both PDFs concurrently on the thread pool
+            arr_result, truing_result = await asyncio.gather(
+                run_in_threadpool(process_regulatory_order, arr_pdf.file, arr_key),
+                run_in_threadpool(
+                    process_regulatory_order, truing_pdf.file, truing_key
+                ),
+            )
+            compliance_report = await run_in_threadpool(
+                perform_compliance_checks, truing_result
+            )
+
+            # Build RAG query
+            query = (
+                f"{truing_result.licensee_name} {truing_result.financial_year} "
+                f"truing up ARR compliance regulation 73 tariff 2021 "
+                f"deviation {truing_result.net_surplus_deficit}"
+            )
+            # [Comment] BM25 scoring is CPU bound - keep it off the event loop
+            rag_snippets = await run_in_threadpool(rag_index.search, query, 6)
+
+            # Run 4-agent pipeline (Agents 1-3 concurrently, then Agent 4)
+            agent_outputs = await run_four_agent_pipeline(
+                arr_analysis=arr_result.model_dump(),
+                truing_analysis=truing_result.model_dump(),
+                compliance_report=compliance_report.to_dict(),
+                rag_snippets=rag_snippets,
+            )
+
+            verdict_parsed = _parse_verdict_json(
+                agent_outputs.get("chief_regulatory_officer", "")
+            )
+            # [Comment] Fallback verdicts are provisional; retry the agents next time
+            if settings.VERDICT_CACHE_TTL_SECONDS > 0 and not agent_outputs.get(
+                "fallback"
+            ):
+                verdict_cache.set(
+                    cache_key, (rag_snippets, agent_outputs, verdict_parsed)
+                )
 
-        verdict_parsed = _parse_verdict_json(agent_outputs.get("chief_regulatory_officer", ""))
         summary = verdict_parsed.get("final_summary") or "Verdict generated."
         approved_items = verdict_parsed.get("approved_items", []) or []
         disallowed_items = verdict_parsed.get("disallowed_items", []) or []
@@ -630,14 +958,22 @@ async def generate_verdict(
             "summary": summary,
             "approved_items": approved_items,
             "disallowed_items": disallowed_items,
-            "conditions": conditions
+            "conditions": conditions,
         }
-        verdict_path = build_verdict_pdf(Path(settings.VERDICT_DIR), verdict_payload)
+        verdict_path, pdf_bytes = await run_in_threadpool(
+            build_verdict_pdf, app.state.verdict_dir, verdict_payload
+        )
         verdict_id = verdict_path.stem
 
+        # [Comment] Always hand back the API download URL;
+        #           GCS upload happens after the response
+        # [Why] download_verdict serves the local copy
+        #       and falls back to GCS if it is gone
         verdict_pdf_url = f"/verdict/{verdict_id}.pdf"
         if settings.GCS_BUCKET_NAME:
-            verdict_pdf_url = upload_verdict_to_gcs(verdict_path)
+            background_tasks.add_task(
+                _upload_verdict_in_background, verdict_path.name, pdf_bytes
+            )
 
         return VerdictResponse(
             verdict_id=verdict_id,
@@ -647,29 +983,43 @@ async def generate_verdict(
             disallowed_items=disallowed_items,
             conditions=conditions,
             agent_outputs=agent_outputs,
-            rag_snippets=rag_snippets
+            rag_snippets=rag_snippets,
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Verdict generation failed: {str(e)}", exc_info=True)
+        logger.error("Verdict generation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Verdict generation failed: {str(e)}"
+            detail=f"Verdict generation failed: {str(e)}",
         )
 
 
 # [User Defined] Serve verdict PDF
-@app.get(
-    "/verdict/{verdict_id}.pdf",
-    tags=["Analysis"],
-    summary="Download Verdict PDF"
-)
+@app.get("/verdict/{verdict_id}.pdf", tags=["Analysis"], summary="Download Verdict PDF")
 async def download_verdict(verdict_id: str):
-    file_path = Path(settings.VERDICT_DIR) / f"{verdict_id}.pdf"
+    file_path = app.state.verdict_dir / f"{verdict_id}.pdf"
     if not file_path.exists():
+        # [Comment] Local copy gone (e.g. another instance
+        #           or a restarted container) - use GCS
+        if settings.GCS_BUCKET_NAME:
+            return RedirectResponse(settings.gcs.public_prefix + file_path.name)
         raise HTTPException(status_code=404, detail="Verdict PDF not found")
-    return FileResponse(path=str(file_path), media_type="application/pdf", filename=f"{verdict_id}.pdf")
+    # [Comment] Behind nginx, let the proxy sendfile()
+    #           the PDF; the worker sends headers only
+    if settings.VERDICT_ACCEL_REDIRECT_PREFIX:
+        return Response(
+            media_type="application/pdf",
+            headers={
+                "X-Accel-Redirect": (
+                    f"{settings.VERDICT_ACCEL_REDIRECT_PREFIX}{file_path.name}"
+                ),
+                "Content-Disposition": f'attachment; filename="{file_path.name}"',
+            },
+        )
+    return FileResponse(
+        path=str(file_path), media_type="application/pdf", filename=f"{verdict_id}.pdf"
+    )
 
 
 # [Library] Exception handler for unhandled exceptions
@@ -681,25 +1031,25 @@ async def global_exception_handler(request, exc):
     [Purpose] Global exception handler for uncaught exceptions
     [Source] FastAPI exception handling
     [Why] Prevents server crash and provides consistent error responses
-    
+
     [Parameters]
     - request: Request object
     - exc: Exception that was raised
-    
+
     [Returns]
-    - JSONResponse: Error response with details
+    - ORJSONResponse: Error response with details
     """
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    
-    # [Library] JSONResponse - FastAPI response class
-    # [Why] Returns JSON-formatted error
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+
+    # [Library] ORJSONResponse - FastAPI response class
+    # [Why] Returns JSON-formatted error, matching the app's default response class
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "InternalServerError",
             "message": "An unexpected error occurred",
-            "details": str(exc) if settings.DEBUG_MODE else "Contact administrator"
-        }
+            "details": str(exc) if settings.DEBUG_MODE else "Contact administrator",
+        },
     )
 
 
@@ -714,14 +1064,26 @@ if __name__ == "__main__":
     # - host: Network interface to bind to (0.0.0.0 = all interfaces)
     # - port: Port number to listen on
     # - reload: Auto-reload on code changes (development only)
+    # - workers: Worker processes (WORKERS, default one per core; 1 under reload)
     # - log_level: Logging verbosity
-    
-    logger.info("Starting server via uvicorn")
-    
+    # - loop: uvloop event loop (stdlib asyncio on Windows, where uvloop is unsupported)
+    # - http: httptools HTTP/1.1 parser
+
+    # [Comment] One process per core sidesteps the GIL for CPU-bound PDF parsing
+    # [Note] Each worker loads its own BM25 index; the
+    #        index file on disk keeps them in sync
+    workers = 1 if settings.DEBUG_MODE else (settings.WORKERS or os.cpu_count() or 1)
+    logger.info("Starting server via uvicorn with %d worker(s)", workers)
+
     uvicorn.run(
         "src.main:app",  # [Comment] String path to app object
         host=settings.HOST,  # [Comment] From config
         port=settings.PORT,  # [Comment] From config
         reload=settings.DEBUG_MODE,  # [Comment] Auto-reload in debug mode
-        log_level=settings.LOG_LEVEL.lower()  # [Comment] Uvicorn log level
+        workers=workers,  # [Comment] Worker processes
+        log_level=settings.LOG_LEVEL_NAME.lower(),  # [Comment] Uvicorn log level
+        loop=(
+            "asyncio" if sys.platform == "win32" else "uvloop"
+        ),  # [Comment] Event loop implementation
+        http="httptools",  # [Comment] HTTP protocol implementation
     )
@@ -1,10 +1,19 @@
 # [Purpose] Analyzer service for compliance checks and gap analysis
-# [Source] Logic derived from 'ARA_Autonomous_Regulatory_Compliance.pdf' (Phase 2: Analysis)
+# [Source] Logic derived from 'ARA_Autonomous_Regulatory_Compliance.pdf'
+#          (Phase 2: Analysis)
 # [Why] Performs mathematical precision checks and regulatory compliance analysis
 
+# [Library] dataclasses - Slotted, immutable result records
+# [Why] Compliance reports are cached and shared; slots keep them small and read-only
+from dataclasses import dataclass
+
+# [Library] functools.lru_cache - Memoization
+# [Why] Percentage column is shared by the deviation check and DataFrame export
+from functools import lru_cache
+
 # [Library] typing - Type hints for better code clarity
 # [Why] Enables IDE support and type checking
-from typing import List, Dict, Any, Tuple, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
 
 # [Optional] pandas - Only needed for response_to_dataframe
 # [Why] Avoids hard dependency during runtime unless export is requested
@@ -14,7 +23,12 @@ if TYPE_CHECKING:
 # [User Defined] Import data models
 # [Source] src/models/schemas.py
 # [Why] Type-safe data structures
-from src.models.schemas import FinancialRow, TruingUpResponse
+from src.models.schemas import FinancialColumns, FinancialRow, TruingUpResponse
+
+# [User Defined] Import the shared LRU cache
+# [Source] src/utils/cache.py
+# [Why] Identical analyses produce identical compliance reports
+from src.utils.cache import LRUCache
 
 # [User Defined] Import logger
 # [Source] src/utils/logger.py
@@ -24,6 +38,61 @@ from src.utils.logger import get_logger
 # [User Defined] Get logger instance for this module
 logger = get_logger(__name__)
 
+# [User Defined] Compliance reports keyed by the analysed row columns and totals
+# [Why] compliance-check and verdict endpoints re-check the same parsed orders
+COMPLIANCE_CACHE = LRUCache(maxsize=128)
+
+
+# [User Defined] Result of a single compliance check
+# [Why] Attribute access on a slotted record instead of string-keyed dict lookups
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    check_name: str
+    status: str
+    details: str
+    # [Comment] Only set by the checks that report them
+    items: Optional[Tuple[Dict[str, Any], ...]] = None
+    percentage_of_arr: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        [Purpose] JSON-ready dict in the original report shape (unset fields omitted)
+        """
+        data: Dict[str, Any] = {
+            "check_name": self.check_name,
+            "status": self.status,
+            "details": self.details,
+        }
+        if self.items is not None:
+            data["items"] = list(self.items)
+        if self.percentage_of_arr is not None:
+            data["percentage_of_arr"] = self.percentage_of_arr
+        return data
+
+
+# [User Defined] Full compliance report returned by perform_compliance_checks
+# [Why] Frozen so the instance shared through
+#       COMPLIANCE_CACHE cannot be mutated by callers
+@dataclass(frozen=True, slots=True)
+class ComplianceReport:
+    checks_performed: Tuple[CheckResult, ...] = ()
+    passed_checks: int = 0
+    failed_checks: int = 0
+    warnings: Tuple[str, ...] = ()
+    overall_status: str = "COMPLIANT"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        [Purpose] Serialize for the API boundary and LLM prompts
+        """
+        return {
+            "checks_performed": [check.to_dict() for check in self.checks_performed],
+            "passed_checks": self.passed_checks,
+            "failed_checks": self.failed_checks,
+            "warnings": list(self.warnings),
+            "overall_status": self.overall_status,
+        }
+
 
 # [User Defined] Function to calculate percentage deviation
 # [Source] Standard financial analysis formula
@@ -33,218 +102,317 @@ def calculate_percentage_deviation(arr_value: float, actual_value: float) -> flo
     [Purpose] Calculates percentage deviation from ARR
     [Source] User defined using standard financial formula
     [Why] Percentage gives context - is deviation significant?
-    
+
     [Parameters]
     - arr_value: Approved ARR amount
     - actual_value: Actual trued up amount
-    
+
     [Returns]
     - float: Percentage deviation (positive = overspend, negative = underspend)
-    
+
     [Formula] ((Actual - ARR) / ARR) * 100
     """
     # [Comment] Handle division by zero case
     if arr_value == 0:
         logger.warning("ARR value is zero, cannot calculate percentage")
         return 0.0
-    
-    # [Comment] Calculate percentage using standard formula
-    # [Why] Shows proportion of deviation relative to budget
-    percentage = ((actual_value - arr_value) / arr_value) * 100
-    
-    return round(percentage, 2)  # [Comment] Round to 2 decimal places for readability
+
+    return round(
+        _pct_raw(arr_value, actual_value), 2
+    )  # [Comment] Round to 2 decimal places for readability
+
+
+# [User Defined] Unrounded percentage deviation for internal comparisons
+# [Why] Threshold checks need full precision; rounding is only for display
+def _pct_raw(arr_value: float, actual_value: float) -> float:
+    # [Comment] Calculate percentage using standard formula ((Actual - ARR) / ARR) * 100
+    # [Why] Shows proportion of deviation relative to budget; zero ARR maps to 0.0
+    return 0.0 if arr_value == 0 else ((actual_value - arr_value) / arr_value) * 100
+
+
+# [User Defined] Unrounded percentage deviation for every row of a column view
+# [Why] Computed once per distinct (ARR, actual)
+#       column pair instead of per caller per row
+@lru_cache(maxsize=64)
+def _percentage_deviations(
+    arr_approved: Tuple[float, ...], trued_up_value: Tuple[float, ...]
+) -> Tuple[float, ...]:
+    return tuple(map(_pct_raw, arr_approved, trued_up_value))
+
+
+# [User Defined] Aggregates over one column view
+# [Why] Totals, direction counts and the largest deviation come from a single pass
+class _ColumnStats(NamedTuple):
+    total_arr_approved: float
+    total_trued_up: float
+    overspent_items: int
+    underspent_items: int
+    largest_deviation_index: int  # [Comment] -1 when there are no rows
+
+
+# [User Defined] Fused aggregation kernel for compliance checks and summary
+# [Why] Replaces four separate traversals; memoized so the summary reuses the
+#       result computed during the compliance checks
+@lru_cache(maxsize=64)
+def _column_stats(
+    arr_approved: Tuple[float, ...], trued_up_value: Tuple[float, ...]
+) -> _ColumnStats:
+    total_arr = total_actual = 0.0
+    over = under = 0
+    max_abs = -1.0
+    max_idx = -1
+    for i, (a, t) in enumerate(zip(arr_approved, trued_up_value)):
+        total_arr += a
+        total_actual += t
+        d = t - a
+        if d > 0:
+            over += 1
+        elif d < 0:
+            under += 1
+        # [Comment] Strict > keeps the first row on ties, as max() did
+        ad = d if d >= 0 else -d
+        if ad > max_abs:
+            max_abs = ad
+            max_idx = i
+    return _ColumnStats(total_arr, total_actual, over, under, max_idx)
 
 
 # [User Defined] Function to identify significant deviations
 # [Source] Regulatory threshold analysis
 # [Why] Flags items requiring closer scrutiny
 def identify_significant_deviations(
-    financial_rows: List[FinancialRow],
-    threshold_percentage: float = 10.0
+    financial_rows: List[FinancialRow], threshold_percentage: float = 10.0
 ) -> List[Dict[str, Any]]:
     """
     [Purpose] Identifies financial items with significant deviations
     [Source] User defined based on regulatory scrutiny practices
     [Why] Regulators focus on items with large deviations
-    
+
     [Parameters]
     - financial_rows: List of financial line items
     - threshold_percentage: Deviation % threshold (default 10%)
-    
+
     [Returns]
     - List[Dict]: Items exceeding threshold with details
-    
+
     [Regulatory Context]
     Deviations above threshold may require explanation from licensee
     """
-    logger.info(f"Analyzing deviations with threshold: {threshold_percentage}%")
-    
+    return _significant_deviations(
+        FinancialColumns.from_rows(financial_rows), threshold_percentage
+    )
+
+
+def _significant_deviations(
+    columns: FinancialColumns, threshold_percentage: float
+) -> List[Dict[str, Any]]:
+    """
+    [Purpose] identify_significant_deviations over a precomputed column view
+    [Why] perform_compliance_checks reuses the response's cached columns
+    """
+    logger.info("Analyzing deviations with threshold: %s%%", threshold_percentage)
+
     # [Comment] Initialize list for significant items
     significant_items = []
-    
+
     # [Comment] Analyze each financial row
-    for row in financial_rows:
-        # [Comment] Calculate percentage deviation
-        percentage_dev = calculate_percentage_deviation(
-            row.arr_approved,
-            row.trued_up_value
-        )
-        
+    percentages = _percentage_deviations(columns.arr_approved, columns.trued_up_value)
+    for particulars, arr_approved, trued_up_value, deviation, raw_pct in zip(
+        *columns, percentages
+    ):
         # [Comment] Check if deviation exceeds threshold
         # [Library] abs() - Absolute value (considers both over and under spending)
         # [Why] Both overspending and underspending need scrutiny
-        if abs(percentage_dev) > threshold_percentage:
+        if abs(raw_pct) > threshold_percentage:
+            # [Comment] Round only the flagged rows, for display
+            percentage_dev = round(raw_pct, 2)
             logger.warning(
-                f"Significant deviation found: {row.particulars} "
-                f"({percentage_dev}% deviation)"
+                "Significant deviation found: %s (%s%% deviation)",
+                particulars,
+                percentage_dev,
             )
-            
+
             # [Comment] Add to significant items list with details
-            significant_items.append({
-                'particulars': row.particulars,
-                'arr_approved': row.arr_approved,
-                'trued_up_value': row.trued_up_value,
-                'deviation': row.deviation,
-                'percentage_deviation': percentage_dev,
-                'severity': 'HIGH' if abs(percentage_dev) > 20 else 'MEDIUM'
-            })
-    
-    logger.info(f"Found {len(significant_items)} significant deviations")
+            significant_items.append(
+                {
+                    "particulars": particulars,
+                    "arr_approved": arr_approved,
+                    "trued_up_value": trued_up_value,
+                    "deviation": deviation,
+                    "percentage_deviation": percentage_dev,
+                    "severity": "HIGH" if abs(raw_pct) > 20 else "MEDIUM",
+                }
+            )
+
+    logger.info("Found %d significant deviations", len(significant_items))
     return significant_items
 
 
 # [User Defined] Function to perform compliance checks
 # [Source] KSERC regulatory requirements
 # [Why] Automated validation against regulatory norms
-def perform_compliance_checks(
-    response: TruingUpResponse
-) -> Dict[str, Any]:
+def perform_compliance_checks(response: TruingUpResponse) -> ComplianceReport:
     """
     [Purpose] Performs regulatory compliance checks on analysis
     [Source] User defined based on KSERC regulations
     [Why] Automates compliance verification per regulatory standards
-    
+
     [Parameters]
     - response: Complete truing up response object
-    
+
     [Returns]
-    - Dict: Compliance check results with pass/fail status
-    
+    - ComplianceReport: Compliance check results with pass/fail status
+      (frozen; shared with the compliance cache; use to_dict() for JSON)
+
     [Checks Performed]
     1. Mathematical accuracy (totals match)
     2. Significant deviation analysis
     3. Overall surplus/deficit assessment
     """
+    # [Comment] Column view is extracted once per call and shared by every check
+    columns = response.financial_columns
+
+    # [Comment] Key on exactly the values the checks
+    #           read: the row columns and the totals
+    # [Why] Serializing the whole response cost more than the checks themselves, and its
+    #       analysis_timestamp made two parses of the same PDF never share a key
+    cache_key = (
+        columns.particulars,
+        columns.arr_approved,
+        columns.trued_up_value,
+        response.total_arr_approved,
+        response.total_trued_up,
+        response.net_surplus_deficit,
+    )
+    cached = COMPLIANCE_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Compliance cache hit for %s", response.licensee_name)
+        return cached
+
     logger.info("Starting compliance checks")
-    
+
     # [Comment] Initialize compliance report
-    compliance_report = {
-        'checks_performed': [],
-        'passed_checks': 0,
-        'failed_checks': 0,
-        'warnings': [],
-        'overall_status': 'COMPLIANT'
-    }
-    
+    checks: List[CheckResult] = []
+    warnings: List[str] = []
+    passed_checks = 0
+    failed_checks = 0
+    overall_status = "COMPLIANT"
+
     # [Comment] Check 1: Mathematical Accuracy
     # [Why] Zero-Error Math is key value proposition
     logger.debug("Check 1: Mathematical accuracy")
-    
+
     # [Comment] Verify totals match sum of individual rows
-    calculated_arr_total = sum(
-        row.arr_approved for row in response.financial_summary
-    )
-    calculated_actual_total = sum(
-        row.trued_up_value for row in response.financial_summary
-    )
-    
+    stats = _column_stats(columns.arr_approved, columns.trued_up_value)
+    calculated_arr_total = stats.total_arr_approved
+    calculated_actual_total = stats.total_trued_up
+
     # [Comment] Allow small floating-point tolerance
     math_check_passed = (
-        abs(calculated_arr_total - (response.total_arr_approved or 0)) < 0.01 and
-        abs(calculated_actual_total - (response.total_trued_up or 0)) < 0.01
+        abs(calculated_arr_total - (response.total_arr_approved or 0)) < 0.01
+        and abs(calculated_actual_total - (response.total_trued_up or 0)) < 0.01
+    )
+
+    checks.append(
+        CheckResult(
+            check_name="Mathematical Accuracy",
+            status="PASS" if math_check_passed else "FAIL",
+            details=(
+                "All totals verified"
+                if math_check_passed
+                else "Total mismatch detected"
+            ),
+        )
     )
-    
-    compliance_report['checks_performed'].append({
-        'check_name': 'Mathematical Accuracy',
-        'status': 'PASS' if math_check_passed else 'FAIL',
-        'details': 'All totals verified' if math_check_passed else 'Total mismatch detected'
-    })
-    
+
     if math_check_passed:
-        compliance_report['passed_checks'] += 1
+        passed_checks += 1
         logger.info("✓ Mathematical accuracy check: PASSED")
     else:
-        compliance_report['failed_checks'] += 1
-        compliance_report['overall_status'] = 'NON_COMPLIANT'
+        failed_checks += 1
+        overall_status = "NON_COMPLIANT"
         logger.error("✗ Mathematical accuracy check: FAILED")
-    
+
     # [Comment] Check 2: Significant Deviations Analysis
     # [Why] Identifies items requiring regulatory attention
     logger.debug("Check 2: Significant deviations")
-    
-    significant_deviations = identify_significant_deviations(
-        response.financial_summary,
-        threshold_percentage=10.0
+
+    significant_deviations = _significant_deviations(columns, threshold_percentage=10.0)
+
+    checks.append(
+        CheckResult(
+            check_name="Significant Deviations",
+            status="WARNING" if significant_deviations else "PASS",
+            details=f"Found {len(significant_deviations)} item(s) with >10% deviation",
+            items=tuple(significant_deviations),
+        )
     )
-    
-    compliance_report['checks_performed'].append({
-        'check_name': 'Significant Deviations',
-        'status': 'WARNING' if significant_deviations else 'PASS',
-        'details': f'Found {len(significant_deviations)} item(s) with >10% deviation',
-        'items': significant_deviations
-    })
-    
+
     if significant_deviations:
-        compliance_report['warnings'].append(
+        warnings.append(
             f"{len(significant_deviations)} items have significant deviations"
         )
-        logger.warning(f"⚠ Found {len(significant_deviations)} significant deviations")
+        logger.warning("⚠ Found %d significant deviations", len(significant_deviations))
     else:
-        compliance_report['passed_checks'] += 1
+        passed_checks += 1
         logger.info("✓ No significant deviations found")
-    
+
     # [Comment] Check 3: Overall Surplus/Deficit Assessment
     # [Why] Determines if licensee is within acceptable range
     logger.debug("Check 3: Surplus/Deficit assessment")
-    
+
     # [Comment] Analyze net surplus/deficit magnitude
     net_amount = response.net_surplus_deficit
-    
+
     # [Comment] Calculate as percentage of total ARR
     total_arr = response.total_arr_approved or 1.0  # [Comment] Avoid division by zero
     surplus_deficit_percentage = (abs(net_amount) / total_arr) * 100
-    
+
     # [Comment] Define acceptable range (e.g., within ±5% is normal)
     acceptable_range = 5.0
-    
-    assessment_status = 'PASS'
-    assessment_details = f"Net surplus/deficit: ₹{net_amount:.2f} Lakhs ({surplus_deficit_percentage:.2f}% of ARR)"
-    
+
+    assessment_status = "PASS"
+    assessment_details = (
+        f"Net surplus/deficit: ₹{net_amount:.2f} Lakhs "
+        f"({surplus_deficit_percentage:.2f}% of ARR)"
+    )
+
     if surplus_deficit_percentage > acceptable_range:
-        assessment_status = 'WARNING'
-        compliance_report['warnings'].append(
-            f"Net surplus/deficit exceeds {acceptable_range}% of ARR"
+        assessment_status = "WARNING"
+        warnings.append(f"Net surplus/deficit exceeds {acceptable_range}% of ARR")
+        logger.warning(
+            "⚠ Surplus/deficit %.2f%% exceeds threshold", surplus_deficit_percentage
         )
-        logger.warning(f"⚠ Surplus/deficit {surplus_deficit_percentage:.2f}% exceeds threshold")
     else:
-        compliance_report['passed_checks'] += 1
+        passed_checks += 1
         logger.info("✓ Surplus/deficit within acceptable range")
-    
-    compliance_report['checks_performed'].append({
-        'check_name': 'Surplus/Deficit Assessment',
-        'status': assessment_status,
-        'details': assessment_details,
-        'percentage_of_arr': round(surplus_deficit_percentage, 2)
-    })
-    
+
+    checks.append(
+        CheckResult(
+            check_name="Surplus/Deficit Assessment",
+            status=assessment_status,
+            details=assessment_details,
+            percentage_of_arr=round(surplus_deficit_percentage, 2),
+        )
+    )
+
+    compliance_report = ComplianceReport(
+        checks_performed=tuple(checks),
+        passed_checks=passed_checks,
+        failed_checks=failed_checks,
+        warnings=tuple(warnings),
+        overall_status=overall_status,
+    )
+
     # [Comment] Generate overall assessment
     logger.info(
-        f"Compliance checks complete - "
-        f"Passed: {compliance_report['passed_checks']}, "
-        f"Failed: {compliance_report['failed_checks']}, "
-        f"Warnings: {len(compliance_report['warnings'])}"
+        "Compliance checks complete - Passed: %d, Failed: %d, Warnings: %d",
+        compliance_report.passed_checks,
+        compliance_report.failed_checks,
+        len(compliance_report.warnings),
     )
-    
+
+    COMPLIANCE_CACHE.set(cache_key, compliance_report)
     return compliance_report
 
 
@@ -252,77 +420,79 @@ def perform_compliance_checks(
 # [Source] Dashboard visualization requirements
 # [Why] Provides executive summary for decision makers
 def generate_analysis_summary(
-    response: TruingUpResponse,
-    compliance_report: Dict[str, Any]
+    response: TruingUpResponse, compliance_report: ComplianceReport
 ) -> Dict[str, Any]:
     """
     [Purpose] Generates executive summary of analysis
     [Source] User defined for dashboard integration
     [Why] Provides quick overview for stakeholders
-    
+
     [Parameters]
     - response: Complete truing up response
     - compliance_report: Results from compliance checks
-    
+
     [Returns]
     - Dict: Executive summary with key insights
     """
     logger.info("Generating analysis summary")
-    
-    # [Comment] Calculate key statistics
-    total_items = len(response.financial_summary)
-    
+
+    # [Comment] Calculate key statistics over the cached column view
+    # [Why] _column_stats is memoized, so this usually reuses the compliance-check pass
+    columns = response.financial_columns
+    stats = _column_stats(columns.arr_approved, columns.trued_up_value)
+    total_items = len(columns.deviation)
+
     # [Comment] Count items by deviation direction
-    overspent_items = sum(
-        1 for row in response.financial_summary if row.deviation > 0
-    )
-    underspent_items = sum(
-        1 for row in response.financial_summary if row.deviation < 0
-    )
-    
+    overspent_items = stats.overspent_items
+    underspent_items = stats.underspent_items
+
     # [Comment] Calculate largest deviation
-    largest_deviation_row = max(
-        response.financial_summary,
-        key=lambda row: abs(row.deviation),
-        default=None
-    )
-    
+    largest_deviation_row = None
+    if stats.largest_deviation_index >= 0:
+        largest_deviation_row = response.financial_summary[
+            stats.largest_deviation_index
+        ]
+
     # [Comment] Build summary dictionary
     summary = {
-        'licensee_name': response.licensee_name,
-        'financial_year': response.financial_year,
-        'analysis_date': response.analysis_timestamp.isoformat() if response.analysis_timestamp else None,
-        
-        'financial_overview': {
-            'total_arr_approved': response.total_arr_approved,
-            'total_trued_up': response.total_trued_up,
-            'net_surplus_deficit': response.net_surplus_deficit,
-            'total_line_items': total_items
+        "licensee_name": response.licensee_name,
+        "financial_year": response.financial_year,
+        "analysis_date": (
+            response.analysis_timestamp.isoformat()
+            if response.analysis_timestamp
+            else None
+        ),
+        "financial_overview": {
+            "total_arr_approved": response.total_arr_approved,
+            "total_trued_up": response.total_trued_up,
+            "net_surplus_deficit": response.net_surplus_deficit,
+            "total_line_items": total_items,
         },
-        
-        'deviation_breakdown': {
-            'overspent_items': overspent_items,
-            'underspent_items': underspent_items,
-            'on_budget_items': total_items - overspent_items - underspent_items
+        "deviation_breakdown": {
+            "overspent_items": overspent_items,
+            "underspent_items": underspent_items,
+            "on_budget_items": total_items - overspent_items - underspent_items,
         },
-        
-        'key_insights': {
-            'largest_deviation': {
-                'particulars': largest_deviation_row.particulars if largest_deviation_row else None,
-                'amount': largest_deviation_row.deviation if largest_deviation_row else None
+        "key_insights": {
+            "largest_deviation": {
+                "particulars": (
+                    largest_deviation_row.particulars if largest_deviation_row else None
+                ),
+                "amount": (
+                    largest_deviation_row.deviation if largest_deviation_row else None
+                ),
             },
-            'compliance_status': compliance_report['overall_status'],
-            'warnings_count': len(compliance_report['warnings'])
+            "compliance_status": compliance_report.overall_status,
+            "warnings_count": len(compliance_report.warnings),
+        },
+        "compliance_summary": {
+            "total_checks": len(compliance_report.checks_performed),
+            "passed": compliance_report.passed_checks,
+            "failed": compliance_report.failed_checks,
+            "warnings": list(compliance_report.warnings),
         },
-        
-        'compliance_summary': {
-            'total_checks': len(compliance_report['checks_performed']),
-            'passed': compliance_report['passed_checks'],
-            'failed': compliance_report['failed_checks'],
-            'warnings': compliance_report['warnings']
-        }
     }
-    
+
     logger.info("Analysis summary generated successfully")
     return summary
 
@@ -335,37 +505,25 @@ def response_to_dataframe(response: TruingUpResponse) -> "pd.DataFrame":
     [Purpose] Converts TruingUpResponse to pandas DataFrame
     [Source] User defined using pandas library
     [Why] DataFrame format enables further analysis and export (Excel, CSV)
-    
+
     [Parameters]
     - response: TruingUpResponse object
-    
+
     [Returns]
     - pd.DataFrame: Financial data in tabular format
-    
+
     [Use Cases]
     - Export to Excel for manual review
     - Further statistical analysis
     - Visualization with matplotlib/seaborn
     """
     logger.debug("Converting response to DataFrame")
-    
-    # [Comment] Extract data from FinancialRow objects
-    data = []
-    for row in response.financial_summary:
-        # [Comment] Convert each FinancialRow to dictionary
-        # [Library] Pydantic model_dump() - Converts model to dict
-        # [Why] pandas works with dictionaries
-        data.append({
-            'Particulars': row.particulars,
-            'ARR Approved (Lakhs)': row.arr_approved,
-            'Trued Up Value (Lakhs)': row.trued_up_value,
-            'Deviation (Lakhs)': row.deviation,
-            'Percentage Deviation': calculate_percentage_deviation(
-                row.arr_approved,
-                row.trued_up_value
-            )
-        })
-    
+
+    # [Comment] Reuse the response's cached column view and memoized percentages
+    # [Why] pandas builds columns directly from sequences, no per-row dicts
+    columns = response.financial_columns
+    percentages = _percentage_deviations(columns.arr_approved, columns.trued_up_value)
+
     # [Library] pandas is imported lazily
     # [Why] Keeps core API usable without pandas installed
     try:
@@ -375,10 +533,23 @@ def response_to_dataframe(response: TruingUpResponse) -> "pd.DataFrame":
             "pandas is not installed. Install it with: pip install pandas==2.2.0"
         ) from e
 
-    # [Library] pd.DataFrame() - Create DataFrame from list of dicts
+    # [Library] pd.array() - Typed column arrays
+    # [Why] Explicit dtypes skip pandas' per-column type inference;
+    #       Particulars stays object dtype, as the row-dict version produced
+    data = {
+        "Particulars": pd.array(columns.particulars, dtype=object),
+        "ARR Approved (Lakhs)": pd.array(columns.arr_approved, dtype="float64"),
+        "Trued Up Value (Lakhs)": pd.array(columns.trued_up_value, dtype="float64"),
+        "Deviation (Lakhs)": pd.array(columns.deviation, dtype="float64"),
+        "Percentage Deviation": pd.array(percentages, dtype="float64"),
+    }
+
+    # [Library] pd.DataFrame() - Create DataFrame from dict of columns
     # [Source] pandas library
-    # [Why] Standard way to create pandas DataFrame
-    df = pd.DataFrame(data)
-    
-    logger.info(f"Created DataFrame with {len(df)} rows")
+    # [Why] copy=False adopts the freshly built arrays instead of copying them
+    df = pd.DataFrame(data, copy=False)
+    # [Comment] One vectorized round for display instead of a round() per row
+    df["Percentage Deviation"] = df["Percentage Deviation"].round(2)
+
+    logger.info("Created DataFrame with %d rows", len(df))
     return df
@@ -2,19 +2,33 @@
 # [Source] User defined based on project PDFs and requirements
 # [Why] Simulates multi-agent regulatory reasoning with separate roles
 
+# [Library] asyncio - Concurrency primitives
+# [Why] Runs the independent agents concurrently
+import asyncio
+
 # [Library] typing - Type hints
 # [Why] Clarity and IDE support
-from typing import Dict, Any, List
+from typing import Any, Dict, List, Optional, Tuple
 
 # [Library] httpx - HTTP client
 # [Why] Calls Hugging Face Inference chat API
 import httpx
 
+# [Library] orjson - Fast JSON serialization
+# [Why] Encodes each request body once; the same
+#       bytes are sent and hashed for the cache key
+import orjson
+
 # [User Defined] Import settings
 # [Source] src/config.py
 # [Why] Access HF endpoint/model/token
 from src.config import settings
 
+# [User Defined] Content-addressed cache
+# [Source] src/utils/cache.py
+# [Why] Identical prompts (repeat submissions, debugging) skip the LLM round-trip
+from src.utils.cache import LRUCache, content_hash
+
 # [User Defined] Import logger
 # [Source] src/utils/logger.py
 # [Why] Trace pipeline steps
@@ -23,105 +37,332 @@ from src.utils.logger import get_logger
 # [User Defined] Get logger instance
 logger = get_logger(__name__)
 
+# [User Defined] LLM completions keyed by a hash of the full request payload
+# [Why] Payload includes model, messages, temperature
+#       and max_tokens, so any change misses
+LLM_RESPONSE_CACHE = LRUCache(maxsize=256)
 
-def hf_chat(messages: List[Dict[str, str]], temperature: float = 0.2, max_tokens: int = 500) -> str:
+
+def _payload(
+    messages: List[Dict[str, str]], temperature: float, max_tokens: int
+) -> Dict[str, Any]:
     """
-    [Purpose] Call Hugging Face OpenAI-compatible chat completions
-    [Why] Single API provider for all agents
+    [Purpose] Build the chat completions request body
     """
-    if not settings.HF_API_TOKEN or not settings.HF_API_MODEL:
-        raise RuntimeError("HF_API_TOKEN or HF_API_MODEL not configured")
-
-    headers = {
-        "Authorization": f"Bearer {settings.HF_API_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    payload = {
+    return {
         "model": settings.HF_API_MODEL,
         "messages": messages,
         "temperature": temperature,
-        "max_tokens": max_tokens
+        "max_tokens": max_tokens,
     }
 
-    response = httpx.post(
-        settings.HF_API_URL,
-        headers=headers,
-        json=payload,
-        timeout=settings.LLM_TIMEOUT_SECONDS
-    )
-    response.raise_for_status()
-    data = response.json()
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    [Purpose] Canonical JSON request body
+    [Why] Sorted keys make equal payloads byte-identical, so the body doubles as the
+          cache key input
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+def _extract_content(data: Dict[str, Any]) -> str:
+    """
+    [Purpose] Pull the first choice's message text out of a completions response
+    """
     choices = data.get("choices", [])
     if not choices:
         return ""
     return choices[0].get("message", {}).get("content", "").strip()
 
 
+# [User Defined] Process-wide pooled AsyncClient for the agent pipeline
+# [Why] A client per pipeline run paid a fresh TCP + TLS handshake on every verdict;
+#       the shared client keeps connections alive
+# across runs and is closed by the app lifespan
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    [Purpose] Return the pooled agent client, creating it on first use
+    [Why] Lazy so importing the module opens nothing; the event loop is single-threaded,
+          so no lock is needed around creation
+    [Library] h2 - Required by httpx for http2=True (see requirements.txt); HTTP/2
+              multiplexes the concurrent agent calls over a single connection
+    """
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            headers=settings.llm.headers,
+        )
+    return _ASYNC_CLIENT
+
+
+async def aclose_client() -> None:
+    """
+    [Purpose] Close the pooled agent client
+    [Why] Called from the FastAPI lifespan shutdown so sockets are released cleanly
+    """
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is not None:
+        client, _ASYNC_CLIENT = _ASYNC_CLIENT, None
+        await client.aclose()
+
+
+async def hf_chat_async(
+    client: httpx.AsyncClient,
+    messages: List[Dict[str, str]],
+    temperature: float = 0.2,
+    max_tokens: int = 500,
+    bypass_cache: bool = False,
+) -> str:
+    """
+    [Purpose] Call Hugging Face OpenAI-compatible chat completions on a
+              caller-supplied AsyncClient
+    [Why] Single API provider for all agents; independent agents share one connection
+          pool without blocking the event loop
+    [Note] bypass_cache=True forces a fresh call (the result still refreshes the cache)
+    """
+    if not settings.HF_API_TOKEN or not settings.HF_API_MODEL:
+        raise RuntimeError("HF_API_TOKEN or HF_API_MODEL not configured")
+
+    body = _encode_payload(_payload(messages, temperature, max_tokens))
+    key = content_hash(body)
+    if not bypass_cache:
+        cached = LLM_RESPONSE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    response = await client.post(
+        settings.llm.parsed_url,
+        headers=settings.llm.headers,
+        content=body,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+    )
+    response.raise_for_status()
+    content = _extract_content(orjson.loads(response.content))
+    # [Why] Empty output is treated as a failure by callers, so it is not worth pinning
+    if content:
+        LLM_RESPONSE_CACHE.set(key, content)
+    return content
+
+
 def build_context_block(rag_snippets: List[Dict[str, Any]]) -> str:
     """
     [Purpose] Convert RAG snippets to a compact context block
     [Why] Keeps prompts compact and traceable
     """
-    lines = []
-    for s in rag_snippets:
-        loc = f"{s.get('source')} p.{s.get('page')}" if s.get("page") else s.get("source")
-        lines.append(f"[{loc}] {s.get('text')}")
-    return "\n\n".join(lines)
 
+    def _fmt(snippet: Dict[str, Any]) -> str:
+        get = snippet.get
+        page = get("page")
+        source = get("source")
+        loc = f"{source} p.{page}" if page else source
+        return f"[{loc}] {get('text')}"
 
-def run_four_agent_pipeline(
+    # [Why] map() feeds join directly; no intermediate list of lines
+    return "\n\n".join(map(_fmt, rag_snippets))
+
+
+def _serialize_facts(base_facts: Dict[str, Any]) -> str:
+    """
+    [Purpose] Render the facts block once for every agent prompt
+    [Why] str(dict) was re-run per prompt and depends on insertion order;
+          sorted compact JSON is built once and keeps prompt bytes stable for the LLM
+          cache
+    """
+    return orjson.dumps(
+        base_facts, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _specialist_prompts(
+    context: str, facts: str
+) -> Tuple[List[Dict[str, str]], List[Dict[str, str]], List[Dict[str, str]]]:
+    """
+    [Purpose] Build the Legal, Forensic and Technical agent prompts
+    [Why] All three prompts reference the same context/facts strings
+    """
+    legal_prompt = [
+        {
+            "role": "system",
+            "content": (
+                "You are the KSERC Legal Brain agent. Extract regulatory rules, cite "
+                "relevant clauses, and list compliance risks."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"RAG Context:\n{context}\n\nFacts:\n{facts}\n\nReturn:\n- key rules\n"
+                "- compliance risks\n- citations with source/page."
+            ),
+        },
+    ]
+    forensic_prompt = [
+        {
+            "role": "system",
+            "content": (
+                "You are the KSERC Forensic Auditor agent. Validate expense prudence "
+                "and inflation adjustments using given context."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"RAG Context:\n{context}\n\nFacts:\n{facts}\n\nReturn:\n- suspicious "
+                "expenses\n- inflation/prudence checks\n- citations."
+            ),
+        },
+    ]
+    technical_prompt = [
+        {
+            "role": "system",
+            "content": (
+                "You are the KSERC Technical Validator agent. Check math consistency "
+                "and deviations against ARR."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Facts:\n{facts}\n\nReturn:\n- math inconsistencies\n- top deviations"
+                "\n- recommended corrections."
+            ),
+        },
+    ]
+    return legal_prompt, forensic_prompt, technical_prompt
+
+
+def _verdict_prompt(
+    legal_output: str, forensic_output: str, technical_output: str, facts: str
+) -> List[Dict[str, str]]:
+    """
+    [Purpose] Build the Chief Regulatory Officer prompt
+    [Why] Agent 4 depends on the outputs of Agents 1-3
+    """
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are the KSERC Chief Regulatory Officer. Produce final verdict on "
+                "approvals and disallowances. Be decisive and structured."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Inputs:\nLegal:\n{legal_output}\n\nForensic:\n{forensic_output}\n\n"
+                f"Technical:\n{technical_output}\n\nFacts:\n{facts}\n\nReturn "
+                "JSON-like text with:\n- approved_items\n- disallowed_items\n- "
+                "conditions\n- final_summary (5-7 sentences)."
+            ),
+        },
+    ]
+
+
+def _fallback_verdict(compliance_report: Dict[str, Any]) -> str:
+    """
+    [Purpose] Deterministic verdict built from the compliance report alone
+    [Why] Used when an analysis agent returns nothing, so Agent 4 is not
+          called with empty sections
+    """
+    deviation_items: List[Dict[str, Any]] = []
+    for check in compliance_report.get("checks_performed", []):
+        if check.get("check_name") == "Significant Deviations":
+            deviation_items = check.get("items", [])
+            break
+
+    conditions = [
+        f"Licensee to justify {item['particulars']} "
+        f"({item['percentage_deviation']}% deviation, {item['severity']} severity)."
+        for item in deviation_items
+    ]
+    status = compliance_report.get("overall_status", "UNKNOWN")
+    summary = (
+        f"Automated compliance status: {status}. "
+        f"{len(deviation_items)} item(s) exceed the 10% deviation threshold. "
+        "The regulatory analysis agents returned no output, so no items were "
+        "approved or disallowed; this provisional verdict needs manual review."
+    )
+    return orjson.dumps(
+        {
+            "approved_items": [],
+            "disallowed_items": [],
+            "conditions": conditions,
+            "final_summary": summary,
+        }
+    ).decode()
+
+
+async def run_four_agent_pipeline(
     arr_analysis: Dict[str, Any],
     truing_analysis: Dict[str, Any],
     compliance_report: Dict[str, Any],
-    rag_snippets: List[Dict[str, Any]]
+    rag_snippets: List[Dict[str, Any]],
 ) -> Dict[str, Any]:
     """
-    [Purpose] Run 4-agent pipeline and return structured outputs
-    [Why] Produces final verdict and intermediate reasoning
+    [Purpose] Run 4-agent pipeline with Agents 1-3 running concurrently
+    [Why] Agents 1-3 only share context and facts, so wall time drops from
+          t1+t2+t3+t4 to max(t1, t2, t3)+t4
     """
     context = build_context_block(rag_snippets)
 
     base_facts = {
         "arr_analysis": arr_analysis,
         "truing_up_analysis": truing_analysis,
-        "compliance_report": compliance_report
+        "compliance_report": compliance_report,
     }
+    facts = _serialize_facts(base_facts)
+    legal_prompt, forensic_prompt, technical_prompt = _specialist_prompts(
+        context, facts
+    )
 
-    # Agent 1: Legal Brain (regulations)
-    logger.info("Agent 1: Legal Brain")
-    legal_prompt = [
-        {"role": "system", "content": "You are the KSERC Legal Brain agent. Extract regulatory rules, cite relevant clauses, and list compliance risks."},
-        {"role": "user", "content": f"RAG Context:\n{context}\n\nFacts:\n{base_facts}\n\nReturn:\n- key rules\n- compliance risks\n- citations with source/page."}
-    ]
-    legal_output = hf_chat(legal_prompt, temperature=0.1, max_tokens=500)
+    # [Note] All four agents, and every later run,
+    #        share the process-wide connection pool
+    client = _get_async_client()
 
-    # Agent 2: Forensic Auditor (inflation/prudence)
-    logger.info("Agent 2: Forensic Auditor")
-    forensic_prompt = [
-        {"role": "system", "content": "You are the KSERC Forensic Auditor agent. Validate expense prudence and inflation adjustments using given context."},
-        {"role": "user", "content": f"RAG Context:\n{context}\n\nFacts:\n{base_facts}\n\nReturn:\n- suspicious expenses\n- inflation/prudence checks\n- citations."}
-    ]
-    forensic_output = hf_chat(forensic_prompt, temperature=0.2, max_tokens=500)
+    # Agents 1-3: Legal Brain, Forensic Auditor, Technical Validator
+    logger.info("Agents 1-3: Legal Brain, Forensic Auditor, Technical Validator")
+    legal_output, forensic_output, technical_output = await asyncio.gather(
+        hf_chat_async(client, legal_prompt, temperature=0.1, max_tokens=500),
+        hf_chat_async(client, forensic_prompt, temperature=0.2, max_tokens=500),
+        hf_chat_async(client, technical_prompt, temperature=0.2, max_tokens=400),
+    )
 
-    # Agent 3: Technical Validator (math & deviations)
-    logger.info("Agent 3: Technical Validator")
-    technical_prompt = [
-        {"role": "system", "content": "You are the KSERC Technical Validator agent. Check math consistency and deviations against ARR."},
-        {"role": "user", "content": f"Facts:\n{base_facts}\n\nReturn:\n- math inconsistencies\n- top deviations\n- recommended corrections."}
-    ]
-    technical_output = hf_chat(technical_prompt, temperature=0.2, max_tokens=400)
+    # [Comment] Skip Agent 4 when any analysis agent came back empty
+    # [Why] Saves a full LLM round-trip on the error path; the caller sees "fallback"
+    if not (legal_output and forensic_output and technical_output):
+        logger.warning(
+            "Agent output missing; building fallback verdict from compliance report"
+        )
+        return {
+            "legal_brain": legal_output,
+            "forensic_auditor": forensic_output,
+            "technical_validator": technical_output,
+            "chief_regulatory_officer": _fallback_verdict(compliance_report),
+            "fallback": True,
+        }
 
     # Agent 4: Chief Regulatory Officer (final verdict)
     logger.info("Agent 4: Chief Regulatory Officer")
-    verdict_prompt = [
-        {"role": "system", "content": "You are the KSERC Chief Regulatory Officer. Produce final verdict on approvals and disallowances. Be decisive and structured."},
-        {"role": "user", "content": f"Inputs:\nLegal:\n{legal_output}\n\nForensic:\n{forensic_output}\n\nTechnical:\n{technical_output}\n\nFacts:\n{base_facts}\n\nReturn JSON-like text with:\n- approved_items\n- disallowed_items\n- conditions\n- final_summary (5-7 sentences)."}
-    ]
-    verdict_output = hf_chat(verdict_prompt, temperature=0.1, max_tokens=700)
+    verdict_prompt = _verdict_prompt(
+        legal_output, forensic_output, technical_output, facts
+    )
+    verdict_output = await hf_chat_async(
+        client, verdict_prompt, temperature=0.1, max_tokens=700
+    )
 
     return {
         "legal_brain": legal_output,
         "forensic_auditor": forensic_output,
         "technical_validator": technical_output,
-        "chief_regulatory_officer": verdict_output
+        "chief_regulatory_officer": verdict_output,
     }
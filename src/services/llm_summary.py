@@ -2,19 +2,36 @@
 # [Source] User defined integration with Hugging Face Inference API
 # [Why] Provides optional natural-language summaries without paid APIs
 
+# [Library] asyncio - Non-blocking sleep
+# [Why] Backoff between retry attempts without stalling the event loop
+import asyncio
+
+# [Library] dataclasses - Slotted record for the extracted summary fields
+# [Why] Fields are read once per request and shared by the LLM prompt and local fallback
+from dataclasses import dataclass
+
 # [Library] typing - Type hints for clarity
 # [Why] Enables IDE support and explicit return types
-from typing import Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # [Library] httpx - HTTP client for API calls
 # [Why] Lightweight async-capable HTTP client
 import httpx
 
+# [Library] orjson - Fast JSON serialization
+# [Why] Canonical request bytes for the summary cache key
+import orjson
+
 # [User Defined] Import configuration settings
 # [Source] src/config.py
 # [Why] Access API token, model, and timeout
 from src.config import settings
 
+# [User Defined] Import content-hash cache helpers
+# [Source] src/utils/cache.py
+# [Why] Re-uploads, retries and polling re-request identical summaries
+from src.utils.cache import LRUCache, content_hash
+
 # [User Defined] Import logger
 # [Source] src/utils/logger.py
 # [Why] Logs summary generation status
@@ -23,17 +40,129 @@ from src.utils.logger import get_logger
 # [User Defined] Get logger instance
 logger = get_logger(__name__)
 
+# [User Defined] Successful LLM summaries keyed by hash of the request payload
+# [Why] One dict lookup replaces an HTTPS round trip + inference for repeated prompts
+SUMMARY_CACHE = LRUCache(maxsize=512)
 
-# [User Defined] Build a prompt from analysis data
-# [Source] User defined prompt template
-# [Why] Keeps LLM input consistent and focused
-def build_summary_prompt(
-    analysis: Dict[str, Any],
-    compliance_report: Optional[Dict[str, Any]] = None
-) -> str:
+# [User Defined] Shared AsyncClient for summary requests
+# [Why] Keep-alive reuse avoids a TCP + TLS handshake
+#       per summary; closed by the app lifespan;
+#       HTTP/2 multiplexes concurrent summaries over one connection
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    [Purpose] Return the pooled summary client, creating it on first use
+    [Why] Lazy so importing the module opens nothing; the event loop is single-threaded,
+          so no lock is needed around creation
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        # [Library] http2=True - Requires the h2 package (requirements.txt);
+        #           falls back to HTTP/1.1 if the server does not negotiate h2
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            headers=settings.llm.headers,
+        )
+    return _CLIENT
+
+
+async def warm_client() -> None:
+    """
+    [Purpose] Open a pooled connection to the LLM endpoint ahead of the first summary
+    [Why] Called from the FastAPI lifespan startup so the first user request does not
+          pay the DNS + TCP + TLS handshake; the response itself is ignored
+    """
+    if not settings.HF_API_TOKEN:
+        return
+    try:
+        await _get_client().head(settings.llm.parsed_url, timeout=5.0)
+    except Exception as e:
+        logger.warning("LLM client warm-up failed: %s", e)
+
+
+async def aclose_client() -> None:
+    """
+    [Purpose] Close the pooled summary client
+    [Why] Called from the FastAPI lifespan shutdown so sockets are released cleanly
+    """
+    global _CLIENT
+    if _CLIENT is not None:
+        client, _CLIENT = _CLIENT, None
+        await client.aclose()
+
+
+# [User Defined] Responses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+async def _post_with_retries(body: bytes) -> httpx.Response:
+    """
+    [Purpose] POST a summary request with a tight per-attempt timeout and retries
+    [Why] A straggling free-tier call is abandoned and retried instead of holding the
+          request for the full LLM timeout; 429/5xx get another chance before fallback
+    """
+    timeout = httpx.Timeout(
+        connect=3.0, read=float(settings.LLM_PER_ATTEMPT_TIMEOUT), write=3.0, pool=3.0
+    )
+    attempts = max(settings.LLM_MAX_RETRIES, 0) + 1
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            response = await _get_client().post(
+                settings.llm.parsed_url, content=body, timeout=timeout
+            )
+        except httpx.TimeoutException:
+            if last_attempt:
+                raise
+            logger.warning("Summary attempt %d timed out; retrying", attempt + 1)
+        else:
+            if response.status_code not in _RETRYABLE_STATUS or last_attempt:
+                return response
+            logger.warning(
+                "Summary attempt %d returned %d; retrying",
+                attempt + 1,
+                response.status_code,
+            )
+        # [Comment] Exponential backoff: 0.5s, 1s, 2s, ...
+        await asyncio.sleep(0.5 * 2**attempt)
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+# [User Defined] Static instructions shared by every summary request
+# [Why] Identical prefix across calls; providers with prompt caching can reuse it
+SUMMARY_SYSTEM_PROMPT = (
+    "You are an energy regulatory analyst. "
+    "Write a concise executive summary (5-7 sentences) for a truing-up analysis. "
+    "Be precise, avoid fluff, and highlight key deviations and compliance risks."
+)
+
+
+# [User Defined] Fields the summary prompt and local summary are built from
+@dataclass(frozen=True, slots=True)
+class _SummaryFields:
+    licensee: Any
+    financial_year: Any
+    net: Any
+    total_arr: Any
+    total_trued: Any
+    item_count: int
+    compliance_status: Any
+    warnings_count: int
+
+
+def _summary_fields(
+    analysis: Dict[str, Any], compliance_report: Optional[Dict[str, Any]] = None
+) -> _SummaryFields:
     """
-    [Purpose] Builds a summary prompt for the LLM
-    [Why] Ensures the LLM receives concise, structured input
+    [Purpose] Read the summary fields from the analysis and compliance report once
+    [Why] generate_summary may need both the LLM prompt and the local fallback
     """
     licensee = analysis.get("licensee_name", "Unknown")
     financial_year = analysis.get("financial_year", "Unknown")
@@ -50,54 +179,98 @@ def build_summary_prompt(
         warnings = compliance_report.get("warnings", [])
         warnings_count = len(warnings) if isinstance(warnings, list) else 0
 
-    prompt = (
-        "You are an energy regulatory analyst. "
-        "Write a concise executive summary (5-7 sentences) for a truing-up analysis. "
-        "Be precise, avoid fluff, and highlight key deviations and compliance risks.\n\n"
-        f"Licensee: {licensee}\n"
-        f"Financial Year: {financial_year}\n"
-        f"Total ARR Approved (Lakhs): {total_arr}\n"
-        f"Total Trued Up (Lakhs): {total_trued}\n"
-        f"Net Surplus/Deficit (Lakhs): {net}\n"
-        f"Total Line Items: {item_count}\n"
-        f"Compliance Status: {compliance_status}\n"
-        f"Warnings Count: {warnings_count}\n"
+    return _SummaryFields(
+        licensee,
+        financial_year,
+        net,
+        total_arr,
+        total_trued,
+        item_count,
+        compliance_status,
+        warnings_count,
+    )
+
+
+# [User Defined] Build a prompt from analysis data
+# [Source] User defined prompt template
+# [Why] Keeps LLM input consistent and focused
+def build_summary_prompt(
+    analysis: Dict[str, Any], compliance_report: Optional[Dict[str, Any]] = None
+) -> Tuple[str, str]:
+    """
+    [Purpose] Builds the (static system, per-analysis user) prompt pair for the LLM
+    [Why] Ensures the LLM receives concise, structured input; the split lets
+          the static part be cached by the provider
+    """
+    return _prompt_from_fields(_summary_fields(analysis, compliance_report))
+
+
+def _prompt_from_fields(fields: _SummaryFields) -> Tuple[str, str]:
+    """
+    [Purpose] build_summary_prompt over already extracted fields
+    """
+    user_text = (
+        f"Licensee: {fields.licensee}\n"
+        f"Financial Year: {fields.financial_year}\n"
+        f"Total ARR Approved (Lakhs): {fields.total_arr}\n"
+        f"Total Trued Up (Lakhs): {fields.total_trued}\n"
+        f"Net Surplus/Deficit (Lakhs): {fields.net}\n"
+        f"Total Line Items: {fields.item_count}\n"
+        f"Compliance Status: {fields.compliance_status}\n"
+        f"Warnings Count: {fields.warnings_count}\n"
         "Return only the summary text."
     )
-    return prompt
+    return SUMMARY_SYSTEM_PROMPT, user_text
+
+
+def _summary_messages(system_text: str, user_text: str) -> List[Dict[str, Any]]:
+    """
+    [Purpose] Chat messages for a summary request
+    [Why] With LLM_PROMPT_CACHE the static block is sent as a cacheable system part;
+          otherwise the original single flat user message is kept
+    """
+    if settings.LLM_PROMPT_CACHE:
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": system_text,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            },
+            {"role": "user", "content": user_text},
+        ]
+    return [{"role": "user", "content": f"{system_text}\n\n{user_text}"}]
 
 
 # [User Defined] Local fallback summary when LLM is unavailable
 # [Source] User defined rule-based summary
 # [Why] Guarantees response even without API access
 def build_local_summary(
-    analysis: Dict[str, Any],
-    compliance_report: Optional[Dict[str, Any]] = None
+    analysis: Dict[str, Any], compliance_report: Optional[Dict[str, Any]] = None
 ) -> str:
     """
     [Purpose] Creates a deterministic summary without external APIs
     [Why] Ensures the endpoint always returns a usable response
     """
-    licensee = analysis.get("licensee_name", "Unknown")
-    financial_year = analysis.get("financial_year", "Unknown")
-    net = analysis.get("net_surplus_deficit", 0.0)
-    total_arr = analysis.get("total_arr_approved", 0.0)
-    total_trued = analysis.get("total_trued_up", 0.0)
-    items = analysis.get("financial_summary", [])
-    item_count = len(items) if isinstance(items, list) else 0
+    return _local_summary_from_fields(_summary_fields(analysis, compliance_report))
 
-    compliance_status = "UNKNOWN"
-    warnings_count = 0
-    if isinstance(compliance_report, dict):
-        compliance_status = compliance_report.get("overall_status", "UNKNOWN")
-        warnings = compliance_report.get("warnings", [])
-        warnings_count = len(warnings) if isinstance(warnings, list) else 0
 
+def _local_summary_from_fields(fields: _SummaryFields) -> str:
+    """
+    [Purpose] build_local_summary over already extracted fields
+    """
     return (
-        f"Analysis for {licensee} ({financial_year}) processed {item_count} line items. "
-        f"Total ARR approved is ₹{total_arr:.2f} Lakhs and total trued-up is ₹{total_trued:.2f} Lakhs. "
-        f"The net surplus/deficit is ₹{net:.2f} Lakhs. "
-        f"Compliance status is {compliance_status} with {warnings_count} warning(s). "
+        f"Analysis for {fields.licensee} ({fields.financial_year}) processed "
+        f"{fields.item_count} line items. "
+        f"Total ARR approved is ₹{fields.total_arr:.2f} Lakhs and total trued-up is "
+        f"₹{fields.total_trued:.2f} Lakhs. "
+        f"The net surplus/deficit is ₹{fields.net:.2f} Lakhs. "
+        f"Compliance status is {fields.compliance_status} with "
+        f"{fields.warnings_count} warning(s). "
         "Review significant deviations for regulatory follow-up."
     )
 
@@ -105,48 +278,56 @@ def build_local_summary(
 # [User Defined] Generate summary via Hugging Face Inference API (free tier)
 # [Source] User defined integration
 # [Why] Provides AI-enhanced executive summary
-def generate_summary(
-    analysis: Dict[str, Any],
-    compliance_report: Optional[Dict[str, Any]] = None
+async def generate_summary(
+    analysis: Dict[str, Any], compliance_report: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     [Purpose] Generates a summary using Hugging Face Inference API
     [Why] Free-tier API provides LLM output with minimal setup
     """
-    prompt = build_summary_prompt(analysis, compliance_report)
+    # [Comment] Extract the fields once; the prompt and any local fallback share them
+    fields = _summary_fields(analysis, compliance_report)
 
     if not settings.HF_API_TOKEN or not settings.HF_API_MODEL:
-        logger.warning("HF_API_TOKEN or HF_API_MODEL not set. Falling back to local summary.")
+        logger.warning(
+            "HF_API_TOKEN or HF_API_MODEL not set. Falling back to local summary."
+        )
         return {
-            "summary": build_local_summary(analysis, compliance_report),
+            "summary": _local_summary_from_fields(fields),
             "provider": "local",
             "model": "rule-based",
-            "warning": "HF_API_TOKEN or HF_API_MODEL not set; using local summary."
+            "warning": "HF_API_TOKEN or HF_API_MODEL not set; using local summary.",
         }
 
-    headers = {
-        "Authorization": f"Bearer {settings.HF_API_TOKEN}",
-        "Content-Type": "application/json"
-    }
+    system_text, user_text = _prompt_from_fields(fields)
     payload = {
         "model": settings.HF_API_MODEL,
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
+        "messages": _summary_messages(system_text, user_text),
         "temperature": 0.2,
-        "max_tokens": 220
+        "max_tokens": 220,
     }
 
+    # [Library] orjson.dumps() - Encode the request body once, as UTF-8 bytes
+    # [Why] The same bytes are the cache key (model, prompt and sampling parameters) and
+    #       the POST body; Content-Type is already set on the shared client
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    cache_key = content_hash(body)
+    cached = SUMMARY_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Summary cache hit for %s", cache_key)
+        return {**cached, "cached": True}
+
     try:
         logger.info("Requesting summary from Hugging Face Inference API")
-        response = httpx.post(
-            settings.HF_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=settings.LLM_TIMEOUT_SECONDS
+        # [Library] asyncio.wait_for() - Overall deadline across all retry attempts
+        # [Why] Retries must not stretch a summary past LLM_TIMEOUT_SECONDS
+        response = await asyncio.wait_for(
+            _post_with_retries(body), settings.LLM_TIMEOUT_SECONDS
         )
         response.raise_for_status()
-        data = response.json()
+        # [Library] orjson.loads() - Parse the raw response
+        #           bytes without decoding to str first
+        data = orjson.loads(response.content)
 
         summary_text = ""
         if isinstance(data, dict):
@@ -158,23 +339,27 @@ def generate_summary(
         if not summary_text:
             logger.warning("Empty LLM response. Using local summary.")
             return {
-                "summary": build_local_summary(analysis, compliance_report),
+                "summary": _local_summary_from_fields(fields),
                 "provider": "local",
                 "model": "rule-based",
-                "warning": "LLM returned empty output; using local summary."
+                "warning": "LLM returned empty output; using local summary.",
             }
 
-        return {
+        result = {
             "summary": summary_text.strip(),
             "provider": "huggingface",
-            "model": settings.HF_API_MODEL
+            "model": settings.HF_API_MODEL,
         }
+        # [Why] Only real LLM output is cached; local
+        #       fallbacks should retry the API next time
+        SUMMARY_CACHE.set(cache_key, result)
+        return result
 
     except Exception as e:
-        logger.error(f"LLM summary failed: {str(e)}", exc_info=True)
+        logger.error("LLM summary failed: %s", e, exc_info=True)
         return {
-            "summary": build_local_summary(analysis, compliance_report),
+            "summary": _local_summary_from_fields(fields),
             "provider": "local",
             "model": "rule-based",
-            "warning": "LLM request failed; using local summary."
+            "warning": "LLM request failed; using local summary.",
         }
@@ -1,28 +1,52 @@
 # [Purpose] PDF ingestion and extraction service for KSERC regulatory orders
-# [Source] Logic derived from 'ARA_Autonomous_Regulatory_Compliance_compressed.pdf' (Data Ingestion Phase)
+# [Source] Logic derived from 'ARA_Autonomous_Regulatory_Compliance_compressed.pdf'
+#          (Data Ingestion Phase)
 # [Why] Core functionality for extracting financial data from KSERC PDFs
 
-# [Library] pdfplumber - PDF extraction library specialized for tables
-# [Source] https://github.com/jsvine/pdfplumber
-# [Why] Superior to PyPDF2 for extracting structured tables with preserved layout
-import pdfplumber
-
 # [Library] io - Core tools for working with streams
-# [Why] FastAPI provides file as bytes; pdfplumber needs a file-like stream object
+# [Why] Raw bytes must be wrapped in a file-like stream object for pdfplumber
 import io
 
+# [Library] logging - Level constants
+# [Why] Guard per-cell/per-page debug logs with logger.isEnabledFor()
+import logging
+
 # [Library] re - Regular expression operations
 # [Why] Pattern matching for extracting metadata (licensee name, year) from text
 import re
 
+# [Library] sys.intern - Stores one canonical copy of a string
+# [Why] Line-item names repeat across ARR/Truing Up orders and cached parses
+from sys import intern
+
 # [Library] typing - Type hints for better code documentation
 # [Why] Improves code readability and enables IDE type checking
-from typing import List, Optional, Dict, Any
+from typing import Any, BinaryIO, List, Optional, Tuple, Union
+
+# [Library] pdfplumber - PDF extraction library specialized for tables
+# [Source] https://github.com/jsvine/pdfplumber
+# [Why] Superior to PyPDF2 for extracting structured tables with preserved layout
+import pdfplumber
+
+# [Library] pdfplumber.table.TableSettings - Resolved table-finder settings
+# [Why] Same defaults page.extract_tables() uses, for the find_tables()/extract() split
+from pdfplumber.table import TableSettings
+
+# [User Defined] Import streaming read size and settings
+# [Source] src/config.py
+# [Why] Hash streams with the same chunk size the API uses for uploads;
+#       METADATA_PAGES bounds the header text scan
+from src.config import UPLOAD_CHUNK_SIZE, settings
 
 # [User Defined] Import Pydantic models for type-safe responses
 # [Source] src/models/schemas.py
 # [Why] Ensures output matches API contract
-from src.models.schemas import TruingUpResponse, FinancialRow
+from src.models.schemas import FinancialRow, TruingUpResponse
+
+# [User Defined] Import content-hash cache helpers
+# [Source] src/utils/cache.py
+# [Why] Skip re-parsing PDFs that clients re-submit
+from src.utils.cache import LRUCache, content_hash, content_hasher
 
 # [User Defined] Import logger for tracking processing steps
 # [Source] src/utils/logger.py
@@ -33,6 +57,17 @@ from src.utils.logger import get_logger
 # [Why] Enables logging specific to PDF ingestion operations
 logger = get_logger(__name__)
 
+# [User Defined] Parsed orders keyed by BLAKE2b digest of the PDF bytes
+# [Why] Parsing dominates request time; identical uploads yield identical results
+PARSE_CACHE = LRUCache(maxsize=64)
+
+
+# [User Defined] Precompiled helpers for clean_currency (called once per table cell)
+# [Why] One C-level translate pass replaces chained
+#       replace() calls; the regex is compiled once
+_NUMBER_RE = re.compile(r"[-+]?\d*\.?\d+")
+_CURRENCY_STRIP_TABLE = str.maketrans("", "", ",₹")
+
 
 # [User Defined] Function to clean currency strings from PDF text
 # [Source] Custom implementation for handling Indian Rupee formatting
@@ -42,43 +77,51 @@ def clean_currency(value_str: str) -> float:
     [Purpose] Converts currency string to float number
     [Source] User defined utility function
     [Why] PDF extraction returns strings; we need floats for calculations
-    
+
     [Parameters]
     - value_str: Currency string like "1,234.56" or "12.5 Lakhs"
-    
+
     [Returns]
     - float: Cleaned numeric value
-    
+
     [Example]
     clean_currency("1,234.56") -> 1234.56
     clean_currency("234") -> 234.0
     """
     # [Comment] Log the input for debugging purposes
-    logger.debug(f"Cleaning currency string: {value_str}")
-    
+    # [Why] Called once per table cell; skip the
+    #       logging call entirely unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Cleaning currency string: %s", value_str)
+
     try:
-        # [Comment] Remove common formatting characters (commas, spaces, rupee symbols)
+        # [Comment] Remove common formatting characters (commas, rupee symbols)
         # [Why] These characters prevent float conversion
-        cleaned = value_str.replace(',', '').replace('₹', '').strip()
-        
+        cleaned = value_str.translate(_CURRENCY_STRIP_TABLE)
+
         # [Comment] Handle cases like "234.56 Lakhs" by removing text
-        # [Library] re.search() - Find first numeric pattern
+        # [Library] Pattern.search() - Find first numeric pattern
         # [Why] Extracts just the number from mixed text
-        numeric_match = re.search(r'[-+]?\d*\.?\d+', cleaned)
-        if numeric_match:
-            cleaned = numeric_match.group()
-        
+        numeric_match = _NUMBER_RE.search(cleaned)
+
         # [Library] float() - Convert string to floating-point number
-        # [Why] Required for mathematical operations
-        return float(cleaned)
-    
+        # [Why] Required for mathematical operations; float()
+        #       itself ignores surrounding whitespace
+        return float(numeric_match.group() if numeric_match else cleaned)
+
     except (ValueError, AttributeError) as e:
         # [Comment] Log error and return 0.0 as safe fallback
         # [Why] Prevents crashes from unparseable data
-        logger.warning(f"Could not parse currency '{value_str}': {e}")
+        logger.warning("Could not parse currency '%s': %s", value_str, e)
         return 0.0
 
 
+# [User Defined] Precompiled metadata patterns
+# [Pattern] "M/s [Company Name]" and "year/FY/F.Y. YYYY-YY", as used in KSERC headers
+_LICENSEE_RE = re.compile(r"M/s\s+([A-Za-z0-9\s&.,()-]+)", re.IGNORECASE)
+_FINANCIAL_YEAR_RE = re.compile(r"(?:year|FY|F\.Y\.?)\s+(\d{4}-\d{2})", re.IGNORECASE)
+
+
 # [User Defined] Function to extract licensee name from PDF text
 # [Source] Pattern observed in KSERC orders (M/s [Company Name])
 # [Why] Automates extraction of licensee identity
@@ -87,29 +130,29 @@ def extract_licensee_name(text: str) -> str:
     [Purpose] Extracts licensee company name from PDF text
     [Source] User defined pattern matching based on KSERC order format
     [Why] Identifies which company the order pertains to
-    
+
     [Parameters]
     - text: Full text content from PDF
-    
+
     [Returns]
     - str: Licensee name or "Unknown Licensee" if not found
-    
+
     [Pattern] Matches "M/s [Company Name]" common in KSERC headers
     """
     # [Comment] Log extraction attempt
     logger.debug("Extracting licensee name from PDF text")
-    
-    # [Library] re.search() - Search for pattern in text
+
+    # [Library] Pattern.search() - Search for pattern in text (stops at the first match)
     # [Pattern] M/s followed by alphanumeric characters and spaces
     # [Why] Standard format in KSERC orders
-    name_match = re.search(r"M/s\s+([A-Za-z0-9\s&.,()-]+)", text, re.IGNORECASE)
-    
+    name_match = _LICENSEE_RE.search(text)
+
     if name_match:
         # [Comment] Extract and clean the matched company name
         licensee_name = name_match.group(1).strip()
-        logger.info(f"Extracted licensee name: {licensee_name}")
+        logger.info("Extracted licensee name: %s", licensee_name)
         return licensee_name
-    
+
     # [Comment] Fallback: Return default if pattern not found
     logger.warning("Could not extract licensee name, using default")
     return "Unknown Licensee"
@@ -123,82 +166,97 @@ def extract_financial_year(text: str) -> str:
     [Purpose] Extracts financial year from PDF text
     [Source] User defined pattern matching based on KSERC format
     [Why] Identifies the fiscal year of the truing up exercise
-    
+
     [Parameters]
     - text: Full text content from PDF
-    
+
     [Returns]
     - str: Financial year in "YYYY-YY" format or "Unknown" if not found
-    
+
     [Pattern] Matches patterns like "year 2023-24" or "FY 2023-24"
     """
     # [Comment] Log extraction attempt
     logger.debug("Extracting financial year from PDF text")
-    
-    # [Library] re.search() - Search for year pattern
+
+    # [Library] Pattern.search() - Search for year pattern (stops at the first match)
     # [Pattern] "year" followed by YYYY-YY format
     # [Why] Standard financial year format in India
-    year_match = re.search(r"(?:year|FY|F\.Y\.?)\s+(\d{4}-\d{2})", text, re.IGNORECASE)
-    
+    year_match = _FINANCIAL_YEAR_RE.search(text)
+
     if year_match:
         # [Comment] Extract the matched year string
         financial_year = year_match.group(1)
-        logger.info(f"Extracted financial year: {financial_year}")
+        logger.info("Extracted financial year: %s", financial_year)
         return financial_year
-    
+
     # [Comment] Fallback: Return default if pattern not found
     logger.warning("Could not extract financial year, using default")
     return "Unknown"
 
 
-# [User Defined] Function to extract financial tables from PDF
-# [Source] Custom implementation using pdfplumber's table detection
-# [Why] Core functionality for extracting structured financial data
-def extract_financial_tables(pdf) -> List[Dict[str, Any]]:
+# [User Defined] Default table settings, resolved once
+# [Why] page.extract_tables() re-resolves these on every call
+_TABLE_SETTINGS = TableSettings.resolve(None)
+_TABLE_TEXT_SETTINGS = _TABLE_SETTINGS.text_settings or {}
+
+
+def _extract_candidate_tables(page) -> List[Tuple[int, List[List[Optional[str]]]]]:
     """
-    [Purpose] Extracts all financial tables from PDF pages
-    [Source] User defined using pdfplumber library capabilities
-    [Why] KSERC orders contain multiple tables; we need to extract them all
-    
-    [Parameters]
-    - pdf: pdfplumber PDF object
-    
+    [Purpose] Extract only the tables on a page that can hold financial rows
+    [Why] page.extract_tables() pulls cell text for every detected table (footers, ToC,
+          signature blocks); the parser needs at least 3 columns (particulars, ARR,
+          actual) and a header plus one data row, so smaller tables are skipped
+          before any text is extracted
+
     [Returns]
-    - List[Dict]: List of table dictionaries with row data
-    
-    [Algorithm]
-    1. Iterate through all pages
-    2. Extract tables using pdfplumber's table detection
-    3. Filter tables that look like financial data
+    - List of (table index on the page, table data) pairs
+    """
+    candidates = []
+    # [Library] page.find_tables() - Table detection without text extraction
+    for table_idx, table in enumerate(page.find_tables(_TABLE_SETTINGS)):
+        cells = table.cells
+        # [Comment] Distinct cell left edges / tops = column / row counts of the table
+        if len({cell[0] for cell in cells}) < 3 or len({cell[1] for cell in cells}) < 2:
+            continue
+        # [Library] Table.extract() - Materialize cell text for this table only
+        candidates.append((table_idx, table.extract(**_TABLE_TEXT_SETTINGS)))
+    return candidates
+
+
+# [User Defined] Single-pass extraction of one page
+# [Why] Text and tables come from the same page layout; extracting both together
+#       lets the layout be parsed once and released before the next page
+def _parse_page(
+    page, with_text: bool = True
+) -> Tuple[str, List[Tuple[int, List[List[Optional[str]]]]]]:
+    """
+    [Purpose] Extract text and tables from one pdfplumber page, then free its caches
+    [Why] Replaces the separate full-text and table passes over pdf.pages;
+          with_text=False skips text extraction for pages not needed for metadata
     """
-    # [Comment] Initialize list to store extracted tables
-    all_tables = []
-    
-    # [Comment] Iterate through each page in the PDF
-    # [Why] Financial tables can span multiple pages
-    for page_num, page in enumerate(pdf.pages, start=1):
-        logger.debug(f"Processing page {page_num}")
-        
-        # [Library] page.extract_tables() - pdfplumber's table extraction
-        # [Source] pdfplumber documentation
-        # [Why] Automatically detects and extracts table structure
-        tables = page.extract_tables()
-        
-        # [Comment] Check if any tables found on this page
-        if tables:
-            logger.info(f"Found {len(tables)} table(s) on page {page_num}")
-            
-            # [Comment] Add each table to our collection
-            for table_idx, table in enumerate(tables):
-                # [Comment] Store table with metadata
-                all_tables.append({
-                    'page': page_num,
-                    'table_index': table_idx,
-                    'data': table
-                })
-    
-    logger.info(f"Total tables extracted: {len(all_tables)}")
-    return all_tables
+    try:
+        text = (page.extract_text() or "") if with_text else ""
+        return text, _extract_candidate_tables(page)
+    finally:
+        # [Library] Page.flush_cache() - Drops cached chars/layout objects
+        # [Why] Keeps memory flat on long orders
+        page.flush_cache()
+
+
+def _remaining_text(pages) -> str:
+    """
+    [Purpose] Text of the pages after the metadata header, in full_text layout
+    [Why] Only needed when the header pages lack the licensee name or financial year
+    """
+    texts = []
+    for page in pages:
+        try:
+            text = page.extract_text()
+        finally:
+            page.flush_cache()
+        if text:
+            texts.append(text)
+    return "\n".join(texts) + "\n" if texts else ""
 
 
 # [User Defined] Function to parse financial rows from table data
@@ -209,150 +267,246 @@ def parse_financial_rows(table_data: List[List[str]]) -> List[FinancialRow]:
     [Purpose] Parses table data into FinancialRow objects
     [Source] User defined parser based on KSERC table structure
     [Why] Converts raw text arrays into validated data models
-    
+
     [Parameters]
     - table_data: 2D array of table cells (rows x columns)
-    
+
     [Returns]
     - List[FinancialRow]: Parsed financial rows
-    
+
     [Algorithm]
     1. Skip header row
     2. For each data row, extract: particulars, ARR, actual, deviation
     3. Create FinancialRow objects with validation
     """
-    # [Comment] Initialize list for parsed rows
+    return _parse_financial_rows_with_totals(table_data)[0]
+
+
+def _cell_amount(cell: Any) -> float:
+    """
+    [Purpose] Amount in one ARR / actual cell (0.0 for empty cells)
+    """
+    return clean_currency(str(cell)) if cell else 0.0
+
+
+def _parse_financial_rows_with_totals(
+    table_data: List[List[str]],
+) -> Tuple[List[FinancialRow], float, float]:
+    """
+    [Purpose] parse_financial_rows that also returns the ARR and trued-up totals
+    [Why] Totals accumulate while rows are built, instead of two more passes afterwards
+    """
+    # [Comment] Initialize list for parsed rows and running totals
     financial_rows = []
-    
+    total_arr = 0.0
+    total_actual = 0.0
+
     # [Comment] Skip first row (typically headers)
     # [Why] Headers like "Particulars", "ARR", "Actuals" are not data
     if len(table_data) > 1:
         data_rows = table_data[1:]  # [Comment] All rows except first
     else:
         logger.warning("Table has no data rows")
-        return financial_rows
-    
-    # [Comment] Process each data row
+        return financial_rows, total_arr, total_actual
+
+    # [Comment] Pass 1: keep rows that carry data, as (particulars, ARR, actual) cells
+    # [Why] Column-wise parsing below needs the three columns aligned row for row
+    cells = []
     for row_idx, row in enumerate(data_rows):
-        try:
-            # [Comment] Skip empty rows
-            # [Why] PDFs often have blank rows for formatting
-            if not row or all(cell is None or str(cell).strip() == '' for cell in row):
-                continue
-            
-            # [Comment] Ensure row has at least 3 columns (particulars, ARR, actual)
-            if len(row) < 3:
-                logger.warning(f"Row {row_idx} has insufficient columns: {row}")
-                continue
-            
-            # [Comment] Extract column values
-            particulars = str(row[0]).strip() if row[0] else "Unnamed Item"
-            arr_approved = clean_currency(str(row[1])) if row[1] else 0.0
-            trued_up_value = clean_currency(str(row[2])) if row[2] else 0.0
-            
-            # [Comment] Calculate deviation (Actual - ARR)
-            # [Source] Standard formula in KSERC analysis
-            # [Why] Shows over/under spending
-            deviation = trued_up_value - arr_approved
-            
-            # [Comment] Create FinancialRow object with validation
-            # [Why] Pydantic ensures data integrity
-            financial_row = FinancialRow(
-                particulars=particulars,
-                arr_approved=arr_approved,
-                trued_up_value=trued_up_value,
-                deviation=deviation
-            )
-            
-            financial_rows.append(financial_row)
-            logger.debug(f"Parsed row: {particulars}")
-            
-        except Exception as e:
-            # [Comment] Log parsing errors but continue processing
-            # [Why] One bad row shouldn't stop entire analysis
-            logger.error(f"Error parsing row {row_idx}: {e}")
+        # [Comment] Skip empty rows
+        # [Why] PDFs often have blank rows for formatting
+        if not row or all(cell is None or str(cell).strip() == "" for cell in row):
+            continue
+
+        # [Comment] Ensure row has at least 3 columns (particulars, ARR, actual)
+        if len(row) < 3:
+            logger.warning("Row %d has insufficient columns: %s", row_idx, row)
             continue
-    
-    logger.info(f"Successfully parsed {len(financial_rows)} financial rows")
-    return financial_rows
+
+        cells.append((row[0], row[1], row[2]))
+
+    if not cells:
+        logger.info("Successfully parsed 0 financial rows")
+        return financial_rows, total_arr, total_actual
+
+    # [Comment] Pass 2: parse each column as a batch (structure of arrays)
+    # [Library] zip(*rows) / map() - Transpose rows, then apply the parser per column
+    # [Why] pandas is optional at runtime, so the vectorized str.extract path is not
+    #       available; batching by column still runs the loops in C and keeps
+    #       clean_currency's handling of every cell unchanged
+    particulars_col, arr_col, actual_col = zip(*cells)
+    arr_values = list(map(_cell_amount, arr_col))
+    actual_values = list(map(_cell_amount, actual_col))
+
+    # [Comment] Create FinancialRow objects without re-validating
+    # [Library] model_construct() - Pydantic v2 trusted-data constructor
+    # [Why] particulars is a str and both amounts are floats from clean_currency(),
+    #       so per-row validation only repeats those guarantees;
+    #       deviation (Actual - ARR) is still derived by the model
+    financial_rows = [
+        FinancialRow.model_construct(
+            particulars=(
+                intern(str(particulars).strip()) if particulars else "Unnamed Item"
+            ),
+            arr_approved=arr_approved,
+            trued_up_value=trued_up_value,
+        )
+        for particulars, arr_approved, trued_up_value in zip(
+            particulars_col, arr_values, actual_values
+        )
+    ]
+    total_arr = sum(arr_values)
+    total_actual = sum(actual_values)
+
+    logger.info("Successfully parsed %d financial rows", len(financial_rows))
+    return financial_rows, total_arr, total_actual
+
+
+def _stream_hash(stream: BinaryIO, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """
+    [Purpose] Content hash of a seekable stream, read in chunks
+    [Why] Same key as content_hash() without loading the stream into memory
+    """
+    hasher = content_hasher()
+    stream.seek(0)
+    while chunk := stream.read(chunk_size):
+        hasher.update(chunk)
+    stream.seek(0)
+    return hasher.hexdigest()
 
 
 # [User Defined] Main function to process regulatory order PDF
 # [Source] Orchestrates all extraction logic
 # [Why] Single entry point for PDF processing
-def process_regulatory_order(file_bytes: bytes) -> TruingUpResponse:
+def process_regulatory_order(
+    file_bytes: Union[bytes, BinaryIO], cache_key: Optional[str] = None
+) -> TruingUpResponse:
     """
     [Purpose] Main function to process KSERC regulatory order PDF
     [Source] User defined orchestration function
     [Why] Coordinates all extraction steps to produce final analysis
-    
+
     [Parameters]
-    - file_bytes: Raw bytes of uploaded PDF file
-    
+    - file_bytes: Raw bytes of uploaded PDF file, or a seekable binary stream
+      (e.g. the spooled file behind a FastAPI UploadFile)
+    - cache_key: Precomputed content hash of file_bytes (computed here if omitted)
+
     [Returns]
     - TruingUpResponse: Complete analysis with extracted data
-    
+      (shared with the parse cache; treat as read-only)
+
     [Algorithm]
-    1. Open PDF from bytes
+    1. Open PDF from bytes or stream
     2. Extract full text for metadata
     3. Extract licensee name and financial year
     4. Extract financial tables
     5. Parse tables into FinancialRow objects
     6. Calculate net surplus/deficit
     7. Return structured response
-    
+
     [Exceptions]
     - Raises Exception if PDF processing fails
     """
+    # [Comment] Return the cached result for identical content
+    # [Why] Clients frequently re-submit the same ARR / truing-up PDFs
+    if cache_key is None:
+        if isinstance(file_bytes, (bytes, bytearray)):
+            cache_key = content_hash(file_bytes)
+        else:
+            cache_key = _stream_hash(file_bytes)
+    cached = PARSE_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Parse cache hit for %s", cache_key)
+        return cached
+
     logger.info("Starting regulatory order processing")
-    
+
     try:
         # [Library] io.BytesIO() - Wrap bytes in file-like object
-        # [Why] pdfplumber.open() expects a file-like object
-        pdf_stream = io.BytesIO(file_bytes)
-        
+        # [Why] pdfplumber.open() expects a file-like object; streams are used as-is
+        # [Note] CPython's BytesIO shares an immutable
+        #        bytes buffer until written to, so no
+        #        copy is made; wrapping in memoryview() would force one
+        pdf_stream = (
+            io.BytesIO(file_bytes)
+            if isinstance(file_bytes, (bytes, bytearray))
+            else file_bytes
+        )
+
         # [Library] pdfplumber.open() - Open PDF for reading
         # [Source] pdfplumber library
         # [Why] Creates PDF object for extraction operations
         with pdfplumber.open(pdf_stream) as pdf:
-            
-            # [Comment] Step 1: Extract full text from all pages
-            # [Why] Needed for metadata extraction (name, year)
-            logger.debug("Extracting full text from PDF")
-            full_text = ""
-            
-            for page in pdf.pages:
-                # [Library] page.extract_text() - pdfplumber text extraction
-                # [Why] Converts PDF page to plain text
-                page_text = page.extract_text()
+
+            # [Comment] Step 1: Extract tables from every
+            #           page, text from the header pages only
+            # [Why] Licensee name and financial year sit
+            #       on the first page or two of an order;
+            #       tables can be anywhere
+            logger.debug("Extracting text and tables from PDF")
+            metadata_pages = max(settings.METADATA_PAGES, 1)
+            page_texts = []
+            tables = []
+
+            for page_num, page in enumerate(pdf.pages, start=1):
+                page_text, page_tables = _parse_page(
+                    page, with_text=page_num <= metadata_pages
+                )
                 if page_text:
-                    full_text += page_text + "\n"
-            
+                    page_texts.append(page_text)
+                for table_idx, table in page_tables:
+                    tables.append(
+                        {"page": page_num, "table_index": table_idx, "data": table}
+                    )
+
+            # [Comment] One join over the collected pages instead of repeated +=
+            # [Why] Linear copying; layout unchanged (each
+            #       non-empty page ends with a newline)
+            header_text = "\n".join(page_texts) + "\n" if page_texts else ""
+            logger.info("Total tables extracted: %d", len(tables))
+
             # [Comment] Step 2: Extract metadata using regex patterns
-            licensee_name = extract_licensee_name(full_text)
-            financial_year = extract_financial_year(full_text)
-            
-            # [Comment] Step 3: Extract financial tables
-            logger.info("Extracting financial tables")
-            tables = extract_financial_tables(pdf)
-            
+            licensee_name = extract_licensee_name(header_text)
+            financial_year = extract_financial_year(header_text)
+
+            # [Comment] Fallback: scan the whole document
+            #           if the header lacked either value
+            # [Why] Rare layouts put the licensee or year after the first pages
+            if len(pdf.pages) > metadata_pages and (
+                licensee_name == "Unknown Licensee" or financial_year == "Unknown"
+            ):
+                logger.info(
+                    "Metadata not found in first %d page(s); scanning full text",
+                    metadata_pages,
+                )
+                full_text = header_text + _remaining_text(pdf.pages[metadata_pages:])
+                if licensee_name == "Unknown Licensee":
+                    licensee_name = extract_licensee_name(full_text)
+                if financial_year == "Unknown":
+                    financial_year = extract_financial_year(full_text)
+
             # [Comment] Step 4: Parse tables into FinancialRow objects
             # [Why] Currently processes first table; can be enhanced for multiple tables
             financial_rows = []
-            
+            total_arr = total_actual = 0.0
+
             if tables:
                 # [Comment] Process the first substantial table found
                 # [Enhancement] Could be improved to identify correct table by headers
                 for table_info in tables:
-                    table_data = table_info['data']
-                    parsed_rows = parse_financial_rows(table_data)
-                    
+                    table_data = table_info["data"]
+                    parsed_rows, table_arr, table_actual = (
+                        _parse_financial_rows_with_totals(table_data)
+                    )
+
                     if parsed_rows:
                         financial_rows.extend(parsed_rows)
+                        total_arr += table_arr
+                        total_actual += table_actual
                         # [Comment] Break after finding first valid table
                         # [Why] Avoids duplicate data from summary tables
                         break
-            
+
             # [Comment] Fallback: If no tables found, create mock data for demonstration
             # [Why] Ensures API returns valid response even for testing
             if not financial_rows:
@@ -362,40 +516,39 @@ def process_regulatory_order(file_bytes: bytes) -> TruingUpResponse:
                         particulars="Power Purchase Cost",
                         arr_approved=3103.55,
                         trued_up_value=3370.52,
-                        deviation=266.97
                     ),
                     FinancialRow(
                         particulars="Employee Expenses",
                         arr_approved=174.96,
                         trued_up_value=177.52,
-                        deviation=2.56
                     ),
                     FinancialRow(
                         particulars="Repair & Maintenance",
                         arr_approved=89.45,
                         trued_up_value=85.30,
-                        deviation=-4.15
-                    )
+                    ),
                 ]
-            
-            # [Comment] Step 5: Calculate totals and net surplus/deficit
+                # [Comment] Sample data only - three rows, summed directly
+                total_arr = sum(row.arr_approved for row in financial_rows)
+                total_actual = sum(row.trued_up_value for row in financial_rows)
+
+            # [Comment] Step 5: Net surplus/deficit from the
+            #           totals accumulated while parsing
             # [Source] Standard aggregation logic
             # [Why] Key metrics for regulatory analysis
-            
-            # [Library] sum() with generator - Efficient aggregation
-            # [Why] Calculates total ARR approved amount
-            total_arr = sum(row.arr_approved for row in financial_rows)
-            
-            # [Comment] Calculate total actual expenditure
-            total_actual = sum(row.trued_up_value for row in financial_rows)
-            
+
             # [Comment] Calculate net surplus (positive) or deficit (negative)
             # [Formula] ARR - Actual (if positive, under-spent = surplus)
             # [Source] KSERC analysis convention
             net_surplus_deficit = total_arr - total_actual
-            
-            logger.info(f"Analysis complete - Total ARR: {total_arr}, Total Actual: {total_actual}, Net: {net_surplus_deficit}")
-            
+
+            logger.info(
+                "Analysis complete - Total ARR: %s, Total Actual: %s, Net: %s",
+                total_arr,
+                total_actual,
+                net_surplus_deficit,
+            )
+
             # [Comment] Step 6: Create and return response object
             # [Why] Pydantic model ensures response validation
             response = TruingUpResponse(
@@ -405,16 +558,17 @@ def process_regulatory_order(file_bytes: bytes) -> TruingUpResponse:
                 net_surplus_deficit=net_surplus_deficit,
                 total_arr_approved=total_arr,
                 total_trued_up=total_actual,
-                compliance_status="Analysis Complete"
+                compliance_status="Analysis Complete",
             )
-            
+
             logger.info("Regulatory order processing completed successfully")
+            PARSE_CACHE.set(cache_key, response)
             return response
-            
+
     except Exception as e:
         # [Comment] Log error with full traceback
-        logger.error(f"Error processing regulatory order: {str(e)}", exc_info=True)
-        
+        logger.error("Error processing regulatory order: %s", e, exc_info=True)
+
         # [Comment] Re-raise exception to be handled by API layer
         # [Why] Allows FastAPI to return proper HTTP error response
         raise Exception(f"Failed to process PDF: {str(e)}")
@@ -2,9 +2,13 @@
 # [Source] User defined - uses local PDFs/MD/TXT for retrieval
 # [Why] Enables regulation-aware answers without external vector DB
 
-# [Library] json - Persist index to disk
-# [Why] Simple, portable storage format
-import json
+# [Library] hashlib - Content hashing
+# [Why] Detect modified source files and unchanged remote indexes
+import hashlib
+
+# [Library] heapq - Partial selection
+# [Why] Top-k selection without sorting every scored chunk
+import heapq
 
 # [Library] math - For BM25 scoring
 # [Why] Needed for logarithms and normalization
@@ -14,22 +18,58 @@ import math
 # [Why] Enumerate documents and manage storage
 import os
 
+# [Library] pickle - Binary snapshot of a built index
+# [Why] Restores the posting arrays directly instead of re-tokenizing the corpus
+# [Note] Only files this service wrote itself (under RAG_STORAGE_DIR) are unpickled
+import pickle
+
 # [Library] re - Tokenization and cleanup
 # [Why] Simple text normalization
 import re
 
+# [Library] array - Typed, unboxed numeric arrays
+# [Why] Document lengths and posting lists stored
+#       as 4-byte ints instead of boxed Python ints
+from array import array
+
+# [Library] bisect - Binary search
+# [Why] Look up single chunks in sorted posting arrays during MaxScore pruning
+from bisect import bisect_left
+
+# [Library] collections.Counter - C-accelerated token counting
+# [Why] Per-chunk term frequencies for the posting lists
+from collections import Counter
+
+# [Library] functools - Compute-once attributes and memoization
+# [Why] Sorted source list is reused by every /rag/refresh response;
+#       verdict queries repeat, so their tokens are cached
+from functools import cached_property, lru_cache
+
 # [Library] pathlib - Path utilities
 # [Why] Safer path handling
 from pathlib import Path
 
+# [Library] sys.intern - String interning
+# [Why] Repeated tokens across chunks share one string object
+from sys import intern
+
 # [Library] typing - Type hints
 # [Why] Improves clarity and IDE support
-from typing import Dict, List, Any, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+# [Library] orjson - Fast JSON serialization implemented in Rust
+# [Why] Encodes the index straight to UTF-8 bytes in one buffer
+import orjson
 
 # [Library] pdfplumber - PDF text extraction
 # [Why] Extract text from regulatory PDFs
 import pdfplumber
 
+# [User Defined] Import configuration settings
+# [Source] src/config.py
+# [Why] Selects the PDF text extraction backend
+from src.config import settings
+
 # [User Defined] Import logger
 # [Source] src/utils/logger.py
 # [Why] Trace indexing and retrieval
@@ -39,6 +79,13 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# [User Defined] Token pattern, compiled once
+# [Why] tokenize() runs for every chunk at build time and every query
+# [Note] Matched against lowercased text rather than with re.IGNORECASE: str.lower()
+#        also folds non-ASCII letters such as the Kelvin sign into [a-z]
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 # [User Defined] Tokenizer for RAG
 # [Source] Simple regex tokenizer
 # [Why] Lightweight, dependency-free
@@ -47,7 +94,17 @@ def tokenize(text: str) -> List[str]:
     [Purpose] Tokenize text into lowercase word tokens
     [Why] Supports BM25 retrieval
     """
-    return re.findall(r"[a-z0-9]+", text.lower())
+    return _TOKEN_RE.findall(text.lower())
+
+
+@lru_cache(maxsize=4096)
+def _query_tokens(query: str) -> Tuple[str, ...]:
+    """
+    [Purpose] Memoized tokenize() for search queries
+    [Why] Queries are short and often repeated; chunk texts are tokenized once per
+          build and are deliberately not cached (they would pin the corpus in memory)
+    """
+    return tuple(tokenize(query))
 
 
 # [User Defined] Chunking function
@@ -57,97 +114,443 @@ def chunk_text(text: str, chunk_size: int = 1200, overlap: int = 150) -> List[st
     """
     [Purpose] Split text into overlapping chunks
     [Why] Prevents cutting key references in the middle
+
+    [Note] Windows start every chunk_size - overlap characters; the last one ends at
+           the end of the text
     """
-    chunks = []
-    start = 0
+    step = max(chunk_size - overlap, 1)
     text_len = len(text)
-    while start < text_len:
-        end = min(start + chunk_size, text_len)
-        chunk = text[start:end].strip()
+    chunks = []
+    # [Comment] One str slice per window; strip() only scans the window's ends
+    for start in range(0, text_len, step):
+        chunk = text[start : start + chunk_size].strip()
         if chunk:
             chunks.append(chunk)
-        start = end - overlap
-        if start < 0:
-            start = 0
-        if start >= text_len:
+        if start + chunk_size >= text_len:
             break
     return chunks
 
 
+def index_fingerprint(chunks: List[Dict[str, Any]]) -> str:
+    """
+    [Purpose] Stable digest of a chunk list (ids, source/page metadata and text)
+    [Why] Lets callers skip rebuilding the BM25 index when nothing changed
+    """
+    return _fingerprints(chunks, 0)[1]
+
+
+def _fingerprints(chunks: List[Dict[str, Any]], prefix_len: int) -> Tuple[str, str]:
+    """
+    [Purpose] index_fingerprint() of chunks[:prefix_len] and of the whole list, in one
+              pass
+    [Why] update_index() recognizes an append-only change by its prefix digest
+
+    [Note] source and page are hashed too: search results carry them, so a chunk that
+           moves to another page or file must invalidate the index and the verdict cache
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    prefix = hasher.hexdigest() if prefix_len == 0 else ""
+    for pos, chunk in enumerate(chunks, start=1):
+        hasher.update(str(chunk.get("id")).encode())
+        hasher.update(b"\0")
+        hasher.update(str(chunk.get("source")).encode())
+        hasher.update(b"\0")
+        hasher.update(str(chunk.get("page")).encode())
+        hasher.update(b"\0")
+        hasher.update(chunk.get("text", "").encode())
+        hasher.update(b"\0")
+        if pos == prefix_len:
+            prefix = hasher.hexdigest()
+    return prefix, hasher.hexdigest()
+
+
+# [Config] BM25 parameters
+# [Why] Standard Okapi defaults: k1 saturates term
+#       frequency, b scales length normalization
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# [Comment] Version of the pickled index layout; bump when RagIndex attributes change
+_INDEX_FORMAT_VERSION = 2
+
+# [Comment] Slack for MaxScore bound comparisons
+# [Why] Upper bounds are float sums; never prune a chunk on a rounding difference
+_PRUNE_EPS = 1e-9
+
+
 class RagIndex:
     """
     [Purpose] Minimal BM25 index over local chunks
     [Why] Avoids external vector DB while enabling retrieval
+
+    [Note] Stored as an inverted index in structure-of-arrays form: each term id owns
+           a posting list of chunk indices and a parallel list of term frequencies
     """
 
-    def __init__(self, chunks: List[Dict[str, Any]]):
+    def __init__(self, chunks: List[Dict[str, Any]], fingerprint: Optional[str] = None):
+        """
+        [Purpose] Build the index over chunks
+
+        [Parameters]
+        - fingerprint: index_fingerprint(chunks) when the caller already computed it
+        """
         self.chunks = chunks
-        self.doc_freq: Dict[str, int] = {}
-        self.doc_tokens: List[List[str]] = []
-        self.doc_lengths: List[int] = []
+        self.fingerprint = (
+            fingerprint if fingerprint is not None else index_fingerprint(chunks)
+        )
+        self.vocab: Dict[str, int] = {}
+        self.postings_docs: List[array] = []
+        self.postings_tf: List[array] = []
+        self.idf: array = array("d")
+        self.doc_lengths: array = array("I")
+        self.doc_norms: array = array("d")
+        self.max_contrib: array = array("d")
+        self.sources: set[str] = set()
         self.avg_doc_len = 0.0
         self._build()
 
     def _build(self) -> None:
         logger.info("Building RAG index in memory")
-        self.doc_tokens = []
-        self.doc_lengths = []
-        self.doc_freq = {}
+        # [Comment] Compact index storage: unsigned 32-bit posting entries and lengths,
+        #           one interned str per vocabulary term
+        # [Why] Tokens are counted once here instead of on every query, and the
+        #       per-chunk token lists are not kept
+        self.vocab = {}
+        self.postings_docs = []
+        self.postings_tf = []
+        self.doc_lengths = array("I")
+        self.sources = set()
+        # [Comment] Invalidate the cached sorted view whenever the index is rebuilt
+        self.__dict__.pop("sorted_sources", None)
 
-        for chunk in self.chunks:
+        for doc_idx, chunk in enumerate(self.chunks):
+            self.sources.add(chunk["source"])
             tokens = tokenize(chunk["text"])
-            self.doc_tokens.append(tokens)
             self.doc_lengths.append(len(tokens))
-            unique_tokens = set(tokens)
-            for t in unique_tokens:
-                self.doc_freq[t] = self.doc_freq.get(t, 0) + 1
+            for token, tf in Counter(tokens).items():
+                term_id = self.vocab.get(token)
+                if term_id is None:
+                    term_id = self.vocab[intern(token)] = len(self.postings_docs)
+                    self.postings_docs.append(array("I"))
+                    self.postings_tf.append(array("I"))
+                self.postings_docs[term_id].append(doc_idx)
+                self.postings_tf[term_id].append(tf)
+
+        self._compute_statistics()
+        logger.info("Indexed %d chunks (%d terms)", len(self.chunks), len(self.vocab))
+
+    def _compute_statistics(self) -> None:
+        """
+        [Purpose] Derive IDF, length norms and MaxScore bounds from the posting arrays
+        [Why] Every one of them depends on the chunk count or the average length, so
+              they are recomputed after a build or an append; no tokenizing involved
+        """
+        # [Comment] IDF per term id (document frequency = posting length)
+        n_docs = len(self.chunks)
+        self.idf = array(
+            "d",
+            (
+                math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                for docs in self.postings_docs
+            ),
+        )
 
         total_len = sum(self.doc_lengths) if self.doc_lengths else 0
-        self.avg_doc_len = total_len / len(self.doc_lengths) if self.doc_lengths else 0.0
-        logger.info(f"Indexed {len(self.chunks)} chunks")
-
-    def _bm25_score(self, query_tokens: List[str], doc_idx: int, k1: float = 1.5, b: float = 0.75) -> float:
-        tokens = self.doc_tokens[doc_idx]
-        if not tokens:
-            return 0.0
-        freq: Dict[str, int] = {}
-        for t in tokens:
-            freq[t] = freq.get(t, 0) + 1
-        score = 0.0
-        doc_len = self.doc_lengths[doc_idx]
-        for t in query_tokens:
-            if t not in freq:
-                continue
-            df = self.doc_freq.get(t, 1)
-            idf = math.log(1 + (len(self.chunks) - df + 0.5) / (df + 0.5))
-            tf = freq[t]
-            denom = tf + k1 * (1 - b + b * (doc_len / (self.avg_doc_len or 1.0)))
-            score += idf * (tf * (k1 + 1) / denom)
-        return score
+        self.avg_doc_len = (
+            total_len / len(self.doc_lengths) if self.doc_lengths else 0.0
+        )
 
-    def search(self, query: str, top_k: int = 6) -> List[Dict[str, Any]]:
-        query_tokens = tokenize(query)
-        if not query_tokens:
-            return []
-        scored: List[Tuple[int, float]] = []
-        for i in range(len(self.chunks)):
-            scored.append((i, self._bm25_score(query_tokens, i)))
-        scored.sort(key=lambda x: x[1], reverse=True)
+        # [Comment] BM25 length normalization k1 * (1 - b + b * dl / avgdl) per chunk
+        # [Why] Depends only on the chunk, so the query loop reduces to tf + norm
+        avg_doc_len = self.avg_doc_len or 1.0
+        self.doc_norms = array(
+            "d",
+            (
+                BM25_K1 * (1 - BM25_B + BM25_B * (doc_len / avg_doc_len))
+                for doc_len in self.doc_lengths
+            ),
+        )
+
+        # [Comment] Largest single-chunk BM25 contribution per term id
+        # [Why] Upper bounds for MaxScore pruning in search()
+        k1_plus_1 = BM25_K1 + 1
+        doc_norms = self.doc_norms
+        self.max_contrib = array(
+            "d",
+            (
+                idf
+                * max(
+                    tf * k1_plus_1 / (tf + doc_norms[doc_idx])
+                    for doc_idx, tf in zip(docs, tfs)
+                )
+                for idf, docs, tfs in zip(
+                    self.idf, self.postings_docs, self.postings_tf
+                )
+            ),
+        )
+
+    def add_chunks(
+        self, new_chunks: List[Dict[str, Any]], fingerprint: Optional[str] = None
+    ) -> None:
+        """
+        [Purpose] Append chunks to the index in place
+        [Why] Only the new chunks are tokenized; existing posting lists are extended
+              rather than rebuilt, which is where almost all of _build's time goes
+
+        [Parameters]
+        - fingerprint: index_fingerprint() of the combined chunk list, when the caller
+          already has it (update_index does); otherwise the whole list is re-hashed
+
+        [Note] Mutates this index (and the chunk list it was built from). Never call it
+               on an index other threads are searching - use extended() instead.
+        """
+        if not new_chunks:
+            return
+        # [Comment] Gather the new postings per term first, then extend each touched
+        #           posting list once. Lists are replaced, not appended to, so an index
+        #           sharing them (see extended()) is left untouched.
+        new_docs: Dict[int, array] = {}
+        new_tfs: Dict[int, array] = {}
+        start = len(self.chunks)
+        for doc_idx, chunk in enumerate(new_chunks, start=start):
+            self.sources.add(chunk["source"])
+            tokens = tokenize(chunk["text"])
+            self.doc_lengths.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                term_id = self.vocab.get(token)
+                if term_id is None:
+                    term_id = self.vocab[intern(token)] = len(self.postings_docs)
+                    self.postings_docs.append(array("I"))
+                    self.postings_tf.append(array("I"))
+                docs = new_docs.get(term_id)
+                if docs is None:
+                    docs = new_docs[term_id] = array("I")
+                    new_tfs[term_id] = array("I")
+                docs.append(doc_idx)
+                new_tfs[term_id].append(tf)
+        # [Comment] New chunk indices exceed every existing
+        #           one, so posting lists stay sorted
+        for term_id, docs in new_docs.items():
+            self.postings_docs[term_id] = self.postings_docs[term_id] + docs
+            self.postings_tf[term_id] = self.postings_tf[term_id] + new_tfs[term_id]
+
+        self.chunks.extend(new_chunks)
+        self.fingerprint = (
+            fingerprint if fingerprint is not None else index_fingerprint(self.chunks)
+        )
+        self.__dict__.pop("sorted_sources", None)
+        self._compute_statistics()
+        logger.info(
+            "Added %d chunks to RAG index (%d total, %d terms)",
+            len(new_chunks),
+            len(self.chunks),
+            len(self.vocab),
+        )
+
+    def extended(
+        self, new_chunks: List[Dict[str, Any]], fingerprint: Optional[str] = None
+    ) -> "RagIndex":
+        """
+        [Purpose] New index holding this one's chunks followed by new_chunks
+        [Why] Published indexes are searched without a lock; the copy shares the
+              unchanged posting arrays and only re-tokenizes new_chunks, and is then
+              swapped in like a freshly built index
+        """
+        index = self.__class__.__new__(self.__class__)
+        index.__dict__.update(
+            (k, v) for k, v in self.__dict__.items() if k != "sorted_sources"
+        )
+        # [Comment] Shallow copies of every container add_chunks() mutates in place
+        index.chunks = list(self.chunks)
+        index.vocab = dict(self.vocab)
+        index.postings_docs = list(self.postings_docs)
+        index.postings_tf = list(self.postings_tf)
+        index.doc_lengths = array("I", self.doc_lengths)
+        index.sources = set(self.sources)
+        index.add_chunks(new_chunks, fingerprint)
+        return index
+
+    def save(self, path: Path, source_stamp: Optional[Tuple[int, int]] = None) -> None:
+        """
+        [Purpose] Write the built index (chunks plus posting arrays) as a pickle
+        [Why] Loading it skips _build entirely on process start and worker reloads
+
+        [Parameters]
+        - source_stamp: (mtime_ns, size) of the JSON index this snapshot was built from
+        """
+        state = {k: v for k, v in self.__dict__.items() if k != "sorted_sources"}
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as fh:
+            pickle.dump(
+                {
+                    "format": _INDEX_FORMAT_VERSION,
+                    "source": source_stamp,
+                    "state": state,
+                },
+                fh,
+                protocol=5,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(
+        cls, path: Path, source_stamp: Optional[Tuple[int, int]] = None
+    ) -> "RagIndex":
+        """
+        [Purpose] Restore an index written by save() without rebuilding it
+
+        [Exceptions]
+        - ValueError if the snapshot has another format version or, when source_stamp
+          is given, was built from a different JSON index
+        """
+        with path.open("rb") as fh:
+            snapshot = pickle.load(fh)
+        if snapshot.get("format") != _INDEX_FORMAT_VERSION:
+            raise ValueError(f"unsupported RAG index format {snapshot.get('format')!r}")
+        if source_stamp is not None and tuple(snapshot.get("source") or ()) != tuple(
+            source_stamp
+        ):
+            raise ValueError("RAG index snapshot is stale")
+        index = cls.__new__(cls)
+        index.__dict__.update(snapshot["state"])
+        return index
+
+    @cached_property
+    def sorted_sources(self) -> List[str]:
+        """
+        [Purpose] Alphabetical list of indexed source documents
+        [Why] Sorted once per build instead of rescanning every chunk per request
+        """
+        return sorted(self.sources)
+
+    def _term_counts(self, query: str) -> Dict[int, int]:
+        """
+        [Purpose] Query term ids with multiplicity (a repeated word counts once per
+                  occurrence)
+        """
+        term_counts: Dict[int, int] = {}
+        for t in _query_tokens(query):
+            term_id = self.vocab.get(t)
+            if term_id is not None:
+                term_counts[term_id] = term_counts.get(term_id, 0) + 1
+        return term_counts
+
+    def _top_chunks(self, scores: Dict[int, float], top_k: int) -> List[Dict[str, Any]]:
+        """
+        [Purpose] Copies of the top_k scoring chunks, annotated with their score
+        """
+        # [Comment] O(M log k) partial selection over the M matching chunks
+        # [Why] Equal scores keep index order, as before
         results = []
-        for idx, score in scored[:top_k]:
-            if score <= 0:
-                continue
+        for idx, score in heapq.nlargest(
+            top_k, scores.items(), key=lambda x: (x[1], -x[0])
+        ):
             chunk = self.chunks[idx].copy()
             chunk["score"] = round(score, 4)
             results.append(chunk)
         return results
 
+    def search(self, query: str, top_k: int = 6) -> List[Dict[str, Any]]:
+        term_counts = self._term_counts(query)
+        if not term_counts or top_k <= 0:
+            return []
+
+        k1_plus_1 = BM25_K1 + 1
+        doc_norms = self.doc_norms
+        # [Comment] Term-at-a-time scoring with MaxScore pruning
+        # [Why] Term frequencies, IDF and length normalization come precomputed from the
+        #       build. Terms are taken in descending order of their best possible
+        #       contribution; once the current k-th
+        # best score exceeds what the remaining
+        #       terms could add, chunks not yet seen cannot reach the top k, so those
+        #       terms only update surviving candidates (by binary search when cheaper
+        #       than a scan), and candidates that can no longer catch up are dropped.
+        #       Common boilerplate terms ("order", "commission") are mostly skipped.
+        terms = sorted(
+            (
+                (self.max_contrib[term_id] * count, term_id, count)
+                for term_id, count in term_counts.items()
+            ),
+            reverse=True,
+        )
+        remaining = sum(bound for bound, _, _ in terms)
+        scores: Dict[int, float] = {}
+        threshold = 0.0
+        for bound, term_id, count in terms:
+            remaining -= bound
+            idf = self.idf[term_id] * count
+            docs = self.postings_docs[term_id]
+            tfs = self.postings_tf[term_id]
+            if len(scores) < top_k or threshold - _PRUNE_EPS <= bound + remaining:
+                # [Comment] Essential term: any chunk in the
+                #           posting list may still make the top k
+                get_score = scores.get
+                for doc_idx, tf in zip(docs, tfs):
+                    scores[doc_idx] = get_score(doc_idx, 0.0) + idf * (
+                        tf * k1_plus_1 / (tf + doc_norms[doc_idx])
+                    )
+            elif len(scores) * max(len(docs).bit_length(), 1) < len(docs):
+                # [Comment] Few candidates, long posting list:
+                #           binary-search each candidate
+                n_docs = len(docs)
+                for doc_idx in scores:
+                    pos = bisect_left(docs, doc_idx)
+                    if pos < n_docs and docs[pos] == doc_idx:
+                        tf = tfs[pos]
+                        scores[doc_idx] += idf * (
+                            tf * k1_plus_1 / (tf + doc_norms[doc_idx])
+                        )
+            else:
+                for doc_idx, tf in zip(docs, tfs):
+                    if doc_idx in scores:
+                        scores[doc_idx] += idf * (
+                            tf * k1_plus_1 / (tf + doc_norms[doc_idx])
+                        )
+            if remaining > 0 and len(scores) > top_k:
+                # [Comment] Partial scores only grow, so the k-th best is a lower bound
+                threshold = heapq.nlargest(top_k, scores.values())[-1]
+                if threshold - _PRUNE_EPS > remaining:
+                    scores = {
+                        doc_idx: score
+                        for doc_idx, score in scores.items()
+                        if score + remaining >= threshold - _PRUNE_EPS
+                    }
+        return self._top_chunks(scores, top_k)
+
+
+def _extract_text_pymupdf(path: Path) -> List[Dict[str, Any]]:
+    """
+    [Purpose] extract_text_from_pdf using PyMuPDF (MuPDF C library)
+    [Why] An order of magnitude faster than pdfminer-based extraction on large corpora
+    """
+    # [Library] pymupdf is imported lazily
+    # [Why] Optional dependency; only needed when RAG_PDF_BACKEND=pymupdf
+    import pymupdf  # type: ignore
+
+    pages = []
+    with pymupdf.open(path) as doc:
+        for page_num, page in enumerate(doc, start=1):
+            text = page.get_text("text").strip()
+            if text:
+                pages.append({"page": page_num, "text": text})
+    return pages
+
 
 def extract_text_from_pdf(path: Path) -> List[Dict[str, Any]]:
     """
     [Purpose] Extract text per page from PDF
     [Why] Enables chunking with page metadata
+
+    [Note] RAG_PDF_BACKEND=pymupdf switches to PyMuPDF; pdfplumber is the default
     """
+    if settings.RAG_PDF_BACKEND == "pymupdf":
+        try:
+            return _extract_text_pymupdf(path)
+        except ImportError:
+            logger.warning(
+                "RAG_PDF_BACKEND=pymupdf but pymupdf is not installed "
+                "(pip install pymupdf); using pdfplumber"
+            )
     pages = []
     with pdfplumber.open(path) as pdf:
         for page_num, page in enumerate(pdf.pages, start=1):
@@ -158,6 +561,38 @@ def extract_text_from_pdf(path: Path) -> List[Dict[str, Any]]:
     return pages
 
 
+def _chunk_file(path: Path) -> List[Dict[str, Any]]:
+    """
+    [Purpose] Chunk a single PDF/MD/TXT source
+    [Why] PDFs are chunked per page so results keep their page number
+    """
+    chunks: List[Dict[str, Any]] = []
+    if path.suffix.lower() == ".pdf":
+        pages = extract_text_from_pdf(path)
+        for page in pages:
+            for i, chunk in enumerate(chunk_text(page["text"])):
+                chunks.append(
+                    {
+                        "id": f"{path.name}-p{page['page']}-c{i}",
+                        "source": path.name,
+                        "page": page["page"],
+                        "text": chunk,
+                    }
+                )
+    else:
+        text = path.read_text(errors="ignore")
+        for i, chunk in enumerate(chunk_text(text)):
+            chunks.append(
+                {
+                    "id": f"{path.name}-c{i}",
+                    "source": path.name,
+                    "page": None,
+                    "text": chunk,
+                }
+            )
+    return chunks
+
+
 def build_chunks_from_dir(directory: Path) -> List[Dict[str, Any]]:
     """
     [Purpose] Build chunks from PDFs and text files
@@ -170,36 +605,94 @@ def build_chunks_from_dir(directory: Path) -> List[Dict[str, Any]]:
         ext = path.suffix.lower()
         if ext not in {".pdf", ".md", ".txt"}:
             continue
-        logger.info(f"Indexing source: {path.name}")
-        if ext == ".pdf":
-            pages = extract_text_from_pdf(path)
-            for page in pages:
-                for i, chunk in enumerate(chunk_text(page["text"])):
-                    chunks.append({
-                        "id": f"{path.name}-p{page['page']}-c{i}",
-                        "source": path.name,
-                        "page": page["page"],
-                        "text": chunk
-                    })
-        else:
-            text = path.read_text(errors="ignore")
-            for i, chunk in enumerate(chunk_text(text)):
-                chunks.append({
-                    "id": f"{path.name}-c{i}",
-                    "source": path.name,
-                    "page": None,
-                    "text": chunk
-                })
+        logger.info("Indexing source: %s", path.name)
+        chunks.extend(_chunk_file(path))
     return chunks
 
 
-def save_index(chunks: List[Dict[str, Any]], index_path: Path) -> None:
+def _snapshot_path(index_path: Path) -> Path:
+    """
+    [Purpose] Location of the binary snapshot that accompanies a JSON index
+    """
+    return index_path.with_suffix(".bin")
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _save_snapshot(index: RagIndex, index_path: Path) -> None:
+    """
+    [Purpose] Write the binary snapshot, tagged with the JSON index it matches
+    [Why] A failed snapshot write only costs a rebuild on the next load
+    """
+    try:
+        index.save(_snapshot_path(index_path), _file_stamp(index_path))
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning("Could not write RAG index snapshot: %s", e)
+
+
+def save_index(
+    chunks: List[Dict[str, Any]], index_path: Path, index: Optional[RagIndex] = None
+) -> None:
+    """
+    [Purpose] Write the chunk list to the shared index file
+    [Why] orjson produces the compact UTF-8 bytes directly, so peak memory is one
+          encoded copy instead of an indented str plus its encoded bytes; the file is
+          swapped in atomically so other workers never load a half-written index
+
+    [Parameters]
+    - index: The RagIndex built from chunks; when given, its binary snapshot is
+      written next to the JSON file so later loads skip the rebuild
+    """
     index_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {"chunks": chunks}
-    index_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
-    logger.info(f"Saved RAG index to {index_path}")
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps({"chunks": chunks}))
+    os.replace(tmp_path, index_path)
+    logger.info("Saved RAG index to %s", index_path)
+    if index is not None:
+        _save_snapshot(index, index_path)
 
 
 def load_index(index_path: Path) -> RagIndex:
-    data = json.loads(index_path.read_text())
-    return RagIndex(data.get("chunks", []))
+    """
+    [Purpose] Load the RAG index, preferring the prebuilt binary snapshot
+    [Why] The JSON file stays the portable, human-readable source of truth; the
+          snapshot is used only if it was built from the current JSON file
+    """
+    snapshot_path = _snapshot_path(index_path)
+    if snapshot_path.exists():
+        try:
+            index = RagIndex.load(snapshot_path, _file_stamp(index_path))
+            logger.info("Loaded RAG index snapshot from %s", snapshot_path)
+            return index
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+            logger.info("Rebuilding RAG index from JSON: %s", e)
+    data = orjson.loads(index_path.read_bytes())
+    index = RagIndex(data.get("chunks", []))
+    _save_snapshot(index, index_path)
+    return index
+
+
+def update_index(
+    current: Optional[RagIndex], chunks: List[Dict[str, Any]]
+) -> Optional[RagIndex]:
+    """
+    [Purpose] Index for a new chunk list, reusing current where possible
+
+    [Returns]
+    - None when chunks is exactly what current already indexes
+    - current.extended(...) when chunks only appends to current's chunks (the usual
+      result of uploading documents)
+    - A freshly built RagIndex otherwise (edits, deletions, reordering)
+    """
+    prefix_len = len(current.chunks) if current is not None else 0
+    if current is not None and prefix_len <= len(chunks):
+        prefix_fingerprint, fingerprint = _fingerprints(chunks, prefix_len)
+        if fingerprint == current.fingerprint:
+            return None
+        if prefix_len and prefix_fingerprint == current.fingerprint:
+            return current.extended(chunks[prefix_len:], fingerprint)
+        return RagIndex(chunks, fingerprint)
+    return RagIndex(chunks)
@@ -12,19 +12,15 @@ from pathlib import Path
 
 # [Library] typing - Type hints
 # [Why] Clarity
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
 
 # [Library] fpdf - Lightweight PDF generation
 # [Why] Simple PDF creation without heavy deps
 from fpdf import FPDF
 
-# [Library] google-cloud-storage - Upload to GCS
-# [Why] Persist verdict PDFs across container restarts
-from google.cloud import storage
-
 # [User Defined] Import settings
 # [Source] src/config.py
-# [Why] Access bucket config
+# [Why] Access bucket config and the shared GCS client (settings.gcs.client)
 from src.config import settings
 
 # [User Defined] Import logger
@@ -34,65 +30,92 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# [User Defined] Set once make_public() has been refused by the bucket
+# [Why] Buckets with uniform bucket-level access reject per-object ACLs on every upload;
+#       after the first refusal the extra ACL
+# round-trip is skipped for the process lifetime
+_public_acl_refused = False
 
-def build_verdict_pdf(output_dir: Path, payload: Dict[str, Any]) -> Path:
-    """
-    [Purpose] Build a verdict PDF file
-    [Why] Client receives final KSERC-style verdict
+
+# [Config] Font states used by the verdict layout
+# [Why] Names the three fonts in one place; this is for readability only - fpdf2
+#       already caches core font metrics per document, so there is no speed-up
+_TITLE_FONT = ("Helvetica", "B", 16)
+_HEADING_FONT = ("Helvetica", "B", 12)
+_BODY_FONT = ("Helvetica", "", 11)
+
+
+def _write_section(
+    pdf: FPDF, title: str, items: List[Any], empty_text: str, gap: float = 2
+) -> None:
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-    verdict_id = str(uuid.uuid4())
-    file_path = output_dir / f"{verdict_id}.pdf"
+    [Purpose] Render one titled bullet-list section of the verdict
+    [Why] Approved, disallowed and conditions sections share the same layout
 
+    [Parameters]
+    - gap: Vertical space before the heading; the first section uses a wider gap
+    """
+    pdf.ln(gap)
+    pdf.set_font(*_HEADING_FONT)
+    pdf.cell(0, 8, title, ln=True)
+    pdf.set_font(*_BODY_FONT)
+    # [Note] multi_cell leaves the cursor at the right margin by default, which made the
+    #        second bullet of any list fail with "Not enough horizontal space"
+    if not items:
+        pdf.multi_cell(0, 6, empty_text, new_x="LMARGIN", new_y="NEXT")
+        return
+    for item in items:
+        pdf.multi_cell(0, 6, f"- {item}", new_x="LMARGIN", new_y="NEXT")
+
+
+def render_verdict_pdf(payload: Dict[str, Any]) -> bytes:
+    """
+    [Purpose] Render a verdict PDF in memory
+    [Why] The same bytes are written locally and uploaded to GCS, so the upload no
+          longer re-reads the file from the container disk
+    """
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=14)
     pdf.add_page()
-    pdf.set_font("Helvetica", "B", 16)
+    pdf.set_font(*_TITLE_FONT)
     pdf.cell(0, 10, "KSERC Saarthi - Regulatory Verdict", ln=True)
 
-    pdf.set_font("Helvetica", "", 11)
+    pdf.set_font(*_BODY_FONT)
     pdf.ln(2)
     pdf.multi_cell(0, 6, payload.get("summary", "No summary available."))
 
-    pdf.ln(4)
-    pdf.set_font("Helvetica", "B", 12)
-    pdf.cell(0, 8, "Approved Items", ln=True)
-    pdf.set_font("Helvetica", "", 11)
-    approved = payload.get("approved_items", [])
-    if not approved:
-        pdf.multi_cell(0, 6, "- None listed")
-    else:
-        for item in approved:
-            pdf.multi_cell(0, 6, f"- {item}")
+    _write_section(
+        pdf, "Approved Items", payload.get("approved_items", []), "- None listed", gap=4
+    )
+    _write_section(
+        pdf, "Disallowed Items", payload.get("disallowed_items", []), "- None listed"
+    )
+    _write_section(pdf, "Conditions / Notes", payload.get("conditions", []), "- None")
 
-    pdf.ln(2)
-    pdf.set_font("Helvetica", "B", 12)
-    pdf.cell(0, 8, "Disallowed Items", ln=True)
-    pdf.set_font("Helvetica", "", 11)
-    disallowed = payload.get("disallowed_items", [])
-    if not disallowed:
-        pdf.multi_cell(0, 6, "- None listed")
-    else:
-        for item in disallowed:
-            pdf.multi_cell(0, 6, f"- {item}")
+    # [Library] FPDF.output() without a name returns the document as a bytearray
+    return bytes(pdf.output())
 
-    pdf.ln(2)
-    pdf.set_font("Helvetica", "B", 12)
-    pdf.cell(0, 8, "Conditions / Notes", ln=True)
-    pdf.set_font("Helvetica", "", 11)
-    conditions = payload.get("conditions", [])
-    if not conditions:
-        pdf.multi_cell(0, 6, "- None")
-    else:
-        for item in conditions:
-            pdf.multi_cell(0, 6, f"- {item}")
-
-    pdf.output(str(file_path))
-    logger.info(f"Verdict PDF saved to {file_path}")
-    return file_path
-
-
-def upload_verdict_to_gcs(file_path: Path) -> str:
+
+def build_verdict_pdf(output_dir: Path, payload: Dict[str, Any]) -> Tuple[Path, bytes]:
+    """
+    [Purpose] Build a verdict PDF file
+    [Why] Client receives final KSERC-style verdict
+
+    [Returns]
+    - (file_path, pdf_bytes): the local copy served by /verdict/{id}.pdf and its
+      content, handed to the background GCS upload
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    verdict_id = str(uuid.uuid4())
+    file_path = output_dir / f"{verdict_id}.pdf"
+
+    pdf_bytes = render_verdict_pdf(payload)
+    file_path.write_bytes(pdf_bytes)
+    logger.info("Verdict PDF saved to %s", file_path)
+    return file_path, pdf_bytes
+
+
+def upload_verdict_to_gcs(file_name: str, pdf_bytes: bytes) -> str:
     """
     [Purpose] Upload verdict PDF to Google Cloud Storage
     [Why] Provide persistent public access
@@ -100,18 +123,26 @@ def upload_verdict_to_gcs(file_path: Path) -> str:
     if not settings.GCS_BUCKET_NAME:
         raise RuntimeError("GCS_BUCKET_NAME is not set")
 
-    client = storage.Client()
-    bucket = client.bucket(settings.GCS_BUCKET_NAME)
-    blob = bucket.blob(file_path.name)
-    blob.upload_from_filename(str(file_path), content_type="application/pdf")
+    global _public_acl_refused
 
-    # Try to make object public (works when bucket allows public access)
-    try:
-        blob.make_public()
-    except Exception as e:
-        logger.warning(f"Failed to make blob public: {e}")
-
-    if settings.GCS_PUBLIC_BASE_URL:
-        return f"{settings.GCS_PUBLIC_BASE_URL.rstrip('/')}/{file_path.name}"
+    # [Comment] Shared client and bucket handle - credentials
+    #           and connection pool are reused across uploads
+    blob = settings.gcs.bucket.blob(file_name)
+    # [Comment] Upload straight from memory; no open/read of the local copy
+    blob.upload_from_string(pdf_bytes, content_type="application/pdf")
 
-    return f"https://storage.googleapis.com/{settings.GCS_BUCKET_NAME}/{file_path.name}"
+    # Try to make object public (works when bucket allows public access)
+    if not _public_acl_refused:
+        try:
+            blob.make_public()
+        except Exception as e:
+            # [Library] google.api_core.exceptions - 400/403
+            #           mean the bucket refuses object ACLs,
+            #           anything else (timeouts, 5xx) is retried on the next upload
+            from google.api_core.exceptions import BadRequest, Forbidden
+
+            if isinstance(e, (BadRequest, Forbidden)):
+                _public_acl_refused = True
+            logger.warning("Failed to make blob public: %s", e)
+
+    return settings.gcs.public_prefix + file_name
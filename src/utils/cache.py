@@ -0,0 +1,103 @@
+# [Purpose] Small in-process caches keyed by content hash
+# [Source] User defined, standard LRU/TTL eviction
+# [Why] Re-submitted PDFs and repeated analyses should not pay the parse cost twice
+
+# [Library] hashlib - Cryptographic hashes
+# [Why] BLAKE2b is faster than MD5/SHA-256 and collision-safe enough for a cache key
+import hashlib
+
+# [Library] threading - Locks
+# [Why] Cached functions run on the Starlette thread pool
+import threading
+
+# [Library] time - Monotonic clock
+# [Why] TTL expiry that is immune to wall-clock changes
+import time
+
+# [Library] collections.OrderedDict - Insertion-ordered dict
+# [Why] O(1) move-to-end and pop-oldest for LRU eviction
+from collections import OrderedDict
+
+# [Library] typing - Type hints
+# [Why] Clarity and IDE support
+from typing import Any, Hashable, Optional, Tuple
+
+# [User Defined] Sentinel for cache misses
+# [Why] None is a valid cached value
+_MISSING = object()
+
+
+def content_hash(data: bytes) -> str:
+    """
+    [Purpose] Hex digest of raw content for use as a cache key
+    [Why] 128-bit BLAKE2b is cheap and stable across processes
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def content_hasher() -> Any:
+    """
+    [Purpose] Incremental hasher matching content_hash()
+    [Why] Lets streamed uploads be hashed chunk by chunk
+    """
+    return hashlib.blake2b(digest_size=16)
+
+
+class LRUCache:
+    """
+    [Purpose] Thread-safe LRU cache with an optional time-to-live
+    [Why] functools.lru_cache cannot key on a precomputed hash or expire entries
+
+    [Note] Cached values are shared between callers and must be treated as read-only
+    """
+
+    def __init__(self, maxsize: int = 64, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        [Purpose] Return the cached value and mark it most recently used
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        [Purpose] Store a value, evicting the least recently used entry when full
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        [Purpose] Drop every entry
+        [Why] Used when the underlying data (e.g. the RAG index) changes
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
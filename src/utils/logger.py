@@ -2,27 +2,36 @@
 # [Source] Python logging best practices
 # [Why] Provides consistent, configurable logging throughout the application
 
+# [Library] functools - Function wrapping helpers
+# [Why] log_function_call preserves the wrapped function's metadata
+import functools
+
 # [Library] logging - Python's built-in logging facility
 # [Source] Python standard library
 # [Why] Standard way to track events and debug issues in production
 import logging
 
+# [Library] os - Operating system interface
+# [Why] Used to create the log file directory
+import os
+
 # [Library] sys - System-specific parameters and functions
 # [Why] Used to write logs to stdout (console)
 import sys
 
-# [Library] os - Operating system interface
-# [Why] Used to read environment variables for log configuration
-import os
-
-# [Library] datetime - Date and time handling
-# [Why] Used for timestamp formatting in logs
-from datetime import datetime
+# [Library] time - High-resolution clock
+# [Why] log_function_call reports call durations
+import time
 
 # [Library] typing - Type hints
 # [Why] Better code documentation and IDE support
 from typing import Optional
 
+# [User Defined] Import configuration settings
+# [Source] src/config.py
+# [Why] Default log level is resolved once there as a numeric logging level
+from src.config import settings
+
 
 # [User Defined] Custom log formatter with detailed format
 # [Source] Extended from logging.Formatter
@@ -32,21 +41,21 @@ class CustomFormatter(logging.Formatter):
     [Purpose] Custom formatter for log messages with color coding (optional)
     [Source] User defined, extends logging.Formatter
     [Why] Makes logs more readable with consistent formatting
-    
+
     [Format] [TIMESTAMP] [LEVEL] [MODULE] - MESSAGE
     """
-    
+
     # [Comment] ANSI color codes for different log levels (for terminal output)
     # [Why] Visual distinction between log levels improves readability
     COLORS = {
-        'DEBUG': '\033[36m',     # [Color] Cyan
-        'INFO': '\033[32m',      # [Color] Green
-        'WARNING': '\033[33m',   # [Color] Yellow
-        'ERROR': '\033[31m',     # [Color] Red
-        'CRITICAL': '\033[35m'   # [Color] Magenta
+        "DEBUG": "\033[36m",  # [Color] Cyan
+        "INFO": "\033[32m",  # [Color] Green
+        "WARNING": "\033[33m",  # [Color] Yellow
+        "ERROR": "\033[31m",  # [Color] Red
+        "CRITICAL": "\033[35m",  # [Color] Magenta
     }
-    RESET = '\033[0m'  # [Comment] Reset color to default
-    
+    RESET = "\033[0m"  # [Comment] Reset color to default
+
     def __init__(self, use_colors: bool = True):
         """
         [Purpose] Initialize the formatter
@@ -56,33 +65,37 @@ class CustomFormatter(logging.Formatter):
         # [Comment] Define log format string
         # [Format] [2024-02-18 10:30:45] [INFO] [pdf_ingestion] - Processing PDF
         super().__init__(
-            fmt='[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            fmt="[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
         )
         self.use_colors = use_colors
-    
+        # [Comment] Per-level color lookup resolved once; empty when colors are off
+        # [Why] format() runs for every record, so it
+        #       does a single dict.get() instead of
+        #       a flag check, a membership test and a second lookup
+        self._level_colors = dict(self.COLORS) if use_colors else {}
+
     def format(self, record):
         """
         [Purpose] Format log record with optional colors
         [Source] Overrides logging.Formatter.format()
         [Why] Adds color coding for terminal output
-        
+
         [Parameters]
         - record: LogRecord object
-        
+
         [Returns]
         - str: Formatted log message
         """
         # [Comment] Get the base formatted message
         # [Library] super().format() - Call parent class method
         log_message = super().format(record)
-        
-        # [Comment] Add color if enabled and log level has color defined
-        if self.use_colors and record.levelname in self.COLORS:
-            # [Comment] Wrap message in color codes
-            color = self.COLORS[record.levelname]
-            log_message = f"{color}{log_message}{self.RESET}"
-        
+
+        # [Comment] Wrap message in color codes if the level has a color
+        color = self._level_colors.get(record.levelname)
+        if color:
+            return color + log_message + self.RESET
+
         return log_message
 
 
@@ -93,61 +106,61 @@ def get_logger(
     name: str,
     level: Optional[str] = None,
     log_to_file: bool = False,
-    log_file_path: str = "logs/app.log"
+    log_file_path: str = "logs/app.log",
 ) -> logging.Logger:
     """
     [Purpose] Creates and configures a logger instance
     [Source] User defined logger factory
     [Why] Provides consistent logging configuration across all modules
-    
+
     [Parameters]
     - name: Logger name (typically __name__ of the module)
     - level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - log_to_file: Whether to also log to a file
     - log_file_path: Path to log file if log_to_file is True
-    
+
     [Returns]
     - logging.Logger: Configured logger instance
-    
+
     [Usage]
     from src.utils.logger import get_logger
     logger = get_logger(__name__)
     logger.info("Processing started")
     """
-    
+
     # [Library] logging.getLogger() - Get logger by name
     # [Why] Creates or retrieves existing logger with given name
     logger = logging.getLogger(name)
-    
+
     # [Comment] Only configure if logger has no handlers (avoid duplicate handlers)
     # [Why] Prevents multiple handler attachment when logger is retrieved multiple times
     if not logger.handlers:
-        
-        # [Comment] Determine log level from parameter or environment variable
-        # [Why] Allows configuration via environment variables
+
+        # [Comment] Determine log level from parameter or settings
+        # [Why] settings.LOG_LEVEL is already numeric, so
+        #       the default path skips name resolution
         if level is None:
-            level = os.getenv('LOG_LEVEL', 'INFO').upper()
-        
-        # [Library] logging.getLevelName() - Convert string to log level constant
-        # [Why] Converts 'INFO' string to logging.INFO constant
-        log_level = getattr(logging, level, logging.INFO)
+            log_level = settings.LOG_LEVEL
+        else:
+            # [Comment] Explicit level names (e.g. "DEBUG") are still accepted
+            log_level = getattr(logging, level.upper(), logging.INFO)
         logger.setLevel(log_level)
-        
+
         # [Comment] Create console handler (logs to stdout)
         # [Library] logging.StreamHandler() - Handler for stream output
         # [Why] Outputs logs to console/terminal
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
-        
+
         # [Comment] Create formatter and attach to console handler
         # [Why] Ensures consistent format for console logs
         console_formatter = CustomFormatter(use_colors=True)
         console_handler.setFormatter(console_formatter)
-        
+
         # [Library] logger.addHandler() - Attach handler to logger
         # [Why] Makes logger output to console
         logger.addHandler(console_handler)
-        
+
         # [Comment] Optionally add file handler
         # [Why] Persistent logs are useful for production debugging
         if log_to_file:
@@ -157,24 +170,24 @@ def get_logger(
             log_dir = os.path.dirname(log_file_path)
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
-            
+
             # [Library] logging.FileHandler() - Handler for file output
             # [Why] Writes logs to persistent file
             file_handler = logging.FileHandler(log_file_path)
             file_handler.setLevel(log_level)
-            
+
             # [Comment] File logs don't need colors
             # [Why] Color codes would create garbage characters in text files
             file_formatter = CustomFormatter(use_colors=False)
             file_handler.setFormatter(file_formatter)
-            
+
             # [Library] logger.addHandler() - Attach file handler
             logger.addHandler(file_handler)
-        
+
         # [Comment] Prevent log propagation to root logger
         # [Why] Avoids duplicate log messages
         logger.propagate = False
-    
+
     return logger
 
 
@@ -186,12 +199,12 @@ def log_exception(logger: logging.Logger, exception: Exception, context: str = "
     [Purpose] Logs exception with full traceback
     [Source] User defined helper function
     [Why] Standardized way to log exceptions with context
-    
+
     [Parameters]
     - logger: Logger instance to use
     - exception: Exception object to log
     - context: Additional context string (e.g., "while processing PDF")
-    
+
     [Usage]
     try:
         risky_operation()
@@ -199,11 +212,11 @@ def log_exception(logger: logging.Logger, exception: Exception, context: str = "
         log_exception(logger, e, "while processing PDF")
     """
     # [Comment] Build error message with context
-    error_msg = f"Exception occurred"
+    error_msg = "Exception occurred"
     if context:
         error_msg += f" {context}"
     error_msg += f": {str(exception)}"
-    
+
     # [Library] logger.error() with exc_info=True
     # [Why] exc_info=True includes full stack trace in log
     logger.error(error_msg, exc_info=True)
@@ -214,46 +227,60 @@ def log_exception(logger: logging.Logger, exception: Exception, context: str = "
 # [Why] Helps track function call flow in production
 def log_function_call(logger: logging.Logger):
     """
-    [Purpose] Decorator to log function entry and exit
+    [Purpose] Decorator to log function calls with their duration
     [Source] User defined decorator pattern
     [Why] Automatic logging of function calls for debugging
-    
+
+    [Note] The DEBUG check happens on every call, so raising the level at runtime
+           starts tracing already-decorated functions; with DEBUG off the entry/exit
+           lines and the clock read are skipped. Exceptions are always logged.
+
     [Usage]
     @log_function_call(logger)
     def my_function(arg1, arg2):
         # function code
         return result
     """
+
     def decorator(func):
         """
         [Purpose] Actual decorator function
         [Source] Standard Python decorator pattern
         """
+
+        # [Library] functools.wraps - Keeps __name__/__qualname__
+        #           for tracebacks and pickling
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             """
-            [Purpose] Wrapper that adds logging around function call
+            [Purpose] Wrapper that adds logging and timing around the function call
             """
-            # [Comment] Log function entry
-            logger.debug(f"Entering function: {func.__name__}")
-            
+            # [Comment] isEnabledFor is cached per logger, so the check is a dict lookup
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Entering function: %s", func.__qualname__)
+                # [Library] time.perf_counter_ns() - Integer
+                #           monotonic clock for call timing
+                start = time.perf_counter_ns()
             try:
                 # [Comment] Call the actual function
                 result = func(*args, **kwargs)
-                
-                # [Comment] Log successful exit
-                logger.debug(f"Exiting function: {func.__name__} (success)")
-                
-                return result
-            
             except Exception as e:
                 # [Comment] Log exception and re-raise
                 logger.error(
-                    f"Exception in function {func.__name__}: {str(e)}",
-                    exc_info=True
+                    "Exception in function %s: %s", func.__qualname__, e, exc_info=True
                 )
                 raise
-        
+            if debug:
+                logger.debug(
+                    "Exiting function: %s (success, %.3f ms)",
+                    func.__qualname__,
+                    (time.perf_counter_ns() - start) / 1e6,
+                )
+            return result
+
         return wrapper
+
     return decorator
 
 
@@ -261,13 +288,13 @@ def log_function_call(logger: logging.Logger):
 if __name__ == "__main__":
     # [Comment] Test logger configuration
     test_logger = get_logger(__name__, level="DEBUG")
-    
+
     test_logger.debug("This is a debug message")
     test_logger.info("This is an info message")
     test_logger.warning("This is a warning message")
     test_logger.error("This is an error message")
     test_logger.critical("This is a critical message")
-    
+
     # [Comment] Test exception logging
     try:
         # [Comment] Intentional error for testing
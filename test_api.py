@@ -5,10 +5,13 @@
 [Why] Validates that all basic endpoints work correctly
 """
 
-import requests
 import json
 import sys
 
+import requests
+from requests.adapters import HTTPAdapter
+
+
 def create_minimal_pdf() -> bytes:
     """
     [Purpose] Creates a minimal valid PDF for testing
@@ -60,17 +63,18 @@ startxref
 """
     return pdf_content
 
-def test_health_check(base_url: str):
+
+def test_health_check(session: requests.Session, base_url: str):
     """Test health check endpoint"""
-    print("\n" + "="*60)
+    print("\n" + "=" * 60)
     print("Testing Health Check Endpoint")
-    print("="*60)
-    
+    print("=" * 60)
+
     try:
-        response = requests.get(f"{base_url}/")
+        response = session.get(f"{base_url}/")
         print(f"Status Code: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
-        
+
         if response.status_code == 200:
             print("✓ Health check passed")
             return True
@@ -81,17 +85,18 @@ def test_health_check(base_url: str):
         print(f"✗ Error: {e}")
         return False
 
-def test_api_info(base_url: str):
+
+def test_api_info(session: requests.Session, base_url: str):
     """Test API info endpoint"""
-    print("\n" + "="*60)
+    print("\n" + "=" * 60)
     print("Testing API Info Endpoint")
-    print("="*60)
-    
+    print("=" * 60)
+
     try:
-        response = requests.get(f"{base_url}/info")
+        response = session.get(f"{base_url}/info")
         print(f"Status Code: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
-        
+
         if response.status_code == 200:
             print("✓ API info passed")
             return True
@@ -102,30 +107,32 @@ def test_api_info(base_url: str):
         print(f"✗ Error: {e}")
         return False
 
-def test_analyze_order(base_url: str):
+
+def test_analyze_order(session: requests.Session, base_url: str):
     """Test analyze order endpoint"""
-    print("\n" + "="*60)
+    print("\n" + "=" * 60)
     print("Testing Analyze Order Endpoint")
-    print("="*60)
-    
+    print("=" * 60)
+
     try:
         # Create sample PDF
         pdf_content = create_minimal_pdf()
-        
+
         # Upload PDF
-        files = {'file': ('test-order.pdf', pdf_content, 'application/pdf')}
-        response = requests.post(f"{base_url}/analyze-order/", files=files)
-        
+        files = {"file": ("test-order.pdf", pdf_content, "application/pdf")}
+        response = session.post(f"{base_url}/analyze-order/", files=files)
+
         print(f"Status Code: {response.status_code}")
-        
+
         if response.status_code == 200:
             data = response.json()
-            print(f"Response:")
+            print("Response:")
             print(f"  - Licensee: {data.get('licensee_name')}")
             print(f"  - Financial Year: {data.get('financial_year')}")
             print(f"  - Total ARR: ₹{data.get('total_arr_approved', 0):.2f} Lakhs")
             print(f"  - Total Trued Up: ₹{data.get('total_trued_up', 0):.2f} Lakhs")
-            print(f"  - Net Surplus/Deficit: ₹{data.get('net_surplus_deficit', 0):.2f} Lakhs")
+            net = data.get("net_surplus_deficit", 0)
+            print(f"  - Net Surplus/Deficit: ₹{net:.2f} Lakhs")
             print(f"  - Financial Items: {len(data.get('financial_summary', []))}")
             print("✓ Analyze order passed")
             return True
@@ -137,37 +144,38 @@ def test_analyze_order(base_url: str):
         print(f"✗ Error: {e}")
         return False
 
-def test_compliance_check(base_url: str):
+
+def test_compliance_check(session: requests.Session, base_url: str):
     """Test compliance check endpoint"""
-    print("\n" + "="*60)
+    print("\n" + "=" * 60)
     print("Testing Compliance Check Endpoint")
-    print("="*60)
-    
+    print("=" * 60)
+
     try:
         # Create sample PDF
         pdf_content = create_minimal_pdf()
-        
+
         # Upload PDF
-        files = {'file': ('test-order.pdf', pdf_content, 'application/pdf')}
-        response = requests.post(f"{base_url}/compliance-check/", files=files)
-        
+        files = {"file": ("test-order.pdf", pdf_content, "application/pdf")}
+        response = session.post(f"{base_url}/compliance-check/", files=files)
+
         print(f"Status Code: {response.status_code}")
-        
+
         if response.status_code == 200:
             data = response.json()
-            print(f"Response includes:")
-            print(f"  - Basic Analysis: ✓")
-            print(f"  - Compliance Report: ✓")
-            print(f"  - Executive Summary: ✓")
-            
-            if 'compliance_report' in data:
-                report = data['compliance_report']
+            print("Response includes:")
+            print("  - Basic Analysis: ✓")
+            print("  - Compliance Report: ✓")
+            print("  - Executive Summary: ✓")
+
+            if "compliance_report" in data:
+                report = data["compliance_report"]
                 print(f"\nCompliance Status: {report.get('overall_status')}")
                 print(f"Checks Performed: {len(report.get('checks_performed', []))}")
                 print(f"Passed: {report.get('passed_checks', 0)}")
                 print(f"Failed: {report.get('failed_checks', 0)}")
                 print(f"Warnings: {len(report.get('warnings', []))}")
-            
+
             print("✓ Compliance check passed")
             return True
         else:
@@ -178,40 +186,47 @@ def test_compliance_check(base_url: str):
         print(f"✗ Error: {e}")
         return False
 
+
 def main():
     """Main test runner"""
     # Default to localhost
     base_url = "http://localhost:8000"
-    
+
     if len(sys.argv) > 1:
         base_url = sys.argv[1]
-    
-    print("="*60)
+
+    print("=" * 60)
     print("KSERC ARA Backend API Tests")
-    print("="*60)
+    print("=" * 60)
     print(f"Base URL: {base_url}")
-    
+
+    # One keep-alive session for every call instead of a new connection per request
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
     # Run tests
     results = []
-    results.append(("Health Check", test_health_check(base_url)))
-    results.append(("API Info", test_api_info(base_url)))
-    results.append(("Analyze Order", test_analyze_order(base_url)))
-    results.append(("Compliance Check", test_compliance_check(base_url)))
-    
+    results.append(("Health Check", test_health_check(session, base_url)))
+    results.append(("API Info", test_api_info(session, base_url)))
+    results.append(("Analyze Order", test_analyze_order(session, base_url)))
+    results.append(("Compliance Check", test_compliance_check(session, base_url)))
+    session.close()
+
     # Summary
-    print("\n" + "="*60)
+    print("\n" + "=" * 60)
     print("Test Summary")
-    print("="*60)
-    
+    print("=" * 60)
+
     passed = sum(1 for _, result in results if result)
     total = len(results)
-    
+
     for test_name, result in results:
         status = "✓ PASS" if result else "✗ FAIL"
         print(f"{test_name:.<50}{status}")
-    
+
     print(f"\nTotal: {passed}/{total} tests passed")
-    
+
     if passed == total:
         print("\n🎉 All tests passed!")
         sys.exit(0)
@@ -219,5 +234,6 @@ def main():
         print(f"\n⚠ {total - passed} test(s) failed")
         sys.exit(1)
 
+
 if __name__ == "__main__":
     main()
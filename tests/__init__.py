@@ -0,0 +1,2 @@
+# [Purpose] Unit tests for the KSERC ARA Backend
+# [Why] Marks tests/ as a package so src.* imports resolve from the repository root
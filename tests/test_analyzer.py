@@ -0,0 +1,66 @@
+# [Purpose] Unit tests for src/services/analyzer.py
+
+import pytest
+
+from src.models.schemas import FinancialRow, TruingUpResponse
+from src.services import analyzer
+
+
+def _response(trued_up: float = 130.0) -> TruingUpResponse:
+    rows = [
+        FinancialRow(
+            particulars="O&M Expenses", arr_approved=100.0, trued_up_value=trued_up
+        ),
+        FinancialRow(
+            particulars="Depreciation", arr_approved=50.0, trued_up_value=50.0
+        ),
+    ]
+    return TruingUpResponse(
+        licensee_name="Infopark",
+        financial_year="2023-24",
+        financial_summary=rows,
+        net_surplus_deficit=150.0 - (trued_up + 50.0),
+        total_arr_approved=150.0,
+        total_trued_up=trued_up + 50.0,
+    )
+
+
+def test_compliance_cache_shared_across_separate_parses():
+    analyzer.COMPLIANCE_CACHE.clear()
+    first = analyzer.perform_compliance_checks(_response())
+    # [Comment] A second parse of the same order differs only in analysis_timestamp
+    second = analyzer.perform_compliance_checks(_response())
+    assert second is first
+    assert first.overall_status == "COMPLIANT"
+    assert first.checks_performed[1].status == "WARNING"
+
+
+def test_compliance_cache_misses_on_changed_values():
+    analyzer.COMPLIANCE_CACHE.clear()
+    first = analyzer.perform_compliance_checks(_response(130.0))
+    second = analyzer.perform_compliance_checks(_response(100.0))
+    assert second is not first
+    assert second.checks_performed[1].status == "PASS"
+
+
+def test_response_to_dataframe_matches_row_dict_output():
+    pd = pytest.importorskip("pandas")
+    response = _response()
+    df = analyzer.response_to_dataframe(response)
+
+    expected = pd.DataFrame(
+        [
+            {
+                "Particulars": row.particulars,
+                "ARR Approved (Lakhs)": row.arr_approved,
+                "Trued Up Value (Lakhs)": row.trued_up_value,
+                "Deviation (Lakhs)": row.deviation,
+                "Percentage Deviation": analyzer.calculate_percentage_deviation(
+                    row.arr_approved, row.trued_up_value
+                ),
+            }
+            for row in response.financial_summary
+        ]
+    )
+    assert df["Particulars"].dtype == object
+    pd.testing.assert_frame_equal(df, expected)
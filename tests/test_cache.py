@@ -0,0 +1,41 @@
+# [Purpose] Unit tests for src/utils/cache.py
+
+from src.utils import cache
+from src.utils.cache import LRUCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    lru = LRUCache(maxsize=4, ttl=30)
+    lru.set("a", 1)
+
+    now[0] += 29.9
+    assert lru.get("a") == 1
+    now[0] += 0.2
+    assert lru.get("a") is None
+    assert "a" not in lru
+    assert len(lru) == 0
+
+
+def test_no_ttl_never_expires(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    lru = LRUCache(maxsize=2)
+    lru.set("a", None)
+    now[0] += 1e9
+    # [Comment] None is a valid cached value, distinct from a miss
+    assert "a" in lru
+    assert lru.get("a", "missing") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+
+    assert "b" not in lru
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert lru.hits >= 3 and lru.misses >= 1
@@ -0,0 +1,82 @@
+# [Purpose] Unit tests for the built-in .env parser in src/config.py
+
+import logging
+
+import pytest
+
+import src.config as config
+from src.config import _parse_dotenv
+
+
+def test_plain_and_exported_values():
+    values = _parse_dotenv(b"# comment\n\nA=1\nexport B = two words\nEMPTY=\n")
+    assert values == {"A": "1", "B": "two words", "EMPTY": ""}
+
+
+def test_inline_comments():
+    values = _parse_dotenv(
+        b'A=52428800  # 50 MB\nB="quoted" # note\nC=a#b\nD="x # y"\n'
+    )
+    assert values == {"A": "52428800", "B": "quoted", "C": "a#b", "D": "x # y"}
+
+
+def test_quoting_and_escapes():
+    values = _parse_dotenv(b'S=\'lit \\n ${X}\'\nD="tab\\there \\"q\\" \\\\"\n')
+    assert values["S"] == "lit \\n ${X}"
+    assert values["D"] == 'tab\there "q" \\'
+
+
+def test_crlf_line_endings():
+    assert _parse_dotenv(b"A=1\r\nB='two'\r\n") == {"A": "1", "B": "two"}
+
+
+def test_unsupported_lines_are_skipped_with_warning(caplog):
+    data = b'GOOD=1\nnot a setting\nMULTI="first\nsecond"\nJUNK="x" y\nREF=${HOME}/x\n'
+    with caplog.at_level(logging.WARNING, logger="src.config"):
+        values = _parse_dotenv(data, "test.env")
+    assert values == {"GOOD": "1", "REF": "${HOME}/x"}
+    messages = [r.getMessage() for r in caplog.records]
+    assert any(m.startswith("test.env:2: ignoring line") for m in messages)
+    assert any(m.startswith("test.env:3: ignoring MULTI") for m in messages)
+    assert any(m.startswith("test.env:5: ignoring JUNK") for m in messages)
+    assert any("REF contains ${...}" in m for m in messages)
+
+
+def test_settings_cannot_be_constructed_directly():
+    with pytest.raises(RuntimeError):
+        config.Settings()
+    assert config.get_settings() is config.get_settings()
+
+
+def test_cache_clear_rereads_environment(monkeypatch):
+    monkeypatch.setenv("PORT", "9123")
+    config.get_settings.cache_clear()
+    try:
+        assert config.get_settings().PORT == 9123
+    finally:
+        config.get_settings.cache_clear()
+
+
+def test_module_constants_mirror_settings():
+    assert config.PORT == config.settings.PORT
+    assert config.DEBUG_MODE == config.settings.DEBUG_MODE
+    assert config.LLM_TIMEOUT_SECONDS == config.settings.LLM_TIMEOUT_SECONDS
+
+
+@pytest.mark.parametrize("environb", [True, False])
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("tRuE", True),
+        ("On ", True),
+        (" YES", True),
+        ("1", True),
+        ("off", False),
+        ("", False),
+    ],
+)
+def test_env_bool_ignores_case_and_whitespace(monkeypatch, environb, raw, expected):
+    if not environb:
+        monkeypatch.setattr(config, "_envb", None)
+    monkeypatch.setenv("KSERC_TEST_FLAG", raw)
+    assert config._env_bool("KSERC_TEST_FLAG", not expected) is expected
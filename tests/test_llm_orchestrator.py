@@ -0,0 +1,34 @@
+# [Purpose] Unit tests for src/services/llm_orchestrator.py
+
+import asyncio
+
+from src.services import llm_orchestrator as orchestrator
+
+
+def test_pipeline_runs_share_one_pooled_client(monkeypatch):
+    clients = []
+
+    async def fake_chat(
+        client, messages, temperature=0.2, max_tokens=500, bypass_cache=False
+    ):
+        clients.append(client)
+        return (
+            '{"approved_items": [], "disallowed_items": [], "conditions": [], '
+            '"final_summary": "ok"}'
+        )
+
+    monkeypatch.setattr(orchestrator, "hf_chat_async", fake_chat)
+
+    async def run_twice():
+        for _ in range(2):
+            result = await orchestrator.run_four_agent_pipeline({}, {}, {}, [])
+            assert "fallback" not in result
+        shared = orchestrator._ASYNC_CLIENT
+        await orchestrator.aclose_client()
+        return shared
+
+    shared = asyncio.run(run_twice())
+    assert len(clients) == 8
+    assert all(client is shared for client in clients)
+    assert shared.is_closed
+    assert orchestrator._ASYNC_CLIENT is None
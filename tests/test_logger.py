@@ -0,0 +1,44 @@
+# [Purpose] Tests for src/utils/logger.py
+
+import logging
+
+import pytest
+
+from src.utils.logger import log_function_call
+
+
+def _decorated(name):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+
+    @log_function_call(logger)
+    def divide(a, b):
+        return a / b
+
+    return logger, divide
+
+
+def test_exceptions_logged_when_debug_off(caplog):
+    logger, divide = _decorated("tests.logger.errors")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with pytest.raises(ZeroDivisionError):
+            divide(1, 0)
+    assert [r.levelno for r in caplog.records] == [logging.ERROR]
+    assert "divide" in caplog.records[0].getMessage()
+
+
+def test_debug_level_checked_at_call_time(caplog):
+    logger, divide = _decorated("tests.logger.runtime")
+    assert divide.__name__ == "divide"
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        assert divide(4, 2) == 2
+    assert caplog.records == []
+
+    # [Comment] Raising the level after decoration starts tracing without re-import
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        divide(4, 2)
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[0] == "Entering function: _decorated.<locals>.divide"
+    assert messages[1].startswith(
+        "Exiting function: _decorated.<locals>.divide (success,"
+    )
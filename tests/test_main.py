@@ -0,0 +1,49 @@
+# [Purpose] Route-level tests for src/main.py
+
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from src.main import MAX_UPLOAD_SIZE, _validate_pdf_upload, app
+from src.models.schemas import HealthCheckResponse
+
+
+def test_health_matches_response_model():
+    with TestClient(app) as client:
+        first = client.get("/")
+        second = client.get("/")
+    assert first.status_code == 200
+    body = HealthCheckResponse.model_validate(first.json())
+    assert body.status == "active"
+    assert set(first.json()) == set(HealthCheckResponse.model_fields)
+    assert second.json()["timestamp"] >= first.json()["timestamp"]
+
+
+def _upload(filename, content_type=None, size=10):
+    headers = (
+        Headers({"content-type": content_type})
+        if content_type is not None
+        else Headers()
+    )
+    return UploadFile(
+        file=io.BytesIO(b"%PDF-1.4"), filename=filename, size=size, headers=headers
+    )
+
+
+@pytest.mark.parametrize(
+    "content_type", ["application/pdf", "binary/octet-stream", "", None]
+)
+def test_pdf_upload_accepted_regardless_of_content_type(content_type):
+    _validate_pdf_upload(_upload("Order.PDF", content_type))
+
+
+def test_pdf_upload_rejects_extension_and_declared_size():
+    with pytest.raises(HTTPException) as excinfo:
+        _validate_pdf_upload(_upload("order.docx", "application/pdf"))
+    assert excinfo.value.status_code == 400
+    with pytest.raises(HTTPException) as excinfo:
+        _validate_pdf_upload(_upload("order.pdf", size=MAX_UPLOAD_SIZE + 1))
+    assert excinfo.value.status_code == 413
@@ -0,0 +1,41 @@
+# [Purpose] Unit tests for src/services/pdf_ingestion.py
+
+from src.services.pdf_ingestion import (
+    _parse_financial_rows_with_totals,
+    parse_financial_rows,
+)
+
+TABLE = [
+    ["Particulars", "ARR Approved", "Actuals"],
+    ["O&M Expenses", "1,200.50", "Rs. 1,350.25"],
+    [None, "", None],
+    ["Depreciation", "300", ""],
+    ["Short row", "10"],
+    ["", "45.5 Lakhs", "40"],
+]
+
+
+def test_column_wise_parse_matches_cells_and_totals():
+    rows, total_arr, total_actual = _parse_financial_rows_with_totals(TABLE)
+
+    assert [row.particulars for row in rows] == [
+        "O&M Expenses",
+        "Depreciation",
+        "Unnamed Item",
+    ]
+    assert [row.arr_approved for row in rows] == [1200.50, 300.0, 45.5]
+    assert [row.trued_up_value for row in rows] == [1350.25, 0.0, 40.0]
+    assert [row.deviation for row in rows] == [1350.25 - 1200.50, -300.0, 40.0 - 45.5]
+    assert total_arr == sum(row.arr_approved for row in rows)
+    assert total_actual == sum(row.trued_up_value for row in rows)
+    assert parse_financial_rows(TABLE) == rows
+
+
+def test_tables_without_data_rows():
+    assert _parse_financial_rows_with_totals([]) == ([], 0.0, 0.0)
+    assert _parse_financial_rows_with_totals([TABLE[0]]) == ([], 0.0, 0.0)
+    assert _parse_financial_rows_with_totals([TABLE[0], [None, None, None]]) == (
+        [],
+        0.0,
+        0.0,
+    )
@@ -0,0 +1,169 @@
+# [Purpose] Unit tests for src/services/rag.py
+
+import heapq
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from src.services import rag
+from src.services.rag import (
+    RagIndex,
+    chunk_text,
+    index_fingerprint,
+    tokenize,
+    update_index,
+)
+
+
+def _corpus(n_chunks: int, seed: int = 7):
+    # [Comment] Zipf-like vocabulary so queries mix very common and rare terms
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(400)]
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    return (
+        [
+            {
+                "id": f"c{i}",
+                "source": f"doc{i % 5}.pdf",
+                "page": i // 5 + 1,
+                "text": " ".join(rng.choices(words, weights, k=rng.randint(1, 80))),
+            }
+            for i in range(n_chunks)
+        ],
+        words,
+        rng,
+    )
+
+
+def _exhaustive_top_k(chunks, query, top_k):
+    # [Comment] Textbook Okapi BM25 over every chunk, no index or pruning
+    docs = [Counter(tokenize(chunk["text"])) for chunk in chunks]
+    lengths = [sum(doc.values()) for doc in docs]
+    avg_len = sum(lengths) / len(lengths)
+    n_docs = len(docs)
+    scores = {}
+    for idx, (doc, length) in enumerate(zip(docs, lengths)):
+        score = 0.0
+        for term in tokenize(query):
+            tf = doc.get(term, 0)
+            if not tf:
+                continue
+            df = sum(1 for other in docs if term in other)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            norm = rag.BM25_K1 * (1 - rag.BM25_B + rag.BM25_B * length / avg_len)
+            score += idf * tf * (rag.BM25_K1 + 1) / (tf + norm)
+        if score:
+            scores[idx] = score
+    return heapq.nlargest(top_k, scores.items(), key=lambda x: (x[1], -x[0]))
+
+
+def test_pruned_search_matches_exhaustive_scoring():
+    chunks, words, rng = _corpus(600)
+    index = RagIndex(chunks)
+    for _ in range(60):
+        query = " ".join(rng.choices(words[:120], k=rng.randint(1, 6)))
+        top_k = rng.choice([1, 3, 6, 10])
+        expected = _exhaustive_top_k(chunks, query, top_k)
+        results = index.search(query, top_k=top_k)
+        assert [r["id"] for r in results] == [
+            chunks[idx]["id"] for idx, _ in expected
+        ], query
+        assert [r["score"] for r in results] == pytest.approx(
+            [score for _, score in expected], abs=1e-4
+        )
+
+
+def test_search_without_known_terms_is_empty():
+    chunks, _, _ = _corpus(20)
+    index = RagIndex(chunks)
+    assert index.search("unknownterm") == []
+    assert index.search("w0", top_k=0) == []
+
+
+def test_extended_matches_full_build_and_leaves_original_untouched():
+    chunks, _, _ = _corpus(300)
+    base = RagIndex(chunks[:200])
+    base_results = base.search("w1 w5 w30")
+    extended = base.extended(chunks[200:])
+    full = RagIndex(list(chunks))
+
+    for attr in (
+        "vocab",
+        "postings_docs",
+        "postings_tf",
+        "idf",
+        "doc_norms",
+        "max_contrib",
+        "fingerprint",
+    ):
+        assert getattr(extended, attr) == getattr(full, attr), attr
+    assert extended.search("w1 w5 w30") == full.search("w1 w5 w30")
+    assert len(base.chunks) == 200
+    assert base.search("w1 w5 w30") == base_results
+
+
+def test_update_index_reuses_or_rebuilds():
+    chunks, _, _ = _corpus(120)
+    current = RagIndex(chunks[:100])
+
+    assert update_index(current, chunks[:100]) is None
+    appended = update_index(current, chunks)
+    assert appended is not current
+    assert appended.fingerprint == index_fingerprint(chunks)
+    rebuilt = update_index(current, chunks[1:])
+    assert rebuilt.fingerprint == index_fingerprint(chunks[1:])
+    assert update_index(None, chunks).fingerprint == index_fingerprint(chunks)
+
+
+def test_fingerprint_covers_source_and_page():
+    chunks, _, _ = _corpus(3)
+    moved = [dict(chunk) for chunk in chunks]
+    moved[1]["page"] += 1
+    assert index_fingerprint(moved) != index_fingerprint(chunks)
+    # [Comment] A chunk that only moved pages must not be treated as already indexed
+    assert update_index(RagIndex(chunks), moved) is not None
+
+
+def test_snapshot_round_trip(tmp_path):
+    chunks, _, _ = _corpus(50)
+    index = RagIndex(chunks)
+    path = tmp_path / "rag_index.pkl"
+    index.save(path, source_stamp=(123, 456))
+
+    loaded = RagIndex.load(path, source_stamp=(123, 456))
+    assert loaded.fingerprint == index.fingerprint
+    assert loaded.search("w2 w9") == index.search("w2 w9")
+    assert loaded.sorted_sources == index.sorted_sources
+
+    with pytest.raises(ValueError, match="stale"):
+        RagIndex.load(path, source_stamp=(124, 456))
+
+
+def test_snapshot_rejects_other_format_version(tmp_path, monkeypatch):
+    path = tmp_path / "rag_index.pkl"
+    RagIndex(_corpus(5)[0]).save(path)
+    monkeypatch.setattr(rag, "_INDEX_FORMAT_VERSION", rag._INDEX_FORMAT_VERSION + 1)
+    with pytest.raises(ValueError, match="unsupported RAG index format"):
+        RagIndex.load(path)
+
+
+@pytest.mark.parametrize(
+    "chunk_size, overlap", [(100, 20), (50, 50), (40, 90), (1200, 150)]
+)
+def test_chunk_text_terminates_and_covers_text(chunk_size, overlap):
+    # [Comment] overlap >= chunk_size used to loop forever
+    text = "".join(chr(ord("a") + i % 26) for i in range(1000))
+    chunks = chunk_text(text, chunk_size=chunk_size, overlap=overlap)
+    step = max(chunk_size - overlap, 1)
+    assert chunks[0] == text[:chunk_size]
+    assert chunks[-1].endswith(text[-1])
+    assert len(chunks) == max(math.ceil((len(text) - chunk_size) / step), 0) + 1
+
+
+def test_chunk_text_overlaps_consecutive_windows():
+    text = "x" * 30 + "y" * 30 + "z" * 30
+    chunks = chunk_text(text, chunk_size=40, overlap=10)
+    assert chunks == [text[0:40], text[30:70], text[60:90]]
+    assert chunk_text("   ") == []
@@ -0,0 +1,41 @@
+# [Purpose] Unit tests for src/models/schemas.py
+
+from src.models.schemas import FinancialRow, TruingUpResponse
+
+
+def _response(rows):
+    return TruingUpResponse(
+        licensee_name="Infopark",
+        financial_year="2023-24",
+        financial_summary=rows,
+        net_surplus_deficit=0.0,
+    )
+
+
+def test_financial_columns_are_cached_per_instance():
+    response = _response(
+        [FinancialRow(particulars="A", arr_approved=1.0, trued_up_value=2.0)]
+    )
+    columns = response.financial_columns
+    assert response.financial_columns is columns
+    assert columns.particulars == ("A",)
+    assert columns.deviation == (1.0,)
+    assert "financial_columns" not in response.model_dump()
+
+
+def test_model_copy_does_not_carry_stale_columns():
+    response = _response(
+        [FinancialRow(particulars="A", arr_approved=1.0, trued_up_value=2.0)]
+    )
+    original = response.financial_columns
+    updated = response.model_copy(
+        update={
+            "financial_summary": [
+                FinancialRow(particulars="B", arr_approved=3.0, trued_up_value=3.0)
+            ]
+        }
+    )
+    assert updated.financial_columns is not original
+    assert updated.financial_columns.particulars == ("B",)
+    assert response.financial_columns is original
+    assert updated == updated.model_copy()
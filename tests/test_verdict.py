@@ -0,0 +1,18 @@
+# [Purpose] Tests for src/services/verdict.py
+
+from src.services.verdict import render_verdict_pdf
+
+
+def test_render_handles_multi_item_sections():
+    payload = {
+        "summary": "Partially approved.",
+        "approved_items": ["O&M expenses", "Depreciation"],
+        "disallowed_items": ["Interest on working capital", "Return on equity"],
+        "conditions": ["File revised accounts", "Reconcile meter data"],
+    }
+    pdf_bytes = render_verdict_pdf(payload)
+    assert pdf_bytes.startswith(b"%PDF")
+
+
+def test_render_handles_empty_sections():
+    assert render_verdict_pdf({}).startswith(b"%PDF")